@@ -1,6 +1,12 @@
 from django.contrib import admin
 
-from articles.models import Article
+from articles.models import Article, ArticleBody
+from core.pagination import EstimatedCountPaginator
+
+
+class ArticleBodyInline(admin.StackedInline):
+    model = ArticleBody
+    can_delete = False
 
 
 class ArticleAdmin(admin.ModelAdmin):
@@ -10,11 +16,16 @@ class ArticleAdmin(admin.ModelAdmin):
         "author",
         "is_hidden",
     )
+    list_select_related = ("author",)
     list_filter = ("created_at", "updated_at")
-    search_fields = ("title", "author")
+    search_fields = ("title", "author__username")
     ordering = ("-created_at",)
-    date_hierarchy = "created_at"
     readonly_fields = ("created_at", "updated_at")
+    inlines = (ArticleBodyInline,)
+    autocomplete_fields = ("author",)
+    raw_id_fields = ("likes", "dislikes")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 admin.site.register(Article, ArticleAdmin)
@@ -0,0 +1,29 @@
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from rest_framework.response import Response
+
+from articles.viewcounts import record_view
+from articles.views import ArticleDetailView, ArticleListView
+from core.asyncviews import AsyncAPIView
+
+
+class AsyncArticleListView(AsyncAPIView):
+    read_from_replica = True
+    view_class = ArticleListView
+
+    async def get(self, view: Any, *args: Any, **kwargs: Any) -> Response:
+        page = await sync_to_async(view.paginate_queryset)(view.get_rows())
+        data = await sync_to_async(view.represent)(page)
+        return view.get_paginated_response(data)  # type: ignore[no-any-return]
+
+
+class AsyncArticleDetailView(AsyncAPIView):
+    read_from_replica = True
+    view_class = ArticleDetailView
+
+    async def get(self, view: Any, *args: Any, **kwargs: Any) -> Response:
+        row = await sync_to_async(view.get_row)()
+        (article,) = await sync_to_async(view.represent)([row])
+        await sync_to_async(record_view)(view.request, kwargs["slug"])
+        return Response(article)
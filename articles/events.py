@@ -0,0 +1,143 @@
+"""
+Article events for the Server-Sent Events stream of ``core.events``.
+
+``article`` is published when an article is created and ``counts`` when
+its likes or dislikes change, both once the transaction commits. Count
+changes are debounced: the articles touched within EVENTS_COUNTS_DEBOUNCE
+seconds of the first change are read and published together, so a burst
+of reactions on a popular article sends one event per interval instead of
+one per reaction.
+"""
+from functools import partial
+from threading import Lock, Timer
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from articles.models import Article
+from core.events import broker
+
+
+def reaction_counts(through: Any, ids: Iterable[int]) -> Dict[int, int]:
+    # deleted users' reactions aren't counted until they are purged
+    return dict(
+        through.objects.filter(
+            article_id__in=ids, user__deleted_at__isnull=True
+        )
+        .order_by()
+        .values_list("article_id")
+        .annotate(Count("user_id"))
+    )
+
+
+class CountUpdates:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.pending: Set[int] = set()
+        self.timer: Optional[Timer] = None
+        self.lock = Lock()
+
+    def touch(self, ids: Iterable[int]) -> None:
+        """
+        Schedules the counts of the articles for the next publish
+        """
+        with self.lock:
+            self.pending.update(ids)
+            if self.timer is None:
+                self.timer = Timer(self.interval, self.run)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def run(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # the timer thread's connections would never be reused
+            connections.close_all()
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Publishes the counts of the pending articles and returns them
+        """
+        with self.lock:
+            ids, self.pending = self.pending, set()
+            self.timer = None
+        # hidden articles are only known to their author and the admins
+        articles = list(
+            Article.objects.filter(pk__in=ids, is_hidden=False).values_list(
+                "pk", "lookup_id", "slug"
+            )
+        )
+        if not articles:
+            return []
+        ids = {pk for pk, _, _ in articles}
+        likes = reaction_counts(Article.likes.through, ids)
+        dislikes = reaction_counts(Article.dislikes.through, ids)
+        updates = [
+            {
+                "lookup_id": lookup_id,
+                "slug": slug,
+                "likes_count": likes.get(pk, 0),
+                "dislikes_count": dislikes.get(pk, 0),
+            }
+            for pk, lookup_id, slug in articles
+        ]
+        for update in updates:
+            broker.publish("counts", update)
+        return updates
+
+
+count_updates = CountUpdates(settings.EVENTS_COUNTS_DEBOUNCE)
+
+
+def article_created(article: Any) -> Dict[str, Any]:
+    author = article.author
+    return {
+        "lookup_id": article.lookup_id,
+        "slug": article.slug,
+        "title": article.title,
+        "description": article.description,
+        "created_at": article.created_at,
+        "author": None if author is None else author.username,
+    }
+
+
+@receiver(post_save, sender=Article)
+def publish_created(
+    sender: Any, instance: Any, created: bool, **kwargs: Any
+) -> None:
+    if created and not instance.is_hidden:
+        transaction.on_commit(
+            partial(broker.publish, "article", article_created(instance))
+        )
+
+
+@receiver(m2m_changed, sender=Article.likes.through)
+@receiver(m2m_changed, sender=Article.dislikes.through)
+def publish_counts(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Any,
+    **kwargs: Any,
+) -> None:
+    if not reverse and action in ("post_add", "post_remove", "post_clear"):
+        ids = {instance.pk}
+    elif reverse and action in ("post_add", "post_remove"):
+        ids = set(pk_set)
+    elif reverse and action == "pre_clear":
+        # the user's reactions are gone once they are cleared
+        ids = set(
+            sender.objects.filter(user_id=instance.pk).values_list(
+                "article_id", flat=True
+            )
+        )
+    else:
+        return
+    if ids:
+        transaction.on_commit(partial(count_updates.touch, ids))
@@ -0,0 +1,207 @@
+"""
+Read-only fast path of ArticleSerializer for the article GET endpoints.
+
+Articles are read as values() rows and their tags, likes and dislikes with
+one values query each, shaped like the prefetches of
+``Article.objects.for_display()``. Each field is rendered by the
+``to_representation`` of the matching ArticleSerializer or UserSerializer
+field, looked up once per response, which skips the per-object attribute
+lookups, nested serializer instances and method fields of the generic
+machinery while producing the same output.
+"""
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from django.contrib.auth import get_user_model
+
+from articles.models import Article
+from articles.serializers import ArticleSerializer
+from core.fields import decompress
+from users.serializers import UserSerializer
+
+User = get_user_model()
+
+# ArticleSerializer fields read straight from an article row, and the
+# columns holding them
+ARTICLE_COLUMNS = {
+    "lookup_id": "lookup_id",
+    "slug": "slug",
+    "title": "title",
+    "description": "description",
+    "image": "image",
+    "body": "article_body__text",
+    "is_hidden": "is_hidden",
+    "reading_time": "reading_time",
+    "views_count": "views_count",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+# columns read as stored, with what turns them into the field's value
+DECODERS = {"body": decompress}
+USER_COLUMNS = ("pk", "lookup_id", "username", "email", "is_editor")
+
+Accessor = Tuple[str, str, Callable[[Any], Any]]
+
+
+def article_rows(queryset: Any) -> Any:
+    """
+    ``queryset`` as the values() rows ArticleRowSerializer renders
+    """
+    return queryset.prefetch_related(None).values(
+        "pk",
+        *ARTICLE_COLUMNS.values(),
+        *(f"author__{column}" for column in USER_COLUMNS),
+        "author__deleted_at",
+    )
+
+
+def accessors(serializer: Any, columns: Dict[str, str]) -> List[Accessor]:
+    """
+    ``(field name, column, to_representation)`` of the readable fields of
+    ``serializer`` that map to ``columns``, in the serializer's field order
+    """
+    return [
+        (field.field_name, columns[field.field_name], field.to_representation)
+        for field in serializer._readable_fields
+        if field.field_name in columns
+    ]
+
+
+def decoding(
+    decode: Callable[[Any], Any], to_representation: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    return lambda value: to_representation(decode(value))
+
+
+def decoded(fields: List[Accessor]) -> List[Accessor]:
+    """
+    ``fields`` with the columns in DECODERS decoded before rendering
+    """
+    return [
+        (name, column, decoding(DECODERS[name], to_representation))
+        if name in DECODERS
+        else (name, column, to_representation)
+        for name, column, to_representation in fields
+    ]
+
+
+def render(row: Dict[str, Any], fields: List[Accessor]) -> Dict[str, Any]:
+    # serializers render None as is, without calling the field
+    return {
+        name: None if row[column] is None else to_representation(row[column])
+        for name, column, to_representation in fields
+    }
+
+
+class ArticleRowSerializer:
+    """
+    Renders values() rows of articles exactly like ArticleSerializer renders
+    the same articles loaded with ``Article.objects.for_display()``
+    """
+
+    def __init__(self, context: Dict[str, Any]) -> None:
+        self.context = context
+        self.request = context.get("request")
+        serializer = ArticleSerializer(context=context)
+        self.field_order = [
+            field.field_name for field in serializer._readable_fields
+        ]
+        self.article_fields = decoded(accessors(serializer, ARTICLE_COLUMNS))
+        self.user_fields = accessors(
+            UserSerializer(context=context),
+            {column: column for column in USER_COLUMNS},
+        )
+        self.author_fields = [
+            (name, f"author__{column}", to_representation)
+            for name, column, to_representation in self.user_fields
+        ]
+
+    @property
+    def viewer(self) -> Optional[Any]:
+        user = getattr(self.request, "user", None)
+        return user if user is not None and user.is_authenticated else None
+
+    def following(self) -> Set[int]:
+        # shared with UserSerializer, which caches it in the same place
+        following = self.context.get("following_ids")
+        if following is None:
+            following = self.context["following_ids"] = set(
+                self.viewer.following.values_list(  # type: ignore[union-attr]
+                    "followed_id", flat=True
+                )
+            )
+        return following  # type: ignore[no-any-return]
+
+    def user(
+        self, row: Dict[str, Any], fields: List[Accessor], pk: str
+    ) -> Optional[Dict[str, Any]]:
+        # deleted authors are rendered like the null author the purge leaves
+        if row[pk] is None or row.get("author__deleted_at"):
+            return None
+        representation = render(row, fields)
+        if self.viewer is not None:
+            representation["following"] = row[pk] in self.following()
+        return representation
+
+    def reactions(self, relation: str, ids: List[int]) -> Dict[int, list]:
+        """
+        Users who liked or disliked each article, queried like the
+        ``likes`` and ``dislikes`` prefetches
+        """
+        users: Dict[int, list] = {pk: [] for pk in ids}
+        rows = User.objects.filter(**{f"{relation}__in": ids}).values(
+            relation, *USER_COLUMNS
+        )
+        for row in rows:
+            users[row[relation]].append(row)
+        return users
+
+    def tags(self, ids: List[int]) -> Dict[int, List[str]]:
+        """
+        Tag names of each article, queried like the ``tags`` prefetch
+        """
+        through = Article.tags.through
+        relation = through.tag_relname()
+        names: Dict[int, List[str]] = {pk: [] for pk in ids}
+        rows = through.tags_for(
+            Article, None, **{f"{relation}__object_id__in": ids}
+        ).values_list(f"{relation}__object_id", "name")
+        for pk, name in rows:
+            names[pk].append(name)
+        return names
+
+    def to_representation(self, rows: List[Dict[str, Any]]) -> List[Dict]:
+        ids = [row["pk"] for row in rows]
+        tags = self.tags(ids)
+        likes = self.reactions("likes", ids)
+        dislikes = self.reactions("dislikes", ids)
+        viewer = self.viewer
+
+        articles = []
+        for row in rows:
+            pk = row["pk"]
+            liked = [
+                self.user(user, self.user_fields, "pk") for user in likes[pk]
+            ]
+            disliked = [
+                self.user(user, self.user_fields, "pk")
+                for user in dislikes[pk]
+            ]
+            values = {
+                **render(row, self.article_fields),
+                "tags": tags[pk],
+                "likes_count": len(liked),
+                "dislikes_count": len(disliked),
+                "likes": liked,
+                "dislikes": disliked,
+                "author": self.user(row, self.author_fields, "author__pk"),
+            }
+            article = {name: values[name] for name in self.field_order}
+            if viewer is not None:
+                favorited = any(user["pk"] == viewer.pk for user in likes[pk])
+                unfavorited = not favorited and any(
+                    user["pk"] == viewer.pk for user in dislikes[pk]
+                )
+                article["favorited"] = favorited
+                article["unfavorited"] = unfavorited
+            articles.append(article)
+        return articles
@@ -0,0 +1,18 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_article_reading_time"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="views_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
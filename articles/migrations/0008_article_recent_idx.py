@@ -0,0 +1,38 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0007_article_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="article",
+            options={"ordering": ["-created_at", "-id"]},
+        ),
+        migrations.AlterField(
+            model_name="article",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["-created_at", "-id"],
+                name="article_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="article_deleted_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0008_article_recent_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleBody",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="article_body",
+                        serialize=False,
+                        to="articles.article",
+                    ),
+                ),
+                ("text", models.TextField()),
+            ],
+        ),
+        migrations.RunSQL(
+            "INSERT INTO articles_articlebody (article_id, text) "
+            "SELECT id, body FROM articles_article",
+            "UPDATE articles_article SET body = COALESCE(("
+            "SELECT text FROM articles_articlebody "
+            "WHERE articles_articlebody.article_id = articles_article.id"
+            "), '')",
+        ),
+        # lets the column be added back to existing rows when reverting
+        migrations.AlterField(
+            model_name="article",
+            name="body",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(
+            model_name="article",
+            name="body",
+        ),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:31
+
+from typing import Any
+
+import django.contrib.postgres.search
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+import core.fields
+
+BATCH_SIZE = 1000
+SEARCH_CONFIG = "english"
+SEARCH_INDEX = GinIndex(
+    fields=["search_vector"], name="articlebody_search_idx"
+)
+
+
+def batches(ArticleBody: Any) -> Any:
+    last = 0
+    while True:
+        batch = list(
+            ArticleBody.objects.filter(pk__gt=last).order_by("pk")[:BATCH_SIZE]
+        )
+        if not batch:
+            return
+        yield batch
+        last = batch[-1].pk
+
+
+def compress_bodies(apps: Any, schema_editor: Any) -> None:
+    ArticleBody = apps.get_model("articles", "ArticleBody")
+    postgres = schema_editor.connection.vendor == "postgresql"
+    for batch in batches(ArticleBody):
+        for body in batch:
+            body.compressed_text = body.text
+            if postgres:
+                body.search_vector = SearchVector(
+                    models.Value(body.text), config=SEARCH_CONFIG
+                )
+        ArticleBody.objects.bulk_update(
+            batch, ["compressed_text", "search_vector"]
+        )
+
+
+def decompress_bodies(apps: Any, schema_editor: Any) -> None:
+    ArticleBody = apps.get_model("articles", "ArticleBody")
+    for batch in batches(ArticleBody):
+        for body in batch:
+            body.text = body.compressed_text
+        ArticleBody.objects.bulk_update(batch, ["text"])
+
+
+def create_search_index(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        ArticleBody = apps.get_model("articles", "ArticleBody")
+        schema_editor.add_index(ArticleBody, SEARCH_INDEX)
+
+
+def drop_search_index(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        ArticleBody = apps.get_model("articles", "ArticleBody")
+        schema_editor.remove_index(ArticleBody, SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0009_article_body"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlebody",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="articlebody",
+            name="compressed_text",
+            field=core.fields.CompressedTextField(null=True),
+        ),
+        migrations.RunPython(compress_bodies, decompress_bodies),
+        # lets the column be added back to existing rows when reverting
+        migrations.AlterField(
+            model_name="articlebody",
+            name="text",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(
+            model_name="articlebody",
+            name="text",
+        ),
+        migrations.RenameField(
+            model_name="articlebody",
+            old_name="compressed_text",
+            new_name="text",
+        ),
+        migrations.AlterField(
+            model_name="articlebody",
+            name="text",
+            field=core.fields.CompressedTextField(),
+        ),
+        # GIN indexes only exist on Postgres
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index)
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="articlebody", index=SEARCH_INDEX
+                )
+            ],
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:29
+
+from typing import Any
+
+from django.db import migrations, models
+
+CHANGE_SEQUENCE = "articles_change_seq"
+
+
+def create_change_sequence(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"CREATE SEQUENCE {CHANGE_SEQUENCE}")
+        schema_editor.execute(
+            f"SELECT setval('{CHANGE_SEQUENCE}', "
+            "COALESCE(MAX(change_seq), 0) + 1, false) FROM articles_article"
+        )
+
+
+def drop_change_sequence(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP SEQUENCE {CHANGE_SEQUENCE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0010_compress_article_body"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("lookup_id", models.UUIDField(unique=True)),
+                (
+                    "slug",
+                    models.SlugField(blank=True, max_length=255, null=True),
+                ),
+                ("change_seq", models.BigIntegerField(db_index=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="change_seq",
+            field=models.BigIntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        # existing articles enter the feed in the order they were created
+        migrations.RunSQL(
+            "UPDATE articles_article SET change_seq = id",
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunPython(create_change_sequence, drop_change_sequence),
+    ]
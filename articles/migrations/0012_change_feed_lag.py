@@ -0,0 +1,26 @@
+# Generated by Django 4.0.5 on 2026-10-19 18:04
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0011_change_feed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="changed_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="articletombstone",
+            name="changed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,21 +1,106 @@
 import math
 import uuid
-from typing import Any
+from typing import Any, Optional
 
 from cloudinary.models import CloudinaryField
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.db.models.signals import pre_save
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models
+from django.db.models import F
+from django.db.models.signals import m2m_changed, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.text import slugify
 from taggit.managers import TaggableManager
+from taggit.models import TaggedItem
 
-from users.abstracts import TimeStampedModel
+from core.fields import CompressedTextField, search_vector
+from users.abstracts import SoftDeleteModel, TimeStampedModel, deleted_index
 
 User = get_user_model()
 
+# Postgres sequence of the change feed positions
+CHANGE_SEQUENCE = "articles_change_seq"
+LAST_CHANGE_SQL = (
+    "SELECT COALESCE(MAX(change_seq), 0) FROM ("
+    "SELECT MAX(change_seq) AS change_seq FROM articles_article "
+    "UNION ALL SELECT MAX(change_seq) FROM articles_articletombstone"
+    ") AS positions"
+)
 
-class Article(TimeStampedModel):
+
+class NextChangeSeq(models.Func):
+    """
+    The next position in the article change feed. Postgres draws it from
+    a sequence, so concurrent writers never wait on each other. Other
+    databases take one past the last position, plus ``spread``, the
+    article id, when a statement updates several rows, which keeps the
+    positions unique.
+    """
+
+    output_field = models.BigIntegerField()
+
+    def __init__(self, spread: Any = None) -> None:
+        super().__init__(*([] if spread is None else [spread]))
+
+    def as_sql(self, compiler: Any, connection: Any, **extra: Any) -> Any:
+        if not self.source_expressions:
+            return f"(({LAST_CHANGE_SQL}) + 1)", []
+        spread, params = compiler.compile(self.source_expressions[0])
+        return f"(({LAST_CHANGE_SQL}) + {spread})", params
+
+    def as_postgresql(
+        self, compiler: Any, connection: Any, **extra: Any
+    ) -> Any:
+        return f"nextval('{CHANGE_SEQUENCE}')", []
+
+
+def last_change_seq() -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(LAST_CHANGE_SQL)
+        return cursor.fetchone()[0]  # type: ignore[no-any-return]
+
+
+def reset_change_sequence() -> None:
+    """
+    Moves the Postgres sequence past positions that were set explicitly
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT setval('{CHANGE_SEQUENCE}', ({LAST_CHANGE_SQL}) + 1, "
+            "false)"
+        )
+
+
+def bump_changes(queryset: Any, **updates: Any) -> int:
+    """
+    Moves the articles of ``queryset`` to the end of the change feed
+    """
+    return queryset.update(  # type: ignore[no-any-return]
+        change_seq=NextChangeSeq(F("id")), changed_at=timezone.now(), **updates
+    )
+
+
+class ArticleQuerySet(models.QuerySet):
+    def for_display(self) -> "ArticleQuerySet":
+        """
+        Loads everything ArticleSerializer renders in a fixed number of
+        queries, however many articles, likes and dislikes there are
+        """
+        return self.select_related("author", "article_body").prefetch_related(
+            "tags", "likes", "dislikes"
+        )
+
+
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):  # type: ignore[misc]
+    def get_queryset(self) -> ArticleQuerySet:
+        return super().get_queryset().filter(deleted_at__isnull=True)  # type: ignore[no-any-return]
+
+
+class Article(TimeStampedModel, SoftDeleteModel):
 
     lookup_id = models.UUIDField(
         default=uuid.uuid4, editable=False, unique=True, max_length=255
@@ -24,10 +109,17 @@ class Article(TimeStampedModel):
     title = models.CharField(max_length=255, blank=False, null=False)
     description = models.CharField(max_length=255, blank=True, null=True)
     image = CloudinaryField("post_images", blank=True, null=True)
-    body = models.TextField(blank=False, null=False)
     tags = TaggableManager()
     is_hidden = models.BooleanField(default=False)
     reading_time = models.PositiveIntegerField(blank=True, null=True)
+    # written behind by articles.viewcounts
+    views_count = models.PositiveBigIntegerField(default=0, editable=False)
+    # position in the change feed, moved by every save and reaction
+    change_seq = models.BigIntegerField(
+        default=0, editable=False, db_index=True
+    )
+    # when the position was drawn, the feed holds it back for a while
+    changed_at = models.DateTimeField(default=timezone.now, editable=False)
     likes = models.ManyToManyField(User, related_name="likes", blank=True)
     dislikes = models.ManyToManyField(
         User, related_name="dislikes", blank=True
@@ -36,12 +128,114 @@ class Article(TimeStampedModel):
         User, on_delete=models.SET_NULL, related_name="author", null=True
     )
 
+    objects = ArticleManager()
+    all_objects = ArticleQuerySet.as_manager()
+
     class Meta:
-        ordering = ["-created_at"]
+        # the id makes pages stable when articles share a timestamp
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # newest first pages of the default manager read only the head
+            # of this index however large the table grows
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="article_recent_idx",
+            ),
+            deleted_index("article_deleted_idx"),
+        ]
+
+    # a body assigned since the article was loaded, saved with it
+    _body: Optional[str] = None
 
     def __str__(self) -> str:
         return self.title
 
+    @property
+    def body(self) -> Optional[str]:
+        """
+        The text kept in ArticleBody, away from the narrow rows that list,
+        filter and sort queries scan
+        """
+        if self._body is not None:
+            return self._body
+        try:
+            return self.article_body.text  # type: ignore[no-any-return]
+        except ArticleBody.DoesNotExist:
+            return None
+
+    @body.setter
+    def body(self, text: str) -> None:
+        self._body = text
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        adding = self._state.adding
+        self.change_seq = NextChangeSeq(None if adding else F("id"))
+        self.changed_at = timezone.now()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {
+                *kwargs["update_fields"],
+                "change_seq",
+                "changed_at",
+            }
+        super().save(*args, **kwargs)
+        # assigned by the database, loaded again if it is read
+        del self.change_seq
+        if self._body is None:
+            return
+        article_body = ArticleBody(article=self, text=self._body)
+        if adding or not (
+            ArticleBody.objects.filter(article=self).update(
+                text=self._body,
+                search_vector=search_vector(self._body),
+            )
+        ):
+            article_body.save(force_insert=True)
+        # later reads get the saved text without a query
+        self.article_body = article_body
+        self._body = None
+
+
+class ArticleBody(models.Model):
+    article = models.OneToOneField(
+        Article,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="article_body",
+    )
+    text = CompressedTextField()
+    # computed by the database when the text is saved on Postgres, NULL
+    # elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # text still compressed was neither read nor assigned
+        changed = isinstance(self.__dict__.get("text"), str)
+        if changed:
+            self.search_vector = search_vector(self.text)
+        super().save(*args, **kwargs)
+        if changed:
+            # loaded again if it is read
+            del self.search_vector
+
+    class Meta:
+        indexes = [
+            # only created on Postgres, see migration 0010
+            GinIndex(fields=["search_vector"], name="articlebody_search_idx")
+        ]
+
+
+class ArticleTombstone(models.Model):
+    """
+    Keeps a purged article in the change feed, for clients that synced
+    before it was deleted
+    """
+
+    lookup_id = models.UUIDField(unique=True)
+    slug = models.SlugField(max_length=255, blank=True, null=True)
+    change_seq = models.BigIntegerField(db_index=True)
+    changed_at = models.DateTimeField(default=timezone.now)
+
 
 @receiver(pre_save, sender=Article)
 def slug_pre_save(sender: Any, instance: Any, **kwargs: Any) -> None:
@@ -51,4 +245,38 @@ def slug_pre_save(sender: Any, instance: Any, **kwargs: Any) -> None:
 
 @receiver(pre_save, sender=Article)
 def reading_time_pre_save(sender: Any, instance: Any, **kwargs: Any) -> None:
-    instance.reading_time = math.ceil(instance.body.count(" ") // 200)
+    # only a new body changes it, and reading the stored one costs a query
+    if instance._body is not None:
+        instance.reading_time = math.ceil(instance._body.count(" ") // 200)
+
+
+@receiver(m2m_changed, sender=Article.likes.through)
+@receiver(m2m_changed, sender=Article.dislikes.through)
+@receiver(m2m_changed, sender=TaggedItem)
+def reactions_changed(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Moves articles whose reactions or tags changed to the end of the
+    change feed
+    """
+    if isinstance(instance, Article) and action in (
+        "post_add",
+        "post_remove",
+        "post_clear",
+    ):
+        bump_changes(Article.all_objects.filter(pk=instance.pk))
+    elif reverse and sender is not TaggedItem:
+        # a user's reactions changed, from the user's side
+        if action in ("post_add", "post_remove"):
+            bump_changes(Article.all_objects.filter(pk__in=pk_set))
+        elif action == "pre_clear":
+            relation = (
+                "likes" if sender is Article.likes.through else "dislikes"
+            )
+            bump_changes(Article.all_objects.filter(**{relation: instance}))
@@ -12,6 +12,17 @@ from users.serializers import UserSerializer
 User = get_user_model()
 
 
+def related_count(instance: Any, name: str) -> int:
+    """
+    Counts a many-to-many relation from its prefetched rows when it was
+    prefetched, instead of issuing a COUNT per article
+    """
+    prefetched = getattr(instance, "_prefetched_objects_cache", {})
+    if name in prefetched:
+        return len(prefetched[name])
+    return getattr(instance, name).count()  # type: ignore[no-any-return]
+
+
 class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type: ignore[no-any-unimported]
     author = UserSerializer(read_only=True)
     image = serializers.ImageField(
@@ -39,6 +50,7 @@ class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type:
             "likes_count",
             "dislikes_count",
             "reading_time",
+            "views_count",
             "likes",
             "dislikes",
             "created_at",
@@ -46,6 +58,7 @@ class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type:
             "author",
         )
         read_only_fields = [
+            "views_count",
             "created_at",
             "updated_at",
             "author",
@@ -54,10 +67,10 @@ class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type:
         ]
 
     def get_likes_count(self, instance: Any) -> Any:
-        return instance.likes.count()
+        return related_count(instance, "likes")
 
     def get_dislikes_count(self, instance: Any) -> Any:
-        return instance.dislikes.count()
+        return related_count(instance, "dislikes")
 
     def create(self, validated_data: Any) -> Any:
         """set current user as author"""
@@ -68,6 +81,9 @@ class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type:
         """check if the user liked or disliked an article and return favorited and unfavorited status"""
         request = self.context.get("request")
         representation = super().to_representation(instance)
+        if instance.author is not None and instance.author.deleted_at:
+            # rendered like the null author the purge leaves
+            representation["author"] = None
         if request.user.is_authenticated:
             if request.user in instance.likes.all():
                 return {
@@ -86,6 +102,7 @@ class ArticleSerializer(TaggitSerializer, serializers.ModelSerializer):  # type:
 
 
 class ArticleFavoriteSerializer(serializers.ModelSerializer):
+    body = serializers.CharField(read_only=True)
     likes = UserSerializer(many=True, required=False, read_only=True)
     dislikes = UserSerializer(many=True, required=False, read_only=True)
     tags = TagListSerializerField()
@@ -129,10 +146,10 @@ class ArticleFavoriteSerializer(serializers.ModelSerializer):
         ]
 
     def get_likes_count(self, instance: Any) -> Any:
-        return instance.likes.count()
+        return related_count(instance, "likes")
 
     def get_dislikes_count(self, instance: Any) -> Any:
-        return instance.dislikes.count()
+        return related_count(instance, "dislikes")
 
 
 class FavoriteSerializer(ArticleFavoriteSerializer):
@@ -187,3 +204,12 @@ class UnFavoriteSerializer(ArticleFavoriteSerializer):
                 "unfavorited": True,
             }
         return {**representation, "favorited": False, "unfavorited": False}
+
+
+class ChangesQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the article change feed
+    """
+
+    since = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=100)
@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from articles.models import Article
+
+User = get_user_model()
+
+
+class TestArticleAdmin(TestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com", password="password", username="admin"
+        )
+        self.client.force_login(self.admin)
+
+    def add_articles(self, count: int) -> None:
+        start = Article.objects.count()
+        for index in range(start, start + count):
+            author = User.objects.create_user(
+                email=f"author-{index}@example.com",
+                password="password",
+                username=f"author-{index}",
+            )
+            Article.objects.create(
+                title=f"Article {index}",
+                description="description",
+                body="body",
+                author=author,
+            )
+
+    def changelist_queries(self) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("admin:articles_article_changelist")
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_joins_authors(self) -> None:
+        self.add_articles(1)
+        few = self.changelist_queries()
+        self.add_articles(10)
+        self.assertEqual(self.changelist_queries(), few)
+
+    def test_search_by_author_username(self) -> None:
+        self.add_articles(2)
+        response = self.client.get(
+            reverse("admin:articles_article_changelist"), {"q": "author-1"}
+        )
+        self.assertContains(response, "Article 1")
+        self.assertNotContains(response, "Article 0")
+
+    def test_change_form_does_not_list_users(self) -> None:
+        self.add_articles(3)
+        article = Article.objects.get(author__username="author-0")
+        response = self.client.get(
+            reverse("admin:articles_article_change", args=[article.pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "author-2@example.com")
@@ -0,0 +1,98 @@
+# type: ignore [attr-defined]
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article
+from articles.tests.mocks import sample_image
+from users.models import UserFollowing
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestAsyncArticleViews(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            username=fake.name(), email=fake.email(), password=fake.password()
+        )
+        self.article = Article.objects.create(
+            title=fake.name(),
+            description=fake.text(),
+            body=fake.text(),
+            image=sample_image(),
+            is_hidden=False,
+            author=self.user,
+        )
+
+    async def test_list_matches_sync_view(self) -> None:
+        response = await self.async_client.get(reverse("articles-async"))
+        sync_response = await self.async_client.get(reverse("articles"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()["count"], 1)
+
+    async def test_detail_matches_sync_view(self) -> None:
+        kwargs = {"slug": self.article.slug}
+        response = await self.async_client.get(
+            reverse("article-detail-async", kwargs=kwargs)
+        )
+        sync_response = await self.async_client.get(
+            reverse("article-detail", kwargs=kwargs)
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+
+    async def test_detail_not_found(self) -> None:
+        response = await self.async_client.get(
+            reverse("article-detail-async", kwargs={"slug": "missing"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestAsyncFollowView(TestCase):
+    def setUp(self) -> None:
+        self.user_one = User.objects.create_user(
+            username=fake.name(), email=fake.email(), password=fake.password()
+        )
+        self.user_two = User.objects.create_user(
+            username=fake.name(), email=fake.email(), password=fake.password()
+        )
+        token = RefreshToken.for_user(self.user_two).access_token
+        self.headers = {"authorization": f"Bearer {token}"}
+        self.url = reverse(
+            "user-follow-async", kwargs={"lookup_id": self.user_one.lookup_id}
+        )
+
+    async def test_unauthorized_follow(self) -> None:
+        response = await self.async_client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_follow_and_unfollow(self) -> None:
+        response = await self.async_client.post(self.url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, text=self.user_one.username)
+        self.assertTrue(await self.following_exists())
+
+        response = await self.async_client.delete(self.url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(await self.following_exists())
+
+    async def test_cannot_follow_self(self) -> None:
+        url = reverse(
+            "user-follow-async", kwargs={"lookup_id": self.user_two.lookup_id}
+        )
+        response = await self.async_client.post(url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def following_exists(self) -> bool:
+        return await sync_to_async(
+            UserFollowing.objects.filter(
+                follower=self.user_two, followed=self.user_one
+            ).exists
+        )()
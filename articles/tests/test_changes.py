@@ -0,0 +1,166 @@
+from typing import Any, Dict
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article, ArticleTombstone
+from core.purge import purge_deleted
+
+fake = Faker()
+User = get_user_model()
+
+
+@pytest.mark.query_budget
+@override_settings(CHANGES_COMMIT_LAG=0)
+class TestArticleChanges(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.author = User.objects.create_user(
+            email="changes-author@example.com",
+            password="password",
+            username="changes-author",
+        )
+        self.reader = User.objects.create_user(
+            email="changes-reader@example.com",
+            password="password",
+            username="changes-reader",
+        )
+        self.articles = [
+            Article.objects.create(
+                title=fake.sentence(), body=fake.text(), author=self.author
+            )
+            for _ in range(3)
+        ]
+
+    def changes(self, **params: Any) -> Dict[str, Any]:
+        cache.clear()
+        response = self.client.get(reverse("article-changes"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()  # type: ignore[no-any-return]
+
+    def slugs(self, changes: Dict[str, Any]) -> list:
+        return [article["slug"] for article in changes["articles"]]
+
+    def test_all_changes_in_order(self) -> None:
+        changes = self.changes()
+        self.assertEqual(
+            self.slugs(changes), [article.slug for article in self.articles]
+        )
+        self.assertEqual(changes["deleted"], [])
+        self.assertFalse(changes["has_more"])
+        self.assertEqual(
+            changes["cursor"],
+            Article.objects.get(pk=self.articles[-1].pk).change_seq,
+        )
+
+    def test_saves_and_reactions_move_articles_to_the_end(self) -> None:
+        cursor = self.changes()["cursor"]
+        first, second, third = self.articles
+        second.title = fake.sentence()
+        second.save(update_fields=["title"])
+        first.likes.add(self.reader)
+        self.assertEqual(
+            self.slugs(self.changes(since=cursor)), [second.slug, first.slug]
+        )
+
+        cursor = self.changes()["cursor"]
+        # cleared from the user's side
+        self.reader.likes.clear()
+        third.tags.add("django")
+        self.assertEqual(
+            self.slugs(self.changes(since=cursor)), [first.slug, third.slug]
+        )
+
+    def test_positions_are_unique(self) -> None:
+        for article in self.articles:
+            article.likes.add(self.reader)
+        positions = Article.objects.values_list("change_seq", flat=True)
+        self.assertEqual(len(set(positions)), len(self.articles))
+
+    def test_positions_committed_out_of_order(self) -> None:
+        cursor = self.changes()["cursor"]
+        first, second, _ = self.articles
+        first.save()
+        second.save()
+        drawn = Article.objects.get(pk=first.pk).change_seq
+        # second commits while first, with the earlier position, is still
+        # being written, so the feed sees no first yet
+        Article.objects.filter(pk=first.pk).update(change_seq=cursor)
+        with self.settings(CHANGES_COMMIT_LAG=60):
+            changes = self.changes(since=cursor)
+            self.assertEqual(changes["articles"], [])
+            self.assertEqual(changes["cursor"], cursor)
+            self.assertFalse(changes["has_more"])
+        Article.objects.filter(pk=first.pk).update(change_seq=drawn)
+        self.assertEqual(
+            self.slugs(self.changes(since=cursor)), [first.slug, second.slug]
+        )
+
+    def test_view_counts_do_not_move_articles(self) -> None:
+        cursor = self.changes()["cursor"]
+        self.client.get(
+            reverse("article-detail", kwargs={"slug": self.articles[0].slug})
+        )
+        self.assertEqual(self.changes(since=cursor)["articles"], [])
+
+    def test_pages_with_the_cursor(self) -> None:
+        page = self.changes(limit=2)
+        self.assertTrue(page["has_more"])
+        self.assertEqual(len(page["articles"]), 2)
+        page = self.changes(since=page["cursor"], limit=2)
+        self.assertFalse(page["has_more"])
+        self.assertEqual(self.slugs(page), [self.articles[-1].slug])
+
+    def test_deleted_and_hidden_articles_are_tombstones(self) -> None:
+        cursor = self.changes()["cursor"]
+        deleted, hidden, _ = self.articles
+        deleted.soft_delete()
+        hidden.is_hidden = True
+        hidden.save()
+        changes = self.changes(since=cursor)
+        self.assertEqual(changes["articles"], [])
+        self.assertEqual(
+            changes["deleted"],
+            [
+                {"lookup_id": str(deleted.lookup_id), "slug": deleted.slug},
+                {"lookup_id": str(hidden.lookup_id), "slug": hidden.slug},
+            ],
+        )
+
+    def test_purged_articles_stay_in_the_feed(self) -> None:
+        self.articles[0].soft_delete()
+        cursor = self.changes()["cursor"]
+        purge_deleted(progress=lambda message: None)
+        self.assertEqual(ArticleTombstone.objects.count(), 1)
+        changes = self.changes(since=cursor)
+        self.assertEqual(
+            changes["deleted"],
+            [
+                {
+                    "lookup_id": str(self.articles[0].lookup_id),
+                    "slug": self.articles[0].slug,
+                }
+            ],
+        )
+        self.assertEqual(self.changes()["cursor"], changes["cursor"])
+
+    def test_purged_reactions_move_articles(self) -> None:
+        self.articles[1].dislikes.add(self.reader)
+        self.reader.soft_delete()
+        cursor = self.changes()["cursor"]
+        purge_deleted(progress=lambda message: None)
+        self.assertEqual(
+            self.slugs(self.changes(since=cursor)), [self.articles[1].slug]
+        )
+
+    def test_invalid_cursor(self) -> None:
+        response = self.client.get(reverse("article-changes"), {"since": -1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse("article-changes"), {"limit": 1000})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any, List
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from faker import Faker
+from rest_framework.test import APITestCase
+
+from articles.events import count_updates
+from articles.models import Article
+from core.events import Event, broker
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestArticleEvents(APITestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user(
+            email="events-author@example.com",
+            password="password",
+            username="events-author",
+        )
+        self.readers = [
+            User.objects.create_user(
+                email=f"events-reader-{index}@example.com",
+                password="password",
+                username=f"events-reader-{index}",
+            )
+            for index in range(3)
+        ]
+        self.article = Article.objects.create(
+            title=fake.sentence(), body=fake.text(), author=self.author
+        )
+        count_updates.flush()
+
+    def published(self, action: Any) -> List[Event]:
+        """
+        Events published by ``action`` once its transaction commits
+        """
+        with mock.patch.object(broker.backend, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                action()
+        return [call.args[0] for call in publish.call_args_list]
+
+    def test_publishes_created_articles_on_commit(self) -> None:
+        (event,) = self.published(
+            lambda: Article.objects.create(
+                title="A new article", body=fake.text(), author=self.author
+            )
+        )
+        self.assertEqual(event.name, "article")
+        self.assertEqual(event.data["title"], "A new article")
+        self.assertEqual(event.data["author"], "events-author")
+
+    def test_skips_hidden_articles(self) -> None:
+        events = self.published(
+            lambda: Article.objects.create(
+                title=fake.sentence(), body=fake.text(), is_hidden=True
+            )
+        )
+        self.assertEqual(events, [])
+
+    def test_debounces_reaction_counts(self) -> None:
+        with mock.patch("articles.events.Timer") as timer:
+            for reader in self.readers:
+                self.published(lambda: self.article.likes.add(reader))
+            self.published(lambda: self.readers[0].likes.clear())
+            self.published(lambda: self.article.dislikes.add(self.author))
+        timer.assert_called_once()
+
+        with self.assertNumQueries(3):
+            events = self.published(count_updates.flush)
+        self.assertEqual(
+            [event.data for event in events],
+            [
+                {
+                    "lookup_id": self.article.lookup_id,
+                    "slug": self.article.slug,
+                    "likes_count": 2,
+                    "dislikes_count": 1,
+                }
+            ],
+        )
+        self.assertEqual(count_updates.flush(), [])
+
+    def test_skips_counts_of_hidden_articles(self) -> None:
+        with mock.patch("articles.events.Timer"):
+            self.published(lambda: self.article.likes.add(self.readers[0]))
+        Article.objects.filter(pk=self.article.pk).update(is_hidden=True)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.published(count_updates.flush), [])
+
+    def test_streams_receive_published_events(self) -> None:
+        async def listen() -> Event:
+            queue = broker.subscribe()
+            try:
+                broker.publish("article", {"slug": self.article.slug})
+                return await asyncio.wait_for(queue.get(), 5)
+            finally:
+                broker.unsubscribe(queue)
+
+        event = asyncio.run(listen())
+        self.assertEqual(event.data, {"slug": self.article.slug})
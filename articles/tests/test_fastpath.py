@@ -0,0 +1,89 @@
+from typing import Any, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from faker import Faker
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from articles.fastpath import ArticleRowSerializer, article_rows
+from articles.models import Article
+from articles.serializers import ArticleSerializer
+from users.models import UserFollowing
+from users.test.mocks import bulk_users
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestArticleRowSerializer(APITestCase):
+    """
+    Differential test: the fast path must render the same bytes as
+    ArticleSerializer
+    """
+
+    def setUp(self) -> None:
+        self.reader = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        authors = bulk_users(2)
+        users = bulk_users(6)
+        UserFollowing.objects.create(follower=self.reader, followed=authors[0])
+        UserFollowing.objects.create(follower=self.reader, followed=users[1])
+
+        for index in range(6):
+            article = Article.objects.create(
+                title=fake.sentence(),
+                description=fake.sentence() if index % 2 else None,
+                body=fake.text(),
+                author=authors[index % 2] if index != 5 else None,
+                is_hidden=index == 3,
+            )
+            article.tags.add(*fake.words(index % 4, unique=True))
+            article.likes.add(*users[: index + 1])
+            article.dislikes.add(*users[index + 1 :])
+        liked, disliked = Article.objects.all()[:2]
+        liked.likes.add(self.reader)
+        disliked.dislikes.add(self.reader)
+        Article.objects.filter(pk=liked.pk).update(
+            image="image/upload/v1/post_images/cover.png"
+        )
+
+    def request(self, user: Optional[Any]) -> Request:
+        request = Request(APIRequestFactory().get("/api/v1/articles/"))
+        request.user = user or AnonymousUser()
+        return request
+
+    def assertSameOutput(self, user: Optional[Any]) -> str:
+        queryset = Article.objects.for_display()
+        expected = ArticleSerializer(
+            queryset, many=True, context={"request": self.request(user)}
+        ).data
+        actual = ArticleRowSerializer(
+            {"request": self.request(user)}
+        ).to_representation(list(article_rows(queryset)))
+        output = JSONRenderer().render(actual).decode()
+        self.assertEqual(output, JSONRenderer().render(expected).decode())
+        return output
+
+    def test_anonymous(self) -> None:
+        self.assertSameOutput(None)
+
+    def test_authenticated(self) -> None:
+        output = self.assertSameOutput(self.reader)
+        self.assertIn('"favorited":true', output)
+        self.assertIn('"unfavorited":true', output)
+        self.assertIn("res.cloudinary.com", output)
+
+    def test_views_match_serializer(self) -> None:
+        self.client.force_authenticate(self.reader)
+        article = Article.objects.first()
+        response = self.client.get(f"/api/v1/articles/{article.slug}/detail/")
+        expected = ArticleSerializer(
+            Article.objects.for_display().get(pk=article.pk),
+            context={"request": self.request(self.reader)},
+        ).data
+        self.assertEqual(response.content, JSONRenderer().render(expected))
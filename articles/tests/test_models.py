@@ -2,7 +2,7 @@ from django.test import TestCase
 from django.utils.text import slugify
 from faker import Faker
 
-from articles.models import Article
+from articles.models import Article, ArticleBody
 
 fake = Faker()
 
@@ -34,3 +34,27 @@ class TestArticleModel(TestCase):
         self.assertEqual(
             article.slug, slugify(f"{article.title}-{article.lookup_id}")
         )
+
+    def test_recent_pages_read_the_recent_index(self) -> None:
+        Article.objects.create(**self.data)
+        plan = Article.objects.all()[:10].explain()
+        self.assertIn("article_recent_idx", plan)
+
+    def test_body_is_stored_in_its_own_table(self) -> None:
+        article = Article.objects.create(**self.data)
+        self.assertEqual(
+            ArticleBody.objects.get(article=article).text, self.data["body"]
+        )
+        article = Article.objects.get(pk=article.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(article.body, self.data["body"])
+
+        article.body = "word " * 400
+        article.save()
+        article = Article.objects.select_related("article_body").get(
+            pk=article.pk
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(article.body, "word " * 400)
+        self.assertEqual(article.reading_time, 2)
+        self.assertEqual(ArticleBody.objects.count(), 1)
@@ -0,0 +1,98 @@
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from articles.models import Article
+from core.querybudget import QueryBudgetMixin
+from users.models import UserFollowing
+from users.test.mocks import bulk_users
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestArticleQueryBudgets(QueryBudgetMixin, APITestCase):
+    def setUp(self) -> None:
+        self.reader = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        self.authors = bulk_users(2)
+        UserFollowing.objects.create(
+            follower=self.reader, followed=self.authors[0]
+        )
+        (self.article,) = self.make_articles(1, likers=1)
+
+    def make_articles(self, count: int, likers: int) -> Any:
+        users = bulk_users(likers)
+        articles = []
+        for index in range(count):
+            article = Article.objects.create(
+                title=fake.sentence(),
+                body=fake.text(),
+                author=self.authors[index % 2],
+            )
+            article.tags.add(fake.word(), fake.word())
+            self.add_likers(article, users)
+            articles.append(article)
+        return articles
+
+    def add_likers(self, article: Article, users: Any) -> None:
+        article.likes.add(*users)
+        article.dislikes.add(*users[: len(users) // 2])
+
+    def client_for(self, authenticated: bool) -> APIClient:
+        client = APIClient()
+        if authenticated:
+            client.force_authenticate(self.reader)
+        return client
+
+    def get(self, name: str, authenticated: bool, **kwargs: Any) -> None:
+        # anonymous reads would otherwise be answered by the coalescing cache
+        cache.clear()
+        client = self.client_for(authenticated)
+        response = client.get(reverse(name, kwargs=kwargs))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_article_list(self) -> None:
+        self.make_articles(1, likers=50)
+        for authenticated in (False, True):
+            for name in ("articles", "articles-async"):
+                self.assertFlatQueries(
+                    name,
+                    lambda: self.get(name, authenticated),
+                    lambda: self.make_articles(50, likers=5),
+                )
+
+    def test_article_detail(self) -> None:
+        for authenticated in (False, True):
+            for name in ("article-detail", "article-detail-async"):
+                self.assertFlatQueries(
+                    name,
+                    lambda: self.get(
+                        name, authenticated, slug=self.article.slug
+                    ),
+                    lambda: self.add_likers(self.article, bulk_users(50)),
+                )
+
+    def test_article_favorite(self) -> None:
+        client = self.client_for(authenticated=True)
+        for name in ("article-favorite", "article-unfavorite"):
+            counts = []
+            for likers in (0, 49):
+                self.add_likers(self.article, bulk_users(likers))
+                self.article.likes.remove(self.reader)
+                self.article.dislikes.remove(self.reader)
+                with self.assertQueryBudget(name) as queries:
+                    response = client.patch(
+                        reverse(name, kwargs={"slug": self.article.slug})
+                    )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                counts.append(len(queries))
+            self.assertEqual(counts[0], counts[1], queries.report())
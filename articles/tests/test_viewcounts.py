@@ -0,0 +1,146 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.db.models import QuerySet
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from articles.viewcounts import ViewCounter, client_address, view_counter
+from users.serializers import UserTokenObtainPairSerializer
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestViewCounter(APITestCase):
+    def setUp(self) -> None:
+        self.articles = [
+            Article.objects.create(title=fake.sentence(), body=fake.text())
+            for _ in range(3)
+        ]
+        self.slugs = [article.slug for article in self.articles]
+
+    def views(self) -> list:
+        return [
+            Article.objects.get(pk=article.pk).views_count
+            for article in self.articles
+        ]
+
+    def test_flush_batches_by_increment(self) -> None:
+        counter = ViewCounter(flush_interval=60)
+        for slug in self.slugs + [self.slugs[2]] * 2:
+            counter.record(slug)
+        self.assertEqual(self.views(), [0, 0, 0])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counter.flush(), 5)
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(self.views(), [1, 1, 3])
+        self.assertEqual(counter.flush(), 0)
+
+    def test_flushes_when_interval_elapsed(self) -> None:
+        counter = ViewCounter(flush_interval=0)
+        counter.record(self.slugs[0])
+        self.assertEqual(counter.pending(), {})
+        self.assertEqual(self.views(), [1, 0, 0])
+
+    def test_dedup_window(self) -> None:
+        counter = ViewCounter(flush_interval=60, dedup_window=30, dedup_size=2)
+        with mock.patch("articles.viewcounts.time.monotonic") as now:
+            now.return_value = 100
+            self.assertTrue(counter.record(self.slugs[0], "user:1"))
+            self.assertFalse(counter.record(self.slugs[0], "user:1"))
+            self.assertTrue(counter.record(self.slugs[0], "user:2"))
+            self.assertTrue(counter.record(self.slugs[1], "user:1"))
+            now.return_value = 131
+            self.assertTrue(counter.record(self.slugs[0], "user:2"))
+        self.assertEqual(
+            counter.pending(), {self.slugs[0]: 3, self.slugs[1]: 1}
+        )
+        # only the most recent viewers are remembered
+        self.assertEqual(len(counter.seen), 2)
+
+    def test_failed_flush_keeps_counts(self) -> None:
+        counter = ViewCounter(flush_interval=60)
+        counter.record(self.slugs[0])
+        with mock.patch.object(QuerySet, "update", side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                counter.flush()
+        self.assertEqual(counter.pending(), {self.slugs[0]: 1})
+
+
+class TestClientAddress(SimpleTestCase):
+    def address(self, forwarded: str) -> str:
+        request = RequestFactory().get(
+            "/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR=forwarded
+        )
+        return client_address(request)
+
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self) -> None:
+        self.assertEqual(self.address("1.2.3.4"), "10.0.0.1")
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_client_supplied_hops_are_ignored(self) -> None:
+        self.assertEqual(self.address("1.2.3.4, 5.6.7.8"), "5.6.7.8")
+        self.assertEqual(self.address(""), "10.0.0.1")
+
+    @override_settings(TRUSTED_PROXY_COUNT=2)
+    def test_hop_appended_by_the_outermost_proxy(self) -> None:
+        self.assertEqual(self.address("1.2.3.4, 5.6.7.8, 10.0.0.9"), "5.6.7.8")
+
+
+class TestArticleViews(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        self.article = Article.objects.create(
+            title=fake.sentence(), body=fake.text()
+        )
+        self.url = reverse(
+            "article-detail", kwargs={"slug": self.article.slug}
+        )
+
+    @override_settings(TRUSTED_PROXY_COUNT=1)
+    def test_detail_gets_are_counted(self) -> None:
+        # the second is answered from the coalescing cache
+        self.client.get(self.url, HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.client.get(self.url, HTTP_X_FORWARDED_FOR="1.2.3.4")
+        self.client.get(self.url, HTTP_X_FORWARDED_FOR="5.6.7.8")
+        token = UserTokenObtainPairSerializer.get_token(self.user)
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {token.access_token}"
+        )
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.get(reverse("article-detail", kwargs={"slug": "missing"}))
+        self.assertEqual(view_counter.pending(), {self.article.slug: 3})
+
+        view_counter.flush()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["views_count"], 3)
+        self.assertEqual(view_counter.pending(), {})
+
+    def test_anonymous_views_without_trusted_proxies(self) -> None:
+        # every reader behind the same proxy shares its address
+        for _ in range(3):
+            self.client.get(self.url, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(view_counter.pending(), {self.article.slug: 3})
+
+    def test_async_detail_gets_are_counted(self) -> None:
+        self.client.get(
+            reverse("article-detail-async", kwargs={"slug": self.article.slug})
+        )
+        self.assertEqual(view_counter.pending(), {self.article.slug: 1})
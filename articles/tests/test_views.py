@@ -3,6 +3,7 @@
 import json
 from unittest.mock import patch
 
+import pytest
 from django.contrib.auth import get_user_model
 from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
 from faker import Faker
@@ -17,6 +18,8 @@ from articles.tests.mocks import sample_data, sample_image
 fake = Faker()
 User = get_user_model()
 
+pytestmark = pytest.mark.query_budget
+
 
 class TestArticleViews(APITestCase):
     @classmethod
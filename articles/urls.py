@@ -1,6 +1,8 @@
 from django.urls import path
 
+from articles.async_views import AsyncArticleDetailView, AsyncArticleListView
 from articles.views import (
+    ArticleChangesView,
     ArticleDetailView,
     ArticleFavoriteView,
     ArticleListView,
@@ -9,6 +11,11 @@ from articles.views import (
 
 urlpatterns = [
     path("articles/", ArticleListView.as_view(), name="articles"),
+    path(
+        "articles/changes/",
+        ArticleChangesView.as_view(),
+        name="article-changes",
+    ),
     path(
         "articles/<slug:slug>/detail/",
         ArticleDetailView.as_view(),
@@ -24,4 +31,14 @@ urlpatterns = [
         ArticleUnFavoriteView.as_view(),
         name="article-unfavorite",
     ),
+    path(
+        "async/articles/",
+        AsyncArticleListView.as_view(),
+        name="articles-async",
+    ),
+    path(
+        "async/articles/<slug:slug>/detail/",
+        AsyncArticleDetailView.as_view(),
+        name="article-detail-async",
+    ),
 ]
@@ -0,0 +1,150 @@
+"""
+Article view counts, buffered in memory and written behind.
+
+Each process adds up the views of its requests per article and writes
+them at most every VIEW_COUNTS_FLUSH_INTERVAL seconds, from the first
+request recording a view after the interval, as
+``UPDATE ... SET views_count = views_count + n``, one statement per
+distinct increment. A popular article costs one row update per process
+and interval instead of one per request. Gunicorn workers flush when they
+exit; counts buffered in a killed process are lost, which is acceptable
+for a ranking signal.
+"""
+import time
+from collections import Counter, OrderedDict, defaultdict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from django.http import HttpRequest
+
+from articles.models import Article
+
+
+class ViewCounter:
+    def __init__(
+        self,
+        flush_interval: float,
+        dedup_window: float = 0,
+        dedup_size: int = 0,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.dedup_window = dedup_window
+        self.dedup_size = dedup_size
+        self.counts: Counter = Counter()
+        # (slug, viewer) -> when the view stops being a duplicate
+        self.seen: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self.flushed_at = time.monotonic()
+        self.lock = Lock()
+        self.flush_lock = Lock()
+
+    def record(self, slug: str, viewer: Optional[str] = None) -> bool:
+        """
+        Counts a view of the article, unless ``viewer`` already viewed it
+        within the dedup window. Returns whether it was counted.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if viewer is not None and self.dedup_window > 0:
+                key = (slug, viewer)
+                if self.seen.get(key, 0) > now:
+                    return False
+                self.seen[key] = now + self.dedup_window
+                self.seen.move_to_end(key)
+                while len(self.seen) > self.dedup_size:
+                    self.seen.popitem(last=False)
+            self.counts[slug] += 1
+            due = now >= self.flushed_at + self.flush_interval
+            if due:
+                self.flushed_at = now
+        if due:
+            try:
+                self.flush()
+            except DatabaseError:
+                # the counts were kept for the next flush
+                pass
+        return True
+
+    def reset(self) -> None:
+        """
+        Drops the buffered counts and dedup entries
+        """
+        with self.lock:
+            self.counts.clear()
+            self.seen.clear()
+            self.flushed_at = time.monotonic()
+
+    def pending(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counts)
+
+    def flush(self) -> int:
+        """
+        Writes the buffered counts, grouping articles by increment, and
+        returns the number of views written. Counts are put back if the
+        write fails.
+        """
+        with self.flush_lock:
+            with self.lock:
+                counts, self.counts = self.counts, Counter()
+            if not counts:
+                return 0
+            by_increment: Dict[int, List[str]] = defaultdict(list)
+            for slug, views in counts.items():
+                by_increment[views].append(slug)
+            try:
+                with transaction.atomic():
+                    for views, slugs in sorted(by_increment.items()):
+                        Article.objects.filter(slug__in=slugs).update(
+                            views_count=F("views_count") + views
+                        )
+            except Exception:
+                with self.lock:
+                    self.counts.update(counts)
+                raise
+            return sum(counts.values())
+
+
+view_counter = ViewCounter(
+    settings.VIEW_COUNTS_FLUSH_INTERVAL,
+    settings.VIEW_COUNTS_DEDUP_WINDOW,
+    settings.VIEW_COUNTS_DEDUP_SIZE,
+)
+
+
+def client_address(request: HttpRequest) -> str:
+    """
+    The address the outermost of the TRUSTED_PROXY_COUNT proxies received
+    the request from. Entries left of it in X-Forwarded-For are set by the
+    client and can't be trusted.
+    """
+    proxies = settings.TRUSTED_PROXY_COUNT
+    hops = [
+        hop.strip()
+        for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+        if hop.strip()
+    ]
+    if proxies and len(hops) >= proxies:
+        return hops[-proxies]
+    return request.META.get("REMOTE_ADDR", "")  # type: ignore[no-any-return]
+
+
+def viewer_key(request: Any) -> Optional[str]:
+    """
+    The user for authenticated requests, the client address otherwise.
+    Without trusted proxies the connection may come from a proxy shared by
+    every client, so anonymous views aren't deduplicated.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    if not settings.TRUSTED_PROXY_COUNT:
+        return None
+    http_request: HttpRequest = getattr(request, "_request", request)
+    return f"address:{client_address(http_request)}"
+
+
+def record_view(request: Any, slug: str) -> None:
+    view_counter.record(slug, viewer_key(request))
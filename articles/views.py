@@ -1,50 +1,142 @@
-from typing import Any
+from datetime import timedelta
+from heapq import merge
+from itertools import islice, takewhile
+from operator import itemgetter
+from typing import Any, List
 
+from django.conf import settings
+from django.db import connection
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, status
 from rest_framework.filters import SearchFilter
 from rest_framework.permissions import (
+    SAFE_METHODS,
     IsAuthenticated,
     IsAuthenticatedOrReadOnly,
 )
-from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from articles.fastpath import ArticleRowSerializer, article_rows
 from articles.filters import ArticleFilter
-from articles.models import Article
+from articles.models import Article, ArticleTombstone
 from articles.permissions import IsAuthorEditorOrReadOnly
 from articles.serializers import (  # type: ignore[attr-defined]
     ArticleSerializer,
+    ChangesQuerySerializer,
     FavoriteSerializer,
     UnFavoriteSerializer,
 )
+from articles.viewcounts import record_view
+from core.coalesce import CoalescedGetMixin
+from core.profiling import profiled
 
 
-class ArticleListView(generics.ListCreateAPIView):
+class ArticleRowsMixin:
+    """
+    Renders GETs through ArticleRowSerializer instead of ArticleSerializer
+    """
+
+    def get_rows(self) -> Any:
+        return article_rows(
+            self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        )
+
+    def get_row(self) -> Any:
+        """values() counterpart of get_object"""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field  # type: ignore[attr-defined]
+        row = get_object_or_404(
+            self.get_rows(),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},  # type: ignore[attr-defined]
+        )
+        self.check_object_permissions(self.request, row)  # type: ignore[attr-defined]
+        return row
+
+    def represent(self, rows: Any) -> Any:
+        serializer = ArticleRowSerializer(
+            self.get_serializer_context()  # type: ignore[attr-defined]
+        )
+        # profiled requests time it like serializer.data
+        return profiled("serialize", serializer.to_representation)(rows)
+
+
+class CountViewsMixin:
+    """
+    Counts successful GETs as article views, including those answered
+    from the coalescing cache
+    """
+
+    def dispatch(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        response = super().dispatch(request, *args, **kwargs)  # type: ignore[misc]
+        if request.method == "GET" and response.status_code == 200:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field  # type: ignore[attr-defined]
+            record_view(self.request, kwargs[lookup_url_kwarg])  # type: ignore[attr-defined]
+        return response
+
+
+class ArticleListView(
+    ArticleRowsMixin, CoalescedGetMixin, generics.ListCreateAPIView
+):
+    read_from_replica = True
     permission_classes = (IsAuthenticatedOrReadOnly,)
     serializer_class = ArticleSerializer
-    queryset = Article.objects.all()
-    renderer_classes = (JSONRenderer,)
+    queryset = Article.objects.for_display()
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_class = ArticleFilter
 
-    search_fields = [
-        "body",
-        "title",
-        "description",
-        "author__username",
-        "lookup_id",
-        "tags__name",
-    ]
+    @property
+    def search_fields(self) -> List[str]:
+        fields = [
+            "title",
+            "description",
+            "author__username",
+            "lookup_id",
+            "tags__name",
+        ]
+        # the compressed bodies are only searchable through their vectors,
+        # which need Postgres: elsewhere searches skip the bodies
+        if connection.vendor == "postgresql":
+            fields.insert(0, "@article_body__search_vector")
+        return fields
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        rows = self.get_rows()
+        page = self.paginate_queryset(rows)
+        if page is None:
+            return Response(self.represent(list(rows)))
+        return self.get_paginated_response(self.represent(page))
 
-class ArticleDetailView(generics.RetrieveUpdateDestroyAPIView):
+
+class ArticleDetailView(
+    ArticleRowsMixin,
+    CountViewsMixin,
+    CoalescedGetMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
+    read_from_replica = True
     permission_classes = (IsAuthorEditorOrReadOnly,)
     serializer_class = ArticleSerializer
     lookup_field = "slug"
     queryset = Article.objects.all()
-    renderer_classes = (JSONRenderer,)
+
+    def get_queryset(self) -> Any:
+        # writes drop prefetched relations before rendering anyway
+        if self.request.method in SAFE_METHODS:
+            return Article.objects.for_display()
+        return super().get_queryset()
+
+    def retrieve(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        # read permissions pass without looking at the article's fields
+        (article,) = self.represent([self.get_row()])
+        return Response(article)
+
+    def perform_destroy(self, instance: Any) -> None:
+        # purge_deleted removes the reactions, tags and image later
+        instance.soft_delete()
 
     def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """return custom response for DELETE request"""
@@ -55,17 +147,101 @@ class ArticleDetailView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
+class ArticleChangesView(
+    ArticleRowsMixin, CoalescedGetMixin, generics.GenericAPIView
+):
+    """
+    Articles created or changed after the ``since`` cursor, in the order
+    of their last change, and the lookup ids and slugs of those deleted or
+    hidden since. Clients pass the returned cursor as ``since`` until
+    ``has_more`` is false.
+
+    Positions are drawn when a change is written, not when it commits, so
+    a later position can commit first. The feed stops before positions
+    drawn within the last CHANGES_COMMIT_LAG seconds, by when every
+    earlier one has committed, so a cursor never moves past a change that
+    is yet to appear.
+    """
+
+    read_from_replica = True
+    permission_classes = (IsAuthenticatedOrReadOnly,)
+    serializer_class = ArticleSerializer
+    queryset = Article.all_objects.for_display()
+    pagination_class = None
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        query = ChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data["since"]
+        limit = query.validated_data["limit"]
+
+        by_position = itemgetter("change_seq")
+        articles = (
+            Article.all_objects.filter(change_seq__gt=since)
+            .order_by("change_seq")
+            .values(
+                "change_seq",
+                "changed_at",
+                "pk",
+                "lookup_id",
+                "slug",
+                "is_hidden",
+                "deleted_at",
+            )
+        )[: limit + 1]
+        tombstones = (
+            ArticleTombstone.objects.filter(change_seq__gt=since)
+            .order_by("change_seq")
+            .values("change_seq", "changed_at", "lookup_id", "slug")
+        )[: limit + 1]
+        settled = timezone.now() - timedelta(
+            seconds=settings.CHANGES_COMMIT_LAG
+        )
+        changes = list(
+            islice(
+                takewhile(
+                    lambda change: change["changed_at"] <= settled,
+                    merge(articles, tombstones, key=by_position),
+                ),
+                limit + 1,
+            )
+        )
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        live = [
+            change["pk"]
+            for change in changes
+            if "pk" in change
+            and not (change["deleted_at"] or change["is_hidden"])
+        ]
+        rows = {row["pk"]: row for row in self.get_rows().filter(pk__in=live)}
+        return Response(
+            {
+                "cursor": by_position(changes[-1]) if changes else since,
+                "has_more": has_more,
+                "articles": self.represent(
+                    [rows[pk] for pk in live if pk in rows]
+                ),
+                # includes articles deleted while the response was read
+                "deleted": [
+                    {"lookup_id": change["lookup_id"], "slug": change["slug"]}
+                    for change in changes
+                    if change.get("pk") not in rows
+                ],
+            }
+        )
+
+
 class ArticleFavoriteView(generics.UpdateAPIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = FavoriteSerializer
     lookup_field = "slug"
-    queryset = Article.objects.all()
-    renderer_classes = (JSONRenderer,)
+    queryset = Article.objects.select_related("article_body")
 
 
 class ArticleUnFavoriteView(generics.UpdateAPIView):
     permission_classes = (IsAuthenticated,)
     serializer_class = UnFavoriteSerializer
     lookup_field = "slug"
-    queryset = Article.objects.all()
-    renderer_classes = (JSONRenderer,)
+    queryset = Article.objects.select_related("article_body")
@@ -0,0 +1,103 @@
+"""
+Compares throughput and tail latency of the sync stack (gunicorn serving
+core.wsgi) and the async stack (gunicorn with uvicorn workers serving
+core.asgi and the async views) under the same concurrent load.
+
+    python -m benchmarks.asgi_vs_wsgi --requests 2000 --concurrency 64
+
+Both servers use the database from the environment, which should already
+hold articles and follows.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+from benchmarks.load import run_load, wait_for_server
+
+STACKS: Dict[str, Dict] = {
+    "wsgi": {
+        "command": ["gunicorn", "core.wsgi"],
+        "list": "/api/v1/articles/",
+        "detail": "/api/v1/articles/{slug}/detail/",
+    },
+    "asgi": {
+        "command": [
+            "gunicorn",
+            "core.asgi:application",
+            "-k",
+            "uvicorn.workers.UvicornWorker",
+        ],
+        "list": "/api/v1/async/articles/",
+        "detail": "/api/v1/async/articles/{slug}/detail/",
+    },
+}
+
+
+def first_slug(base_url: str) -> str:
+    import http.client
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(base_url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port)
+    connection.request("GET", STACKS["wsgi"]["list"])
+    results = json.loads(connection.getresponse().read())["results"]
+    if not results:
+        sys.exit("the database has no articles to benchmark against")
+    return results[0]["slug"]  # type: ignore[no-any-return]
+
+
+def benchmark(stack: str, args: argparse.Namespace) -> Dict:
+    config = STACKS[stack]
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [
+            *config["command"],
+            "--bind",
+            f"127.0.0.1:{args.port}",
+            "--workers",
+            str(args.workers),
+        ],
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "core.settings"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server(base_url)
+        slug = first_slug(base_url)
+        results = {}
+        for name in ("list", "detail"):
+            paths: List[str] = [config[name].format(slug=slug)]
+            run_load(base_url, paths, args.concurrency, args.concurrency)
+            results[name] = run_load(
+                base_url, paths, args.requests, args.concurrency
+            )
+        return results
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    report = {stack: benchmark(stack, args) for stack in STACKS}
+    for name in ("list", "detail"):
+        sync, asynchronous = report["wsgi"][name], report["asgi"][name]
+        report.setdefault("comparison", {})[name] = {
+            "rps_ratio": asynchronous["rps"] / sync["rps"],
+            "p99_ratio": asynchronous["p99_ms"] / sync["p99_ms"],
+        }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
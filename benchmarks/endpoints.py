@@ -0,0 +1,455 @@
+"""
+Benchmarks the main API endpoints and reports latency percentiles,
+requests per second, queries per request and peak RSS as JSON.
+
+    python -m benchmarks.endpoints --requests 500 --concurrency 8 \
+        --output baseline.json
+    python -m benchmarks.endpoints --compare baseline.json
+
+Requests go through the Django test client in this process, or with
+--transport server through HTTP to a gunicorn server started for the run,
+whose /metrics provide the query counts. Both use the database from the
+environment. The benchmark fixture, users with a known password and their
+articles, is only added to it with --create-fixture.
+"""
+import argparse
+import json
+import os
+import resource
+import secrets
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from threading import local
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.request import Request, urlopen
+from uuid import uuid4
+
+from benchmarks.load import (
+    Sample,
+    peak_rss_mb,
+    run_concurrently,
+    send_request,
+    wait_for_server,
+)
+
+ENDPOINTS = (
+    "articles",
+    "articles-cached",
+    "article-detail",
+    "article-favorite",
+    "users",
+    "user-follow",
+    "login",
+)
+# metrics where a larger value is an improvement
+HIGHER_IS_BETTER = {"rps"}
+COMPARED = ("rps", "p50_ms", "p95_ms", "p99_ms", "queries_per_request")
+
+FIXTURE_EMAIL = "benchmark-reader@example.com"
+FIXTURE_PASSWORD = "benchmark-password"
+
+
+class Call(NamedTuple):
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+    authenticated: bool = False
+
+
+class MissingFixture(Exception):
+    pass
+
+
+class Fixture(NamedTuple):
+    slug: str
+    followed: str
+    token: str
+
+
+def setup_django() -> None:
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    django.setup()
+
+
+def ensure_fixture(
+    articles: int = 50, followers: int = 50, create: bool = True
+) -> Fixture:
+    """
+    Creates the reader the benchmark authenticates as, ``articles`` articles
+    with likes and tags, and a user with ``followers`` followers, unless an
+    earlier run already did. Raises MissingFixture instead of writing to
+    the database when ``create`` is false.
+    """
+    from django.contrib.auth import get_user_model
+
+    from articles.models import Article
+    from users.models import UserFollowing
+    from users.serializers import UserTokenObtainPairSerializer
+
+    User = get_user_model()
+    reader = User.objects.filter(email=FIXTURE_EMAIL).first()
+    # the followed user and its followers
+    users = list(
+        User.objects.filter(username__startswith="benchmark-user-").order_by(
+            "pk"
+        )[: followers + 1]
+    )
+    existing = Article.objects.filter(author=users[0]).count() if users else 0
+    if not create and (
+        reader is None or len(users) <= followers or existing < articles
+    ):
+        raise MissingFixture(
+            "the database has no benchmark fixture, or a smaller one, pass "
+            "--create-fixture to add it"
+        )
+
+    if reader is None:
+        reader = User.objects.create_user(
+            email=FIXTURE_EMAIL,
+            password=FIXTURE_PASSWORD,
+            username="benchmark-reader",
+        )
+    # bulk_create skips the pre_save signal that assigns lookup ids
+    users += User.objects.bulk_create(
+        User(
+            username=f"benchmark-user-{index}",
+            email=f"benchmark-user-{index}@example.com",
+            lookup_id=uuid4().hex,
+        )
+        for index in range(len(users), followers + 1)
+    )
+    followed, users = users[0], users[1:]
+    UserFollowing.objects.bulk_create(
+        [UserFollowing(follower=user, followed=followed) for user in users],
+        ignore_conflicts=True,
+    )
+    # fixtures of earlier versions had it follow itself
+    UserFollowing.objects.filter(follower=followed, followed=followed).delete()
+
+    for index in range(existing, articles):
+        article = Article.objects.create(
+            title=f"Benchmark article {index}",
+            description="Benchmark fixture",
+            body="Lorem ipsum dolor sit amet. " * 50,
+            author=followed,
+        )
+        article.tags.add("benchmark", f"benchmark-{index % 5}")
+        article.likes.add(*users[: followers // 2])
+        article.dislikes.add(*users[followers // 2 :])
+
+    token = UserTokenObtainPairSerializer.get_token(reader).access_token
+    return Fixture(
+        slug=Article.objects.filter(author=followed).first().slug,
+        followed=followed.lookup_id,
+        token=str(token),
+    )
+
+
+def endpoint_calls(fixture: Fixture) -> Dict[str, Call]:
+    from rest_framework.reverse import reverse
+
+    # anonymous GETs of the articles are answered from the coalescing
+    # cache, so only articles-cached leaves out the token
+    return {
+        "articles": Call("GET", reverse("articles"), authenticated=True),
+        "articles-cached": Call("GET", reverse("articles")),
+        "article-detail": Call(
+            "GET",
+            reverse("article-detail", kwargs={"slug": fixture.slug}),
+            authenticated=True,
+        ),
+        # toggles the like on every request
+        "article-favorite": Call(
+            "PATCH",
+            reverse("article-favorite", kwargs={"slug": fixture.slug}),
+            authenticated=True,
+        ),
+        "users": Call("GET", reverse("users"), authenticated=True),
+        "user-follow": Call(
+            "GET",
+            reverse("user-follow", kwargs={"lookup_id": fixture.followed}),
+            authenticated=True,
+        ),
+        "login": Call(
+            "POST",
+            reverse("login"),
+            body={"email": FIXTURE_EMAIL, "password": FIXTURE_PASSWORD},
+        ),
+    }
+
+
+def client_sender(call: Call, token: str) -> Callable[[int], Sample]:
+    """
+    Sends ``call`` through a Django test client per thread, counting the
+    queries of each request
+    """
+    from django.db import connections
+    from django.test import Client
+
+    clients = local()
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    body = json.dumps(call.body) if call.body is not None else ""
+
+    def send(index: int) -> Sample:
+        if not hasattr(clients, "client"):
+            clients.client = Client()
+        queries = 0
+
+        def count(execute: Callable, *args: Any) -> Any:
+            nonlocal queries
+            queries += 1
+            return execute(*args)
+
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(count))
+            response = clients.client.generic(
+                call.method,
+                call.path,
+                body,
+                content_type="application/json",
+                **(headers if call.authenticated else {}),
+            )
+        return Sample(
+            response.status_code, time.perf_counter() - started, queries
+        )
+
+    return send
+
+
+def server_sender(
+    base_url: str, call: Call, token: str
+) -> Callable[[int], Sample]:
+    headers = {"Content-Type": "application/json"}
+    if call.authenticated:
+        headers["Authorization"] = f"Bearer {token}"
+    body = json.dumps(call.body).encode() if call.body is not None else None
+    return lambda index: send_request(
+        base_url, call.path, headers, call.method, body
+    )
+
+
+def server_queries(base_url: str, token: str) -> Dict[str, Tuple]:
+    """
+    Database queries and requests per URL name so far, read from the
+    server's /metrics
+    """
+    from prometheus_client.parser import text_string_to_metric_families
+
+    request = Request(
+        f"{base_url}/metrics", headers={"Authorization": f"Bearer {token}"}
+    )
+    with urlopen(request, timeout=30) as response:
+        text = response.read().decode()
+    totals: Dict[str, List[float]] = {}
+    for family in text_string_to_metric_families(text):
+        for sample in family.samples:
+            if sample.name == "db_queries_total":
+                index = 0
+            elif sample.name == "http_request_duration_seconds_count":
+                index = 1
+            else:
+                continue
+            name = sample.labels["url_name"]
+            totals.setdefault(name, [0.0, 0.0])[index] += sample.value
+    return {name: tuple(total) for name, total in totals.items()}
+
+
+def measure(
+    senders: Dict[str, Callable[[int], Sample]],
+    requests: int,
+    concurrency: int,
+    queries: Optional[Callable[[], Dict[str, Tuple]]] = None,
+) -> Dict[str, Dict]:
+    """
+    Runs every sender after a warm-up. ``queries``, when given, reports the
+    queries and requests per URL name so far, which replaces the query
+    counts of the samples.
+    """
+    results = {}
+    for name, send in senders.items():
+        # warms up connections and caches
+        run_concurrently(send, concurrency, concurrency)
+        before = queries() if queries else {}
+        results[name] = run_concurrently(send, requests, concurrency)
+        if queries is not None:
+            ran, served = (
+                after - start
+                for after, start in zip(
+                    queries().get(name, (0, 0)), before.get(name, (0, 0))
+                )
+            )
+            results[name]["queries_per_request"] = (
+                ran / served if served else None
+            )
+    return results
+
+
+def run_client(
+    calls: Dict[str, Call], token: str, args: argparse.Namespace
+) -> Dict[str, Any]:
+    from django.test.utils import setup_test_environment
+
+    # allows the test client's host and keeps emails in memory
+    setup_test_environment()
+    results = measure(
+        {name: client_sender(call, token) for name, call in calls.items()},
+        args.requests,
+        args.concurrency,
+    )
+    return {"endpoints": results, "peak_rss_mb": peak_rss_mb()}
+
+
+def run_server(
+    calls: Dict[str, Call], token: str, args: argparse.Namespace
+) -> Dict[str, Any]:
+    base_url = f"http://127.0.0.1:{args.port}"
+    metrics_token = secrets.token_hex(16)
+    server = subprocess.Popen(
+        [
+            "gunicorn",
+            "core.wsgi",
+            "--bind",
+            f"127.0.0.1:{args.port}",
+            "--workers",
+            str(args.workers),
+        ],
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "core.settings",
+            # timed without the profiling overhead, queries come from
+            # /metrics
+            "REQUEST_PROFILING": "False",
+            "METRICS_TOKEN": metrics_token,
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server(base_url)
+        results = measure(
+            {
+                name: server_sender(base_url, call, token)
+                for name, call in calls.items()
+            },
+            args.requests,
+            args.concurrency,
+            lambda: server_queries(base_url, metrics_token),
+        )
+    finally:
+        server.terminate()
+        server.wait()
+    # the largest of the server's processes, once they have all exited
+    return {
+        "endpoints": results,
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], report: Dict[str, Any], tolerance: float
+) -> Dict[str, Any]:
+    """
+    Relative change of every metric against ``baseline``, and the metrics
+    that got worse by more than ``tolerance``, e.g. 0.1 for 10%. Any
+    additional query per request is a regression.
+    """
+    changes: Dict[str, Dict] = {}
+    regressions: List[str] = []
+    for name, current in report["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if before is None:
+            continue
+        for metric in COMPARED:
+            old, new = before.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            changes.setdefault(name, {})[metric] = round(change, 4)
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            limit = 0 if metric == "queries_per_request" else tolerance
+            if worse > limit:
+                regressions.append(f"{name} {metric}: {old:.2f} -> {new:.2f}")
+    old_rss, new_rss = baseline.get("peak_rss_mb"), report["peak_rss_mb"]
+    if old_rss and new_rss and (new_rss - old_rss) / old_rss > tolerance:
+        regressions.append(f"peak_rss_mb: {old_rss:.1f} -> {new_rss:.1f}")
+    return {"changes": changes, "regressions": regressions}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--transport", choices=("client", "server"), default="client"
+    )
+    parser.add_argument("--endpoint", action="append", choices=ENDPOINTS)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--followers", type=int, default=50)
+    parser.add_argument(
+        "--create-fixture",
+        action="store_true",
+        help="add the benchmark users, with a fixed password, and articles "
+        "to the database if they are missing",
+    )
+    parser.add_argument("--output", help="also write the report to a file")
+    parser.add_argument(
+        "--compare", help="a saved report to compare the results with"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="relative slowdown allowed before --compare fails",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as saved:
+            baseline = json.load(saved)
+        if baseline.get("transport") != args.transport:
+            parser.error(
+                f"{args.compare} was measured with the "
+                f"{baseline.get('transport')} transport"
+            )
+
+    setup_django()
+    try:
+        fixture = ensure_fixture(
+            args.articles, args.followers, args.create_fixture
+        )
+    except MissingFixture as error:
+        parser.error(str(error))
+    calls = {
+        name: call
+        for name, call in endpoint_calls(fixture).items()
+        if name in (args.endpoint or ENDPOINTS)
+    }
+    run = run_server if args.transport == "server" else run_client
+    report = {
+        "transport": args.transport,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        **run(calls, fixture.token, args),
+    }
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if baseline is not None:
+        report["comparison"] = compare(baseline, report, args.tolerance)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if report.get("comparison", {}).get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import http.client
+import math
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+from typing import Callable, Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+_connections = local()
+
+
+class Sample(NamedTuple):
+    status: int
+    latency: float
+    # database queries the request ran, None when they aren't known
+    queries: Optional[int] = None
+
+
+def percentile(values: List[float], rank: float) -> float:
+    """
+    Nearest-rank percentile of ``values``
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(rank / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def server_timing_queries(header: Optional[str]) -> Optional[int]:
+    """
+    Query count from the Server-Timing header set by ProfilingMiddleware
+    """
+    match = re.search(r'db;[^,]*desc="(\d+) queries"', header or "")
+    return int(match.group(1)) if match else None
+
+
+def send_request(
+    base_url: str,
+    path: str,
+    headers: Dict[str, str],
+    method: str = "GET",
+    body: Optional[bytes] = None,
+) -> Sample:
+    """
+    Sends one request over this thread's keep-alive connection
+    """
+    parts = urlsplit(base_url)
+    connection: Optional[http.client.HTTPConnection] = getattr(
+        _connections, "connection", None
+    )
+    if connection is None:
+        connection = http.client.HTTPConnection(
+            parts.hostname, parts.port, timeout=30
+        )
+        _connections.connection = connection
+    started = time.perf_counter()
+    try:
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+    except (http.client.HTTPException, OSError):
+        connection.close()
+        _connections.connection = None
+        return Sample(0, time.perf_counter() - started)
+    return Sample(
+        response.status,
+        time.perf_counter() - started,
+        server_timing_queries(response.getheader("Server-Timing")),
+    )
+
+
+def run_concurrently(
+    send: Callable[[int], Sample], requests: int, concurrency: int
+) -> Dict[str, Optional[float]]:
+    """
+    Calls ``send`` with the indexes 0 to ``requests`` - 1 from
+    ``concurrency`` threads and summarizes throughput and latency
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(send, range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies = [sample.latency for sample in samples]
+    queries = [
+        sample.queries for sample in samples if sample.queries is not None
+    ]
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(
+            1 for sample in samples if not 200 <= sample.status < 300
+        ),
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "queries_per_request": (
+            sum(queries) / len(queries) if queries else None
+        ),
+    }
+
+
+def run_load(
+    base_url: str,
+    paths: List[str],
+    requests: int,
+    concurrency: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Optional[float]]:
+    """
+    Sends ``requests`` GETs cycling through ``paths`` from ``concurrency``
+    keep-alive connections and summarizes throughput and latency
+    """
+    return run_concurrently(
+        lambda index: send_request(
+            base_url, paths[index % len(paths)], headers or {}
+        ),
+        requests,
+        concurrency,
+    )
+
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """
+    Peak resident set size of this process, or with RUSAGE_CHILDREN of its
+    largest waited-for descendant
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def wait_for_server(base_url: str, timeout: float = 30.0) -> None:
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(
+                parts.hostname, parts.port, timeout=1
+            )
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"{base_url} did not start within {timeout}s")
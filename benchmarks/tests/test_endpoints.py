@@ -0,0 +1,110 @@
+from django.test import TestCase
+
+from articles.models import Article
+from benchmarks.endpoints import (
+    ENDPOINTS,
+    MissingFixture,
+    client_sender,
+    compare,
+    endpoint_calls,
+    ensure_fixture,
+    measure,
+)
+from benchmarks.load import Sample, percentile, server_timing_queries
+from users.models import UserFollowing
+
+
+def report(**metrics: float) -> dict:
+    endpoint = {
+        "rps": 100.0,
+        "p50_ms": 10.0,
+        "p95_ms": 20.0,
+        "p99_ms": 30.0,
+        "queries_per_request": 4.0,
+    }
+    return {"endpoints": {"articles": {**endpoint, **metrics}}}
+
+
+class TestLoad(TestCase):
+    def test_percentile(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_server_timing_queries(self) -> None:
+        header = 'db;dur=1.5;desc="7 queries", auth;dur=0.2, total;dur=3.0'
+        self.assertEqual(server_timing_queries(header), 7)
+        self.assertIsNone(server_timing_queries(None))
+
+
+class TestCompare(TestCase):
+    def test_within_tolerance(self) -> None:
+        baseline = {**report(), "peak_rss_mb": 100.0}
+        current = {**report(p95_ms=21.0, rps=95.0), "peak_rss_mb": 105.0}
+        comparison = compare(baseline, current, tolerance=0.1)
+        self.assertEqual(comparison["regressions"], [])
+        self.assertEqual(comparison["changes"]["articles"]["p95_ms"], 0.05)
+
+    def test_regressions(self) -> None:
+        baseline = {**report(), "peak_rss_mb": 100.0}
+        current = {
+            **report(p99_ms=60.0, rps=50.0, queries_per_request=5.0),
+            "peak_rss_mb": 100.0,
+        }
+        regressions = compare(baseline, current, 0.1)["regressions"]
+        self.assertEqual(
+            regressions,
+            [
+                "articles rps: 100.00 -> 50.00",
+                "articles p99_ms: 30.00 -> 60.00",
+                "articles queries_per_request: 4.00 -> 5.00",
+            ],
+        )
+
+
+class TestEndpoints(TestCase):
+    def test_fixture_is_reused(self) -> None:
+        fixture = ensure_fixture(articles=3, followers=4)
+        again = ensure_fixture(articles=3, followers=4)
+        self.assertEqual(again[:2], fixture[:2])
+        self.assertEqual(Article.objects.count(), 3)
+        follows = UserFollowing.objects.filter(
+            followed__lookup_id=fixture.followed
+        )
+        self.assertEqual(follows.count(), 4)
+        self.assertFalse(follows.filter(follower__lookup_id=fixture.followed))
+
+    def test_fixture_is_only_created_on_request(self) -> None:
+        with self.assertRaises(MissingFixture):
+            ensure_fixture(articles=3, followers=4, create=False)
+        self.assertFalse(Article.objects.exists())
+        fixture = ensure_fixture(articles=3, followers=4)
+        self.assertEqual(
+            ensure_fixture(articles=3, followers=4, create=False)[:2],
+            fixture[:2],
+        )
+        with self.assertRaises(MissingFixture):
+            ensure_fixture(articles=5, followers=4, create=False)
+
+    def test_server_query_counts(self) -> None:
+        totals = iter([{}, {"articles": (12.0, 4.0)}])
+        results = measure(
+            {"articles": lambda index: Sample(200, 0.01)},
+            requests=4,
+            concurrency=2,
+            queries=lambda: next(totals),
+        )
+        self.assertEqual(results["articles"]["queries_per_request"], 3.0)
+
+    def test_every_endpoint_succeeds(self) -> None:
+        fixture = ensure_fixture(articles=3, followers=4)
+        calls = endpoint_calls(fixture)
+        self.assertEqual(tuple(calls), ENDPOINTS)
+        # the views themselves are timed, not the coalescing cache
+        self.assertTrue(calls["articles"].authenticated)
+        self.assertTrue(calls["article-detail"].authenticated)
+        for name, call in calls.items():
+            sample = client_sender(call, fixture.token)(0)
+            self.assertEqual(sample.status, 200, name)
+            self.assertIsNotNone(sample.queries)
@@ -0,0 +1,17 @@
+from typing import Iterator
+
+import pytest
+
+pytest_plugins = ["core.querybudget"]
+
+
+@pytest.fixture(autouse=True)
+def _view_counter() -> Iterator[None]:
+    """
+    Starts every test without buffered article views, so no flush of an
+    earlier test's views lands in its queries
+    """
+    from articles.viewcounts import view_counter
+
+    view_counter.reset()
+    yield
@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class CoreConfig(AppConfig):
+    name = "core"
+
+    def ready(self) -> None:
+        # cloudinary is already imported by the models' CloudinaryField, so
+        # configuring it here adds nothing to settings import time
+        import cloudinary
+
+        cloudinary.config(**settings.CLOUDINARY)
+
+        # installs the query observer on connections as they open
+        from core import checks  # noqa: F401
+        from core import profiling  # noqa: F401
@@ -8,9 +8,43 @@ https://docs.djangoproject.com/en/4.0/howto/deployment/asgi/
 """
 
 import os
+from typing import Any, Callable, Dict
 
-from django.core.asgi import get_asgi_application
+import django
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
-application = get_asgi_application()
+
+class Handler(ASGIHandler):
+    """
+    Django's ASGI handler running ASGI_MIDDLEWARE instead of MIDDLEWARE
+    """
+
+    def load_middleware(self, is_async: bool = False) -> None:
+        middleware = settings.MIDDLEWARE
+        settings.MIDDLEWARE = settings.ASGI_MIDDLEWARE
+        try:
+            super().load_middleware(is_async)
+        finally:
+            settings.MIDDLEWARE = middleware
+
+
+django.setup(set_prefix=False)
+django_application = Handler()
+
+# imported once Django is set up
+from core.events import stream  # noqa: E402
+
+
+async def application(
+    scope: Dict[str, Any], receive: Callable, send: Callable
+) -> None:
+    """
+    Serves the event stream at EVENTS_PATH and everything else with Django
+    """
+    if scope["type"] == "http" and scope["path"] == settings.EVENTS_PATH:
+        await stream(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -0,0 +1,29 @@
+"""
+System checks of the core settings, run by manage.py commands such as the
+release phase's migrate.
+"""
+from typing import Any, List
+
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+@register()
+def check_events_backend(app_configs: Any, **kwargs: Any) -> List[Error]:
+    """
+    Outside DEBUG the API and the event streams run in separate processes,
+    the Procfile's web and asgi, so events need a backend shared by both
+    """
+    if settings.DEBUG or settings.EVENTS_BACKEND != "core.events.LocalBackend":
+        return []
+    return [
+        Error(
+            "EVENTS_BACKEND is LocalBackend, whose events never leave the "
+            "process publishing them.",
+            hint=(
+                "Set REDIS_URL, or silence core.E001 when one process "
+                "serves both the API and the event streams."
+            ),
+            id="core.E001",
+        )
+    ]
@@ -0,0 +1,135 @@
+import time
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+
+from core.metrics import record_cache
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.event = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time in this process; callers that
+    arrive while it runs wait for it and share its result
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, _Call] = {}
+        self.lock = Lock()
+
+    def do(self, key: str, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Returns the result of ``function`` and whether it was shared with
+        another caller
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+        return call.result, False
+
+
+single_flight = SingleFlight()
+
+# (status code, headers, content) of a rendered response
+Payload = Tuple[int, list, bytes]
+
+
+def cached_payload(key: str, compute: Callable[[], Payload]) -> Payload:
+    """
+    Serves the payload from the shared cache, letting a single worker
+    recompute it on a miss while the others wait for the cache to fill
+    """
+    payload = cache.get(key)
+    record_cache("coalesce", payload is not None)
+    if payload is not None:
+        return payload  # type: ignore[no-any-return]
+
+    lock_timeout = settings.COALESCE_LOCK_TIMEOUT
+    if not cache.add(f"{key}:lock", 1, lock_timeout):
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+            payload = cache.get(key)
+            if payload is not None:
+                return payload  # type: ignore[no-any-return]
+
+    try:
+        payload = compute()
+        if payload[0] == 200:
+            cache.set(key, payload, settings.COALESCE_CACHE_TTL)
+    finally:
+        cache.delete(f"{key}:lock")
+    return payload
+
+
+class CoalescedGetMixin:
+    """
+    Coalesces identical anonymous GET requests: one request per worker
+    renders the response, concurrent duplicates reuse it, and a short-lived
+    cache entry guarded by a lock stops other workers from stampeding
+    """
+
+    def should_coalesce(self, request: HttpRequest) -> bool:
+        return (
+            request.method == "GET"
+            and "HTTP_AUTHORIZATION" not in request.META
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        )
+
+    def coalesce_key(self, request: HttpRequest) -> str:
+        accept = request.META.get("HTTP_ACCEPT", "")
+        return f"coalesce:{request.get_full_path()}:{accept}"
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if not self.should_coalesce(request):
+            return super().dispatch(  # type: ignore[misc]
+                request, *args, **kwargs
+            )
+
+        def render() -> Payload:
+            response = super(CoalescedGetMixin, self).dispatch(  # type: ignore[misc]
+                request, *args, **kwargs
+            )
+            if hasattr(response, "render"):
+                response.render()
+            return (
+                response.status_code,
+                list(response.items()),
+                response.content,
+            )
+
+        key = self.coalesce_key(request)
+        (status_code, headers, content), _ = single_flight.do(
+            key, lambda: cached_payload(key, render)
+        )
+        response = HttpResponse(content, status=status_code)
+        for header, value in headers:
+            response[header] = value
+        return response
@@ -0,0 +1,123 @@
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_safe
+
+
+class Document(NamedTuple):
+    content: bytes
+    etag: str
+
+
+def api_info() -> Any:
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="CONVINT API",
+        default_version="v1",
+        description="CONVINT documentation",
+        terms_of_service="https://www.skaehub.com/policies/terms/",
+        license=openapi.License(name="BSD License"),
+    )
+
+
+def generate_schema() -> bytes:
+    """
+    Introspects every endpoint and serializer into the OpenAPI document.
+    It is built without a request so the output doesn't depend on the host.
+    """
+    from drf_yasg.codecs import OpenAPICodecJson
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    schema = OpenAPISchemaGenerator(api_info()).get_schema(public=True)
+    return OpenAPICodecJson(  # type: ignore[no-any-return]
+        validators=[], pretty=True
+    ).encode(schema)
+
+
+def document(content: bytes) -> Document:
+    return Document(content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: Path) -> Document:
+    """
+    Returns the schema stored by ``manage.py build_schema``, generating it
+    once in this process when the file is missing
+    """
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        content = generate_schema()
+    return document(content)
+
+
+@lru_cache(maxsize=None)
+def load_schema_yaml(path: Path) -> Document:
+    from drf_yasg.codecs import yaml_sane_dump
+
+    data = json.loads(load_schema(path).content, object_pairs_hook=OrderedDict)
+    return document(yaml_sane_dump(data, binary=True))
+
+
+def schema_response(loaded: Document, content_type: str) -> HttpResponse:
+    response = HttpResponse(loaded.content, content_type=content_type)
+    patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+@require_safe
+@condition(
+    etag_func=lambda request: load_schema(settings.OPENAPI_SCHEMA_PATH).etag
+)
+def schema_json(request: HttpRequest) -> HttpResponse:
+    return schema_response(
+        load_schema(settings.OPENAPI_SCHEMA_PATH), "application/json"
+    )
+
+
+@require_safe
+@condition(
+    etag_func=lambda request: load_schema_yaml(
+        settings.OPENAPI_SCHEMA_PATH
+    ).etag
+)
+def schema_yaml(request: HttpRequest) -> HttpResponse:
+    return schema_response(
+        load_schema_yaml(settings.OPENAPI_SCHEMA_PATH), "application/yaml"
+    )
+
+
+@require_safe
+def swagger_ui(request: HttpRequest) -> HttpResponse:
+    """
+    Renders the Swagger UI page, which fetches the stored schema from
+    SWAGGER_SETTINGS["SPEC_URL"]
+    """
+    if request.GET.get("format") == "openapi":
+        return schema_json(request)  # type: ignore[no-any-return]
+
+    from drf_yasg import openapi
+    from drf_yasg.renderers import SwaggerUIRenderer
+
+    info = json.loads(load_schema(settings.OPENAPI_SCHEMA_PATH).content)[
+        "info"
+    ]
+    swagger = openapi.Swagger(
+        info=openapi.Info(
+            title=info["title"], default_version=info["version"]
+        ),
+        _prefix="/",
+        paths=openapi.Paths(paths={}),
+    )
+    content = SwaggerUIRenderer().render(
+        swagger, renderer_context={"request": request}
+    )
+    return HttpResponse(content, content_type="text/html; charset=utf-8")
@@ -0,0 +1,236 @@
+"""
+Server-Sent Events pushed to clients instead of having them poll.
+
+Code anywhere publishes events with ``broker.publish(name, data)``. The
+broker hands them to the backend named by EVENTS_BACKEND: LocalBackend
+delivers them to the streams of this process only, RedisBackend through a
+Redis channel to the streams of every process subscribed to it. The
+Procfile serves the API and the streams from separate processes, so
+deployments need RedisBackend, which the core.E001 check enforces. Each open
+stream is an ``asyncio.Queue`` on the event loop of the ASGI server,
+filled thread-safely, so an idle client costs a queue and a coroutine
+rather than a worker. ``stream`` is the ASGI application serving them,
+mounted at EVENTS_PATH by ``core.asgi``.
+"""
+import asyncio
+import logging
+from threading import Lock
+from time import sleep
+from typing import Any, Callable, Dict, NamedTuple, Set
+
+import orjson
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+from core.metrics import EVENT_STREAMS
+from core.renderers import encode_default
+
+logger = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    name: str
+    data: Dict[str, Any]
+
+    def encode(self) -> bytes:
+        data = orjson.dumps(
+            self.data, default=encode_default, option=orjson.OPT_UTC_Z
+        )
+        return b"event: " + self.name.encode() + b"\ndata: " + data + b"\n\n"
+
+
+class LocalBackend:
+    """
+    Delivers events to the streams of the publishing process
+    """
+
+    def __init__(self, deliver: Callable[[Event], None]) -> None:
+        self.deliver = deliver
+
+    def listen(self) -> None:
+        pass
+
+    def publish(self, event: Event) -> None:
+        self.deliver(event)
+
+
+class RedisBackend:
+    """
+    Delivers events to the streams of every process through a Redis
+    channel. Processes only subscribe once a stream opens, so publishing
+    from the WSGI workers costs one PUBLISH per event.
+    """
+
+    channel = "events"
+    # seconds between reconnection attempts while Redis is unreachable
+    reconnect_interval = 1
+
+    def __init__(self, deliver: Callable[[Event], None]) -> None:
+        import redis
+
+        self.deliver = deliver
+        self.errors = redis.RedisError
+        self.client = redis.Redis.from_url(settings.EVENTS_REDIS_URL)
+        self.listener: Any = None
+        self.lock = Lock()
+
+    def receive(self, message: Dict[str, Any]) -> None:
+        name, data = orjson.loads(message["data"])
+        self.deliver(Event(name, data))
+
+    def listen(self) -> None:
+        with self.lock:
+            if self.listener is not None and self.listener.is_alive():
+                return
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self.receive})
+            self.listener = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self.recover
+            )
+
+    def recover(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        """
+        Keeps the listener thread running through errors, its next read
+        reconnects and subscribes again
+        """
+        logger.warning("Events listener failed: %r", error)
+        sleep(self.reconnect_interval)
+
+    def publish(self, event: Event) -> None:
+        message = orjson.dumps(
+            [event.name, event.data],
+            default=encode_default,
+            option=orjson.OPT_UTC_Z,
+        )
+        try:
+            self.client.publish(self.channel, message)
+        except self.errors:
+            # events are best effort, the write they announce is committed
+            pass
+
+
+class Broker:
+    def __init__(self, queue_size: int = 100) -> None:
+        self.queue_size = queue_size
+        # the queues of each loop, only changed on that loop's thread
+        self.streams: Dict[asyncio.AbstractEventLoop, Set[asyncio.Queue]] = {}
+        self.loops: Dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self.lock = Lock()
+
+    @cached_property
+    def backend(self) -> Any:
+        return import_string(settings.EVENTS_BACKEND)(self.deliver)
+
+    def publish(self, name: str, data: Dict[str, Any]) -> None:
+        self.backend.publish(Event(name, data))
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        A queue receiving the events from now on, on the running loop
+        """
+        self.backend.listen()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        with self.lock:
+            self.streams.setdefault(loop, set()).add(queue)
+            self.loops[queue] = loop
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self.lock:
+            loop = self.loops.pop(queue)
+            queues = self.streams[loop]
+            queues.discard(queue)
+            if not queues:
+                del self.streams[loop]
+
+    def deliver(self, event: Event) -> None:
+        with self.lock:
+            streams = list(self.streams.items())
+        # one callback per loop rather than per stream
+        for loop, queues in streams:
+            loop.call_soon_threadsafe(self.fan_out, queues, event)
+
+    @classmethod
+    def fan_out(cls, queues: Set[asyncio.Queue], event: Event) -> None:
+        for queue in queues:
+            cls.put(queue, event)
+
+    @staticmethod
+    def put(queue: asyncio.Queue, event: Event) -> None:
+        # a client that can't keep up misses the oldest events
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+broker = Broker(settings.EVENTS_QUEUE_SIZE)
+
+HEADERS = [
+    (b"content-type", b"text/event-stream"),
+    (b"cache-control", b"no-cache"),
+    # stops nginx from buffering the stream
+    (b"x-accel-buffering", b"no"),
+]
+
+
+async def stream(
+    scope: Dict[str, Any], receive: Callable, send: Callable
+) -> None:
+    """
+    ASGI application streaming the broker's events until the client
+    disconnects, with a comment line every EVENTS_HEARTBEAT_INTERVAL
+    seconds so proxies keep idle connections open
+    """
+    if scope["method"] != "GET":
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 405,
+                "headers": [(b"allow", b"GET")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    queue = broker.subscribe()
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    EVENT_STREAMS.inc()
+    try:
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": HEADERS}
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": f"retry: {settings.EVENTS_RETRY_MS}\n\n".encode(),
+                "more_body": True,
+            }
+        )
+        while not disconnected.done():
+            received = asyncio.ensure_future(queue.get())
+            await asyncio.wait(
+                {received, disconnected},
+                timeout=settings.EVENTS_HEARTBEAT_INTERVAL,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not received.done():
+                received.cancel()
+                if disconnected.done():
+                    break
+                body = b": heartbeat\n\n"
+            else:
+                body = received.result().encode()
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+    finally:
+        EVENT_STREAMS.dec()
+        broker.unsubscribe(queue)
+        disconnected.cancel()
+
+
+async def wait_for_disconnect(receive: Callable) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
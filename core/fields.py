@@ -0,0 +1,134 @@
+"""
+Model fields for large article text.
+
+CompressedTextField stores text in a binary column behind a one-byte
+header: zlib-compressed from ``threshold`` UTF-8 bytes on, as is below,
+where compression doesn't pay. Loaded values stay compressed until the
+attribute is read, so rows fetched for their other columns never pay for
+decompression. values() returns the stored bytes, which ``decompress``
+turns back into text.
+
+Compressed text stays searchable through a contrib.postgres
+SearchVectorField filled with ``search_vector`` and matched with the
+``search`` lookup. Only Postgres has search vectors: other databases keep
+the column NULL and can't search it.
+"""
+import zlib
+from typing import Any, Optional
+
+from django import forms
+from django.conf import settings
+from django.contrib.postgres.lookups import SearchLookup
+from django.contrib.postgres.search import (
+    CombinedSearchQuery,
+    SearchQuery,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import connection, models
+from django.db.models.query_utils import DeferredAttribute
+
+RAW = b"\x00"
+ZLIB = b"\x01"
+
+
+def compress(text: str, threshold: int, level: int) -> bytes:
+    data = text.encode()
+    if len(data) < threshold:
+        return RAW + data
+    return ZLIB + zlib.compress(data, level)
+
+
+def decompress(value: Any) -> Optional[str]:
+    """
+    Text of a stored value, also accepting text that was never stored
+    """
+    if value is None or isinstance(value, str):
+        return value
+    data = bytes(value)
+    if data[:1] == ZLIB:
+        return zlib.decompress(data[1:]).decode()
+    return data[1:].decode()
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    def __get__(self, instance: Any, cls: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, (bytes, memoryview)):
+            # decompressed once, on first read
+            value = instance.__dict__[self.field.attname] = decompress(value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # makes this a data descriptor, read even once the value is loaded
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.BinaryField):
+    descriptor_class = CompressedTextDescriptor
+
+    def __init__(
+        self, *args: Any, threshold: int = 256, level: int = 6, **kwargs: Any
+    ) -> None:
+        self.threshold = threshold
+        self.level = level
+        kwargs.setdefault("editable", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self) -> Any:
+        name, path, args, kwargs = super().deconstruct()
+        if self.threshold != 256:
+            kwargs["threshold"] = self.threshold
+        if self.level != 6:
+            kwargs["level"] = self.level
+        # BinaryField leaves out editable=False, its default
+        if kwargs.get("editable") is True:
+            del kwargs["editable"]
+        else:
+            kwargs["editable"] = False
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance: Any, add: bool) -> Any:
+        # saving a row that was never read doesn't decompress it
+        return model_instance.__dict__.get(self.attname)
+
+    def get_prep_value(self, value: Any) -> Any:
+        value = super().get_prep_value(value)
+        if isinstance(value, str):
+            return compress(value, self.threshold, self.level)
+        return value
+
+    def to_python(self, value: Any) -> Any:
+        return decompress(value)
+
+    def value_to_string(self, obj: Any) -> Any:
+        return self.value_from_object(obj)
+
+    def formfield(self, **kwargs: Any) -> Any:
+        return super().formfield(**{"widget": forms.Textarea, **kwargs})
+
+
+def search_vector(text: str) -> Optional[SearchVector]:
+    """
+    Search vector of ``text``, computed by the database on Postgres and
+    left NULL elsewhere
+    """
+    if connection.vendor != "postgresql":
+        return None
+    return SearchVector(models.Value(text), config=settings.SEARCH_CONFIG)
+
+
+@SearchVectorField.register_lookup
+class VectorSearchLookup(SearchLookup):
+    """
+    ``field__search=terms`` on a search vector column, the lookup of DRF's
+    ``@`` search fields, parsing the terms in SEARCH_CONFIG like the
+    vectors
+    """
+
+    def process_rhs(self, qn: Any, connection: Any) -> Any:
+        if not isinstance(self.rhs, (SearchQuery, CombinedSearchQuery)):
+            self.rhs = SearchQuery(self.rhs, config=settings.SEARCH_CONFIG)
+        return super().process_rhs(qn, connection)
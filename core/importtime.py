@@ -0,0 +1,65 @@
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# code run in a fresh interpreter for each startup target
+TARGETS = {
+    "settings": "import core.settings",
+    "setup": "import django; django.setup()",
+    "urls": "import django; django.setup(); import core.urls",
+    "wsgi": "import core.wsgi",
+    "asgi": "import core.asgi",
+}
+
+
+class ModuleTime(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ModuleTime]:
+    """
+    Parses the ``-X importtime`` report written to stderr
+    """
+    modules = []
+    for line in output.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append(
+                ModuleTime(
+                    name, int(self_us), int(cumulative_us), len(indent) // 2
+                )
+            )
+    return modules
+
+
+def profile_imports(target: str) -> List[ModuleTime]:
+    """
+    Imports ``target`` in a fresh interpreter and returns its import times
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TARGETS[target]],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse_importtime(result.stderr)
+
+
+def summarize(modules: List[ModuleTime]) -> Dict[str, int]:
+    """
+    Sums self time per top-level package, in microseconds
+    """
+    packages: Dict[str, int] = {}
+    for module in modules:
+        package = module.name.split(".")[0]
+        packages[package] = packages.get(package, 0) + module.self_us
+    return packages
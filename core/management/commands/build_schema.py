@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from core.docs import generate_schema
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI schema served by /docs/"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="fail if the stored schema differs from the code",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = settings.OPENAPI_SCHEMA_PATH
+        schema = generate_schema()
+
+        if options["check"]:
+            if not path.exists() or path.read_bytes() != schema:
+                raise CommandError(
+                    f"{path} is stale, run 'python manage.py build_schema'"
+                )
+            self.stdout.write(self.style.SUCCESS(f"{path} is up to date"))
+            return
+
+        path.write_bytes(schema)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.purge import purge_deleted
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove soft-deleted users and articles with the rows referencing "
+        "them, in batches"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="number of rows deleted per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        counts = purge_deleted(
+            options["batch_size"],
+            progress=lambda message: self.stdout.write(message),
+        )
+        summary = ", ".join(
+            f"{count} {name}" for name, count in sorted(counts.items())
+        )
+        self.stdout.write(self.style.SUCCESS(f"Purged {summary or 'nothing'}"))
@@ -0,0 +1,100 @@
+import time
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import connection
+
+from core.seeding import make_plan, seed
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic dataset of users, articles, "
+        "tags, reactions and follows for load testing"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="the same seed generates the same dataset",
+        )
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--articles", type=int, default=50_000)
+        parser.add_argument("--tags", type=int, default=500)
+        parser.add_argument(
+            "--follows-per-user",
+            type=float,
+            default=20,
+            help="average, the counts per user follow a power law",
+        )
+        parser.add_argument(
+            "--reactions-per-article",
+            type=float,
+            default=30,
+            help="average likes and dislikes, following a power law",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="rows generated and written per transaction",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="processes writing chunks in parallel, Postgres only",
+        )
+        parser.add_argument(
+            "--password",
+            default="password",
+            help="password of every generated user, hashed once",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if min(options["users"], options["tags"], options["chunk_size"]) < 1:
+            raise CommandError("--users, --tags and --chunk-size must be > 0")
+        prefix = f"seed{options['seed']}-"
+        if (
+            get_user_model()
+            .objects.filter(username__startswith=prefix)
+            .exists()
+        ):
+            raise CommandError(
+                f"seed {options['seed']} was already generated, pick another"
+            )
+        workers = options["workers"]
+        if workers > 1 and connection.vendor != "postgresql":
+            self.stderr.write(
+                f"{connection.vendor} allows one writer, ignoring --workers"
+            )
+            workers = 1
+
+        plan = make_plan(
+            seed=options["seed"],
+            users=options["users"],
+            articles=options["articles"],
+            tags=options["tags"],
+            follows_per_user=options["follows_per_user"],
+            reactions_per_article=options["reactions_per_article"],
+            chunk_size=options["chunk_size"],
+            password=make_password(options["password"]),
+        )
+        started = time.perf_counter()
+        totals = seed(plan, workers, progress=self.stdout.write)
+        elapsed = time.perf_counter() - started
+        for table, count in totals.items():
+            self.stdout.write(f"{count:12,}  {table}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {sum(totals.values()):,} rows in {elapsed:.1f}s"
+            )
+        )
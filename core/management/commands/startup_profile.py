@@ -0,0 +1,65 @@
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.importtime import TARGETS, profile_imports, summarize
+
+
+class Command(BaseCommand):
+    help = "Report per-module import time of a cold process start"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--target",
+            choices=sorted(TARGETS),
+            default="urls",
+            help="what the profiled process imports",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="number of modules and packages listed",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="print the report as JSON, e.g. to track it in CI",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        modules = profile_imports(options["target"])
+        limit = options["limit"]
+        total = sum(module.self_us for module in modules)
+        slowest = sorted(
+            modules, key=lambda module: module.cumulative_us, reverse=True
+        )[:limit]
+        packages = sorted(
+            summarize(modules).items(), key=lambda item: item[1], reverse=True
+        )[:limit]
+
+        if options["json"]:
+            report = {
+                "target": options["target"],
+                "total_ms": total / 1000,
+                "modules": {
+                    module.name: module.cumulative_us / 1000
+                    for module in slowest
+                },
+                "packages": {name: us / 1000 for name, us in packages},
+            }
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"Total import time for {options['target']}: {total / 1000:.1f}ms"
+        )
+        self.stdout.write("\nSlowest modules (cumulative ms):")
+        for module in slowest:
+            self.stdout.write(
+                f"{module.cumulative_us / 1000:9.1f}  {module.name}"
+            )
+        self.stdout.write("\nPackages (self ms):")
+        for name, us in packages:
+            self.stdout.write(f"{us / 1000:9.1f}  {name}")
@@ -0,0 +1,109 @@
+import os
+from typing import Iterator
+
+from django.db import DatabaseError
+from django.db.models import Count
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from users.models import OutboxEmail
+
+# prometheus_client writes every process' values to files in this directory
+# when it is set, see gunicorn.conf.py
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by URL name",
+    ["url_name", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled, compare with worker_processes for saturation",
+    multiprocess_mode="livesum",
+)
+WORKER_PROCESSES = Gauge(
+    "worker_processes",
+    "Live processes serving requests",
+    multiprocess_mode="livesum",
+)
+EVENT_STREAMS = Gauge(
+    "event_streams_open",
+    "Server-Sent Events streams held open",
+    multiprocess_mode="livesum",
+)
+DB_QUERIES = Counter(
+    "db_queries_total", "Database queries by URL name", ["url_name"]
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by cache", ["cache", "result"]
+)
+
+WORKER_PROCESSES.set(1)
+
+
+def status_class(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class OutboxCollector:
+    """
+    Reads the email outbox depth from the database at scrape time
+    """
+
+    def family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "email_outbox_depth", "Outbox emails by status", labels=["status"]
+        )
+
+    def describe(self) -> Iterator[GaugeMetricFamily]:
+        yield self.family()
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        counts = dict.fromkeys(OutboxEmail.Status.values, 0)
+        rows = (
+            OutboxEmail.objects.order_by()
+            .values("status")
+            .annotate(count=Count("id"))
+        )
+        try:
+            for row in rows:
+                counts[row["status"]] = row["count"]
+        except DatabaseError:
+            # the other metrics are still worth scraping
+            return
+
+        depth = self.family()
+        for status, count in counts.items():
+            depth.add_metric([status], count)
+        yield depth
+
+
+outbox_collector = OutboxCollector()
+if not MULTIPROCESS:
+    REGISTRY.register(outbox_collector)
+
+
+def render_metrics() -> bytes:
+    """
+    Metrics of every worker process in the Prometheus text format
+    """
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(outbox_collector)
+    return generate_latest(registry)  # type: ignore[no-any-return]
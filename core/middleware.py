@@ -0,0 +1,229 @@
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import SAFE_METHODS
+
+from core.metrics import (
+    DB_QUERIES,
+    REQUEST_LATENCY,
+    REQUESTS_IN_PROGRESS,
+    status_class,
+)
+from core.profiling import (
+    RequestProfile,
+    install_hooks,
+    observe_queries,
+    profile_buffer,
+    profile_request,
+    should_sample,
+)
+from core.routers import current_replica, replica_health
+
+PRIMARY_COOKIE = "primary_until"
+
+
+class AsyncCapableMiddleware:
+    """
+    Runs in the mode of the handler it wraps, so under ASGI requests reach
+    the async views without a thread hop through it. Subclasses implement
+    ``__acall__`` next to ``__call__``, which delegates to it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            # how Django tells the instance is a coroutine function
+            self._is_coroutine = asyncio.coroutines._is_coroutine  # type: ignore[attr-defined]
+
+
+class QueryCount:
+    """
+    Execute wrapper counting the queries it sees
+    """
+
+    def __init__(self) -> None:
+        self.queries = 0
+
+    def __call__(self, execute: Callable, *args: Any) -> Any:
+        self.queries += 1
+        return execute(*args)
+
+
+class ReplicaRoutingMiddleware(AsyncCapableMiddleware):
+    """
+    Routes safe requests to views flagged with ``read_from_replica`` to a
+    healthy replica. A successful write pins the client to the primary for
+    REPLICA_STICKY_SECONDS through a cookie, so users read their own writes.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        super().__init__(get_response)
+        if self.is_async:
+            # Django runs a sync process_view in a thread
+            self.process_view = self.aprocess_view  # type: ignore[assignment]
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            # set by process_view, which has no token to reset it with
+            current_replica.set(None)
+        return self.pin_writes(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_replica.set(None)
+        return self.pin_writes(request, response)
+
+    def pin_writes(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                str(time.time() + settings.REPLICA_STICKY_SECONDS),
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def is_pinned(self, request: HttpRequest) -> bool:
+        try:
+            return float(request.COOKIES.get(PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Any,
+        view_args: Any,
+        view_kwargs: Any,
+    ) -> Optional[HttpResponse]:
+        self.route(request, view_func)
+        return None
+
+    async def aprocess_view(
+        self,
+        request: HttpRequest,
+        view_func: Any,
+        view_args: Any,
+        view_kwargs: Any,
+    ) -> Optional[HttpResponse]:
+        self.route(request, view_func)
+        return None
+
+    def route(self, request: HttpRequest, view_func: Any) -> None:
+        view_class = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        if (
+            request.method in SAFE_METHODS
+            and getattr(view_class, "read_from_replica", False)
+            and not self.is_pinned(request)
+        ):
+            current_replica.set(replica_health.choose())
+
+
+class ProfilingMiddleware(AsyncCapableMiddleware):
+    """
+    Opt-in through REQUEST_PROFILING. Reports database, authentication,
+    serialization and rendering time of every request in a Server-Timing
+    header, and keeps a REQUEST_PROFILING_SAMPLE_RATE fraction of requests,
+    with their repeated queries, for /api/v1/_debug/requests/.
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        if not settings.REQUEST_PROFILING:
+            raise MiddlewareNotUsed()
+        install_hooks()
+        super().__init__(get_response)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+        with profile_request(RequestProfile(should_sample())) as profile:
+            response = self.get_response(request)
+        return self.report(request, response, profile)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with profile_request(RequestProfile(should_sample())) as profile:
+            response = await self.get_response(request)
+        return self.report(request, response, profile)
+
+    def report(
+        self, request: HttpRequest, response: HttpResponse, profile: Any
+    ) -> HttpResponse:
+        total = time.perf_counter() - profile.started
+        response["Server-Timing"] = profile.server_timing(total)
+
+        if profile.sampled:
+            match = request.resolver_match
+            profile_buffer.append(
+                {
+                    "method": request.method,
+                    "path": request.get_full_path(),
+                    "url_name": match.url_name if match else None,
+                    "status": response.status_code,
+                    "at": time.time(),
+                    "total_ms": round(total * 1000, 3),
+                    **{
+                        f"{section}_ms": round(duration * 1000, 3)
+                        for section, duration in profile.durations.items()
+                    },
+                    "queries": profile.queries,
+                    "duplicate_queries": profile.duplicates(),
+                }
+            )
+        return response
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Records request latency and database queries per URL name, and the
+    number of requests in progress, for the /metrics endpoint
+    """
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+        count, started = QueryCount(), time.perf_counter()
+        with REQUESTS_IN_PROGRESS.track_inprogress(), observe_queries(count):
+            response = self.get_response(request)
+        self.record(request, response, started, count.queries)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        count, started = QueryCount(), time.perf_counter()
+        with REQUESTS_IN_PROGRESS.track_inprogress(), observe_queries(count):
+            response = await self.get_response(request)
+        self.record(request, response, started, count.queries)
+        return response
+
+    def record(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        started: float,
+        queries: int,
+    ) -> None:
+        match = request.resolver_match
+        url_name = match.url_name if match and match.url_name else "unmatched"
+        REQUEST_LATENCY.labels(
+            url_name, request.method, status_class(response.status_code)
+        ).observe(time.perf_counter() - started)
+        if queries:
+            DB_QUERIES.labels(url_name).inc(queries)
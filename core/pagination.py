@@ -0,0 +1,58 @@
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def table_estimate(using: str, table: str) -> Optional[int]:
+    """
+    Row count of ``table`` from the Postgres planner statistics, kept up
+    to date by autovacuum, or None on other databases and for tables that
+    were never analyzed
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row and row[0] >= 0 else None
+
+
+def estimated_count(queryset: Any) -> Optional[int]:
+    """
+    Estimated size of a queryset filtered by nothing but its default
+    manager, which only hides the few soft-deleted rows not yet purged.
+    None when it has to be counted.
+    """
+    if not isinstance(queryset, QuerySet):
+        return None
+    query = queryset.query
+    unfiltered = queryset.model._default_manager.all().query.where
+    if query.where != unfiltered or query.distinct or query.is_sliced:
+        return None
+    return table_estimate(queryset.db, queryset.model._meta.db_table)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Skips the COUNT(*) over a whole large table, using the planner's
+    estimate once it is above ESTIMATED_COUNT_THRESHOLD rows. Filtered
+    querysets and small tables are counted exactly.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        estimate = estimated_count(self.object_list)
+        if (
+            estimate is not None
+            and estimate >= settings.ESTIMATED_COUNT_THRESHOLD
+        ):
+            return estimate
+        return super().count  # type: ignore[no-any-return]
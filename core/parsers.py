@@ -0,0 +1,36 @@
+from typing import IO, Any, Optional
+
+import msgpack
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    media_type = "application/json"
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: Optional[str] = None,
+        parser_context: Optional[dict] = None,
+    ) -> Any:
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: Optional[str] = None,
+        parser_context: Optional[dict] = None,
+    ) -> Any:
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
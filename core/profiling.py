@@ -0,0 +1,225 @@
+import random
+import time
+import traceback
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+from rest_framework.views import APIView
+
+SECTIONS = ("db", "auth", "serialize", "render")
+
+# execute wrappers observing the queries of the request being handled
+query_observers: ContextVar[Tuple[Callable, ...]] = ContextVar(
+    "query_observers", default=()
+)
+# profile of the request being handled, None when it isn't profiled
+current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+# modules whose frames are left out of attributed stacks
+INSTRUMENTATION = (
+    "core/profiling.py",
+    "core/middleware.py",
+    "core/querybudget.py",
+)
+
+
+def project_stack() -> Tuple[str, ...]:
+    """
+    Frames of the current stack that belong to this project, outermost
+    first, as ``path:line in function``
+    """
+    root = str(settings.BASE_DIR.parent)
+    return tuple(
+        f"{frame.filename[len(root) + 1:]}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(root)
+        and "site-packages" not in frame.filename
+        and not frame.filename.endswith(INSTRUMENTATION)
+    )
+
+
+class RequestProfile:
+    """
+    Time spent per section of a request. Sections can nest, e.g. auth runs
+    queries, and only the outermost call of a section is timed.
+    """
+
+    def __init__(self, sampled: bool) -> None:
+        self.sampled = sampled
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = dict.fromkeys(SECTIONS, 0.0)
+        self.depth: Counter = Counter()
+        self.queries = 0
+        self.statements: Counter = Counter()
+
+    def timed(self, section: str, function: Callable, *args: Any) -> Any:
+        self.depth[section] += 1
+        started = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.depth[section] -= 1
+            if not self.depth[section]:
+                self.durations[section] += time.perf_counter() - started
+
+    def execute(
+        self,
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: Any,
+    ) -> Any:
+        self.queries += 1
+        if self.sampled:
+            self.statements[(sql, project_stack())] += 1
+        return self.timed("db", execute, sql, params, many, context)
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """
+        Statements run more than once from the same place, most repeated first
+        """
+        return [
+            {"sql": sql, "count": count, "stack": list(stack)}
+            for (sql, stack), count in self.statements.most_common()
+            if count > 1
+        ]
+
+    def server_timing(self, total: float) -> str:
+        metrics = [
+            f'db;dur={self.durations["db"] * 1000:.1f};'
+            f'desc="{self.queries} queries"'
+        ]
+        metrics += [
+            f"{section};dur={self.durations[section] * 1000:.1f}"
+            for section in SECTIONS[1:]
+        ]
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+class ProfileBuffer:
+    """
+    The most recent sampled request profiles of this process
+    """
+
+    def __init__(self, size: int) -> None:
+        self.entries: deque = deque(maxlen=size)
+        self.lock = Lock()
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        with self.lock:
+            self.entries.append(entry)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return list(reversed(self.entries))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+profile_buffer = ProfileBuffer(settings.REQUEST_PROFILING_BUFFER_SIZE)
+
+
+def profiled(section: str, function: Callable) -> Callable:
+    @wraps(function)
+    def wrapper(*args: Any) -> Any:
+        profile = current_profile.get()
+        if profile is None:
+            return function(*args)
+        return profile.timed(section, function, *args)
+
+    wrapper.__wrapped_for_profiling__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def observe_query(
+    execute: Callable, sql: str, params: Any, many: bool, context: Any
+) -> Any:
+    """
+    Runs a query through the current observers. Installed on every
+    connection, since under ASGI a request's queries run on the connections
+    of sync_to_async threads, which context variables follow.
+    """
+    for observer in reversed(query_observers.get()):
+        execute = partial(observer, execute)
+    return execute(sql, params, many, context)
+
+
+@receiver(connection_created)
+def install_query_observer(
+    sender: Any, connection: Any, **kwargs: Any
+) -> None:
+    # reconnecting keeps the connection's wrappers
+    if observe_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(observe_query)
+
+
+@contextmanager
+def observe_queries(observer: Callable) -> Iterator[None]:
+    """
+    Passes every query run meanwhile, on any thread the context follows,
+    through ``observer``, an execute wrapper
+    """
+    token = query_observers.set((*query_observers.get(), observer))
+    try:
+        yield
+    finally:
+        query_observers.reset(token)
+
+
+_install_lock = Lock()
+
+
+def install_hooks() -> None:
+    """
+    Wraps DRF's authentication, serializer output and response rendering so
+    they are timed while a profile is active. Called once, when the
+    profiling middleware is enabled.
+    """
+    with _install_lock:
+        if getattr(
+            APIView.perform_authentication, "__wrapped_for_profiling__", False
+        ):
+            return
+        APIView.perform_authentication = profiled(
+            "auth", APIView.perform_authentication
+        )
+        BaseSerializer.data = property(
+            profiled("serialize", BaseSerializer.data.fget)
+        )
+        Response.rendered_content = property(
+            profiled("render", Response.rendered_content.fget)
+        )
+
+
+@contextmanager
+def profile_request(profile: RequestProfile) -> Iterator[RequestProfile]:
+    """
+    Makes ``profile`` the active profile and times every query run
+    meanwhile
+    """
+    token = current_profile.set(profile)
+    try:
+        with observe_queries(profile.execute):
+            yield profile
+    finally:
+        current_profile.reset(token)
+
+
+def should_sample() -> bool:
+    return random.random() < settings.REQUEST_PROFILING_SAMPLE_RATE
@@ -0,0 +1,192 @@
+"""
+Removes soft-deleted users and articles and the rows referencing them.
+
+Deleting a user or an article through the API only tombstones it, which
+hides it from reads right away. The purge then deletes the follows,
+reactions, taggings, suggestions and tokens referencing each tombstone in
+transactions of at most ``batch_size`` rows, detaches the articles of
+deleted users like the former ``SET_NULL`` did, destroys the Cloudinary
+images and finally deletes the tombstone itself, so no statement holds
+locks on more than a batch of rows. Follow rows orphaned by earlier hard
+deletes are swept as well.
+
+Purged articles leave an ArticleTombstone in the change feed, and
+articles losing the reactions of a purged user move to its end.
+"""
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from taggit.models import TaggedItem
+
+from articles.models import (
+    Article,
+    ArticleTombstone,
+    NextChangeSeq,
+    bump_changes,
+)
+from users.models import Profile, UserFollowing, UserSuggestion
+
+User = get_user_model()
+
+
+def batches(queryset: Any, batch_size: int) -> Iterator[List[int]]:
+    """
+    Primary keys of ``queryset``, ``batch_size`` at a time. The queryset is
+    evaluated again for every batch, so each batch has to be processed
+    out of it before the next one is read.
+    """
+    while True:
+        ids = list(
+            queryset.order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        yield ids
+
+
+def delete_in_batches(queryset: Any, batch_size: int) -> int:
+    deleted = 0
+    for ids in batches(queryset, batch_size):
+        with transaction.atomic():
+            queryset.model._base_manager.filter(pk__in=ids).delete()
+        deleted += len(ids)
+    return deleted
+
+
+def destroy_images(images: Iterable[Any]) -> Counter:
+    """
+    Deletes images from Cloudinary, counting the failures instead of
+    raising so a Cloudinary outage doesn't block purging the rows
+    """
+    import cloudinary.exceptions
+    import cloudinary.uploader
+
+    counts: Counter = Counter()
+    for image in images:
+        public_id = getattr(image, "public_id", image)
+        if not public_id:
+            continue
+        try:
+            cloudinary.uploader.destroy(public_id)
+        except cloudinary.exceptions.Error:
+            counts["image failures"] += 1
+        else:
+            counts["images"] += 1
+    return counts
+
+
+def purge_article(article: Any, batch_size: int) -> Counter:
+    content_type = ContentType.objects.get_for_model(Article)
+    counts: Counter = Counter()
+    counts["likes"] += delete_in_batches(
+        Article.likes.through.objects.filter(article_id=article.pk),
+        batch_size,
+    )
+    counts["dislikes"] += delete_in_batches(
+        Article.dislikes.through.objects.filter(article_id=article.pk),
+        batch_size,
+    )
+    counts["tagged items"] += delete_in_batches(
+        TaggedItem.objects.filter(
+            content_type=content_type, object_id=article.pk
+        ),
+        batch_size,
+    )
+    counts += destroy_images([article.image])
+    with transaction.atomic():
+        ArticleTombstone.objects.update_or_create(
+            lookup_id=article.lookup_id,
+            defaults={
+                "slug": article.slug,
+                "change_seq": NextChangeSeq(),
+                "changed_at": timezone.now(),
+            },
+        )
+        Article.all_objects.filter(pk=article.pk).delete()
+    counts["articles"] += 1
+    return counts
+
+
+def delete_reactions(queryset: Any, batch_size: int) -> int:
+    """
+    Deletes likes or dislikes in batches, moving their articles to the
+    end of the change feed
+    """
+    deleted = 0
+    for ids in batches(queryset, batch_size):
+        with transaction.atomic():
+            reactions = queryset.model.objects.filter(pk__in=ids)
+            bump_changes(
+                Article.all_objects.filter(
+                    pk__in=reactions.values("article_id")
+                )
+            )
+            reactions.delete()
+        deleted += len(ids)
+    return deleted
+
+
+def purge_user(user: Any, batch_size: int) -> Counter:
+    counts: Counter = Counter()
+    dependents = {
+        "follows": UserFollowing.objects.filter(
+            Q(follower_id=user.pk) | Q(followed_id=user.pk)
+        ),
+        "suggestions": UserSuggestion.objects.filter(
+            Q(user_id=user.pk) | Q(suggested_id=user.pk)
+        ),
+        "tokens": OutstandingToken.objects.filter(user_id=user.pk),
+    }
+    for name, queryset in dependents.items():
+        counts[name] += delete_in_batches(queryset, batch_size)
+    counts["likes"] += delete_reactions(
+        Article.likes.through.objects.filter(user_id=user.pk), batch_size
+    )
+    counts["dislikes"] += delete_reactions(
+        Article.dislikes.through.objects.filter(user_id=user.pk), batch_size
+    )
+    # the articles stay, without an author
+    for ids in batches(
+        Article.all_objects.filter(author_id=user.pk), batch_size
+    ):
+        with transaction.atomic():
+            bump_changes(Article.all_objects.filter(pk__in=ids), author=None)
+        counts["detached articles"] += len(ids)
+    counts += destroy_images(
+        Profile.objects.filter(user_id=user.pk).values_list("image", flat=True)
+    )
+    with transaction.atomic():
+        User.all_objects.filter(pk=user.pk).delete()
+    counts["users"] += 1
+    return counts
+
+
+def purge_deleted(
+    batch_size: int = 1000,
+    progress: Callable[[str], Any] = lambda message: None,
+) -> Dict[str, int]:
+    """
+    Purges every soft-deleted article, then every soft-deleted user, and
+    sweeps the orphaned follows. Returns the number of rows removed per
+    kind.
+    """
+    counts: Counter = Counter()
+    for article in Article.all_objects.filter(deleted_at__isnull=False):
+        counts += purge_article(article, batch_size)
+        progress(f"purged article {article.lookup_id}")
+    for user in User.all_objects.filter(deleted_at__isnull=False):
+        counts += purge_user(user, batch_size)
+        progress(f"purged user {user.lookup_id}")
+    counts["orphaned follows"] += delete_in_batches(
+        UserFollowing.objects.filter(
+            Q(follower__isnull=True) | Q(followed__isnull=True)
+        ),
+        batch_size,
+    )
+    return dict(counts)
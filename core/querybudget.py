@@ -0,0 +1,206 @@
+"""
+Query budgets for API endpoints, declared per URL name in BUDGETS.
+
+Tests opt in with ``@pytest.mark.query_budget``: every request made through
+the test client during the test is checked against the budget of the URL
+name it resolved to. ``QueryBudgetMixin.assertQueryBudget`` checks a block
+of code explicitly, and ``assertFlatQueries`` compares two fixture sizes.
+Failures list the offending SQL grouped by the call site that issued it.
+"""
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import pytest
+from django.db import connections
+from django.test import Client
+from django.urls import Resolver404
+
+
+class Budget(NamedTuple):
+    """
+    Keyed by URL name, or by ``"<URL name>:<METHOD>"`` for a method whose
+    cost differs from the endpoint's reads
+    """
+
+    max_queries: int
+    # repeated statements from the same call site, None to allow any
+    max_duplicates: Optional[int] = 0
+
+
+BUDGETS: Dict[str, Budget] = {
+    # articles
+    "articles": Budget(6),
+    # taggit looks up and inserts every tag on its own
+    "articles:POST": Budget(35, max_duplicates=6),
+    "article-detail": Budget(5),
+    # the body is written to its own table
+    "article-detail:PATCH": Budget(13),
+    "article-detail:DELETE": Budget(4),
+    "article-changes": Budget(6),
+    # moving a reaction bumps the change feed position twice
+    "article-favorite": Budget(15, max_duplicates=1),
+    "article-unfavorite": Budget(15, max_duplicates=1),
+    "articles-async": Budget(6),
+    "article-detail-async": Budget(5),
+    # users
+    "login": Budget(2),
+    "refresh": Budget(6),
+    "users": Budget(4),
+    "users:POST": Budget(8),
+    "user-detail": Budget(4),
+    # deletes only tombstone the row, purge_deleted does the cascade
+    "user-detail:DELETE": Budget(3),
+    "profile": Budget(4),
+    "user-suggestions": Budget(4),
+    "user-follow": Budget(5),
+    # the serializer resolves both users again from their lookup ids
+    "user-follow:POST": Budget(8, max_duplicates=1),
+    "user-follow-async": Budget(5),
+    "user-follow-async:POST": Budget(8, max_duplicates=1),
+    "user-follow-bulk": Budget(4),
+    "verify-email": Budget(3),
+    "reset-password-request": Budget(2),
+    "reset-password": Budget(3),
+}
+
+
+def budget_for(
+    name: str, method: str = "GET", budgets: Optional[Dict] = None
+) -> Optional[Budget]:
+    budgets = BUDGETS if budgets is None else budgets
+    return budgets.get(f"{name}:{method}") or budgets.get(name)
+
+
+class CapturedQuery(NamedTuple):
+    sql: str
+    stack: tuple
+
+
+class CapturedQueries(List[CapturedQuery]):
+    def duplicates(self) -> Dict[CapturedQuery, int]:
+        return {
+            query: count
+            for query, count in Counter(self).most_common()
+            if count > 1
+        }
+
+    def report(self) -> str:
+        """
+        The captured SQL grouped by the innermost project frame issuing it
+        """
+        sites: Dict[str, Counter] = {}
+        for query in self:
+            site = query.stack[-1] if query.stack else "<outside project>"
+            sites.setdefault(site, Counter())[query.sql] += 1
+        lines = []
+        for site, statements in sites.items():
+            lines.append(f"  {site}")
+            for sql, count in statements.most_common():
+                lines.append(f"    {count} x {sql}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def capture_queries() -> Iterator[CapturedQueries]:
+    """
+    Records every query run on any connection, with its project call stack
+    """
+    from core.profiling import project_stack
+
+    queries = CapturedQueries()
+
+    def record(execute: Callable, sql: str, *args: Any) -> Any:
+        queries.append(CapturedQuery(sql, project_stack()))
+        return execute(sql, *args)
+
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(record))
+        yield queries
+
+
+def check_budget(
+    name: str, queries: CapturedQueries, budget: Optional[Budget] = None
+) -> None:
+    budget = budget or BUDGETS[name]
+    duplicates = sum(count - 1 for count in queries.duplicates().values())
+    if len(queries) > budget.max_queries:
+        problem = f"{len(queries)} queries, budget is {budget.max_queries}"
+    elif budget.max_duplicates is not None and (
+        duplicates > budget.max_duplicates
+    ):
+        problem = (
+            f"{duplicates} duplicate queries, "
+            f"budget is {budget.max_duplicates}"
+        )
+    else:
+        return
+    raise AssertionError(f"{name}: {problem}\n{queries.report()}")
+
+
+class QueryBudgetMixin:
+    """
+    TestCase helpers asserting query budgets
+    """
+
+    @contextmanager
+    def assertQueryBudget(
+        self, name: str, budget: Optional[Budget] = None
+    ) -> Iterator[CapturedQueries]:
+        with capture_queries() as queries:
+            yield queries
+        check_budget(name, queries, budget)
+
+    def assertFlatQueries(
+        self, name: str, request: Callable[[], Any], grow: Callable[[], Any]
+    ) -> None:
+        """
+        Runs ``request`` before and after ``grow`` scales up its fixture,
+        e.g. from 1 to 50 likers, and asserts both runs fit the budget with
+        the same number of queries
+        """
+        with self.assertQueryBudget(name) as few:
+            request()
+        grow()
+        with self.assertQueryBudget(name) as many:
+            request()
+        if len(few) != len(many):
+            raise AssertionError(
+                f"{name}: {len(few)} queries before growing the fixture, "
+                f"{len(many)} after\n{many.report()}"
+            )
+
+
+def pytest_configure(config: Any) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(budgets=None): check test client requests against "
+        "BUDGETS, a dict of URL name to Budget overrides entries",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _query_budget(request: Any, monkeypatch: Any) -> None:
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        return
+    overrides: Dict[str, Budget] = marker.args[0] if marker.args else {}
+    send = Client.request
+
+    def checked_request(client: Any, **kwargs: Any) -> Any:
+        with capture_queries() as queries:
+            response = send(client, **kwargs)
+        try:
+            name = response.resolver_match.url_name
+        except Resolver404:
+            return response
+        method = kwargs["REQUEST_METHOD"]
+        budget = budget_for(name, method, overrides) or budget_for(
+            name, method
+        )
+        if budget is not None:
+            check_budget(f"{method} {name}", queries, budget)
+        return response
+
+    monkeypatch.setattr(Client, "request", checked_request)
@@ -0,0 +1,103 @@
+import datetime
+import decimal
+import uuid
+from typing import Any, Optional
+
+import msgpack
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+# escaped by DRF's JSONRenderer so the output is also valid JavaScript
+LINE_SEPARATORS = (
+    (b"\xe2\x80\xa8", b"\\u2028"),
+    (b"\xe2\x80\xa9", b"\\u2029"),
+)
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Converts what orjson and msgpack don't encode natively the way DRF's
+    JSONEncoder does
+    """
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        if representation.endswith("+00:00"):
+            representation = representation[:-6] + "Z"
+        return representation
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, QuerySet):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    if hasattr(obj, "__getitem__"):
+        return list(obj) if isinstance(obj, tuple) else dict(obj)
+    if hasattr(obj, "__iter__"):
+        return list(obj)
+    raise TypeError(f"{type(obj).__name__} is not serializable")
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Compact UTF-8 JSON encoded by orjson, with the output of DRF's
+    JSONRenderer but without its pretty printing through ``indent``
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        content = orjson.dumps(
+            data, default=encode_default, option=self.options
+        )
+        for character, escaped in LINE_SEPARATORS:
+            if character in content:
+                content = content.replace(character, escaped)
+        return content
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack for clients sending ``Accept: application/msgpack``, with
+    the same values as the JSON representation
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        return msgpack.packb(  # type: ignore[no-any-return]
+            data, default=encode_default, use_bin_type=True, datetime=False
+        )
@@ -0,0 +1,114 @@
+import random
+import time
+from contextvars import ContextVar
+from threading import Lock, Thread
+from typing import Any, List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+# replica alias chosen for the current request, None reads from the primary
+current_replica: ContextVar[Optional[str]] = ContextVar(
+    "current_replica", default=None
+)
+
+
+def replica_lag(alias: str) -> float:
+    """
+    Returns how many seconds the replica is behind the primary
+    """
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT CASE WHEN pg_last_wal_receive_lsn() = "
+                "pg_last_wal_replay_lsn() THEN 0 ELSE COALESCE(EXTRACT("
+                "EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+            )
+        else:
+            cursor.execute("SELECT 0")
+        return float(cursor.fetchone()[0])
+
+
+class ReplicaHealth:
+    """
+    Tracks which replicas are reachable and within REPLICA_MAX_LAG seconds
+    of the primary, re-checking at most every REPLICA_HEALTH_CHECK_INTERVAL
+    seconds. Checks run in a background thread, so an unreachable replica
+    never holds up a request; requests use the last known healthy
+    replicas meanwhile, none before the first check.
+    """
+
+    def __init__(self) -> None:
+        self.healthy: List[str] = []
+        self.checked_at: Optional[float] = None
+        self.checking = False
+        self.lock = Lock()
+
+    def check(self) -> None:
+        healthy = []
+        for alias in settings.DATABASE_REPLICAS:
+            try:
+                if replica_lag(alias) <= settings.REPLICA_MAX_LAG:
+                    healthy.append(alias)
+            except Exception:
+                connections[alias].close()
+        self.healthy = healthy
+        self.checked_at = time.monotonic()
+
+    def check_in_background(self) -> Thread:
+        def run() -> None:
+            try:
+                self.check()
+            finally:
+                self.checking = False
+                # the thread's connections would never be reused
+                for alias in settings.DATABASE_REPLICAS:
+                    connections[alias].close()
+
+        thread = Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def healthy_replicas(self) -> List[str]:
+        if not settings.DATABASE_REPLICAS:
+            return []
+        with self.lock:
+            due = not self.checking and (
+                self.checked_at is None
+                or time.monotonic() - self.checked_at
+                > settings.REPLICA_HEALTH_CHECK_INTERVAL
+            )
+            if due:
+                self.checking = True
+        if due:
+            self.check_in_background()
+        return self.healthy
+
+    def choose(self) -> Optional[str]:
+        replicas = self.healthy_replicas()
+        return random.choice(replicas) if replicas else None
+
+
+replica_health = ReplicaHealth()
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica picked for the current request by
+    ReplicaRoutingMiddleware and everything else to the primary
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        return current_replica.get()
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        return "default"
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        return True
+
+    def allow_migrate(
+        self, db: str, app_label: str, model_name: Any = None, **hints: Any
+    ) -> bool:
+        return db not in settings.DATABASE_REPLICAS
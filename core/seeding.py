@@ -0,0 +1,381 @@
+"""
+Deterministic synthetic datasets at production scale for load testing.
+
+Every chunk of rows is generated from its own random stream, derived from
+the seed and the chunk's position, so a dataset is identical whatever the
+number of worker processes. How many followers a user gets and how many
+reactions an article gets both follow power laws: users are ranked by a
+Zipf popularity, which also decides who gets followed, who writes and who
+reacts.
+"""
+import csv
+import io
+import math
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, List, NamedTuple
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from django.utils.text import slugify
+from taggit.models import Tag, TaggedItem
+
+from articles.models import (
+    Article,
+    ArticleBody,
+    last_change_seq,
+    reset_change_sequence,
+)
+from core.fields import search_vector
+from users.models import Profile, UserFollowing
+
+User = get_user_model()
+
+# exponent of the Zipf law ranking users and tags by popularity
+POPULARITY_EXPONENT = 1.1
+# Pareto shape of follows per user and reactions per article, the lower the
+# heavier the tail
+ACTIVITY_SHAPE = 1.5
+DISLIKE_SHARE = 0.2
+MAX_TAGS_PER_ARTICLE = 5
+
+WORDS = (
+    "django api python data model query cache index latency scale "
+    "design team product release review deploy article growth remote "
+    "career learning cloud database server client async test debug"
+).split()
+
+PHASES = ("users", "tags", "articles", "follows")
+
+
+class SeedPlan(NamedTuple):
+    seed: int
+    users: int
+    articles: int
+    tags: int
+    # averages, the actual counts follow a power law
+    follows_per_user: float
+    reactions_per_article: float
+    chunk_size: int
+    password: str
+    first_user: int
+    first_article: int
+    first_tag: int
+    first_change: int
+    content_type: int
+    use_copy: bool
+
+    @property
+    def prefix(self) -> str:
+        return f"seed{self.seed}"
+
+
+def next_id(model: Any) -> int:
+    # deleted rows waiting to be purged still hold their ids
+    return (model._base_manager.aggregate(last=Max("pk"))["last"] or 0) + 1
+
+
+def make_plan(
+    seed: int,
+    users: int,
+    articles: int,
+    tags: int,
+    follows_per_user: float,
+    reactions_per_article: float,
+    chunk_size: int,
+    password: str,
+) -> SeedPlan:
+    """
+    Reserves primary keys after the existing rows, so every chunk knows
+    the ids of the rows it references without reading them back
+    """
+    return SeedPlan(
+        seed=seed,
+        users=users,
+        articles=articles,
+        tags=tags,
+        follows_per_user=follows_per_user,
+        reactions_per_article=reactions_per_article,
+        chunk_size=chunk_size,
+        password=password,
+        first_user=next_id(User),
+        first_article=next_id(Article),
+        first_tag=next_id(Tag),
+        first_change=last_change_seq() + 1,
+        content_type=ContentType.objects.get_for_model(Article).pk,
+        use_copy=connection.vendor == "postgresql",
+    )
+
+
+def random_stream(plan: SeedPlan, phase: str, chunk: int) -> Any:
+    return np.random.default_rng([plan.seed, PHASES.index(phase), chunk])
+
+
+@lru_cache(maxsize=4)
+def popularity(seed: int, size: int) -> np.ndarray:
+    """
+    Cumulative Zipf weights of ``size`` items shuffled by ``seed``, to draw
+    items with ``np.searchsorted(cdf, uniform)``
+    """
+    ranks = np.random.default_rng([seed, size]).permutation(size) + 1
+    weights = 1.0 / ranks**POPULARITY_EXPONENT
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]  # type: ignore[no-any-return]
+
+
+def draw(rng: Any, cdf: np.ndarray, count: int) -> np.ndarray:
+    """
+    ``count`` distinct item indexes, popular ones more likely. Draws that
+    repeat an item are dropped, which trims the heaviest tails a little.
+    """
+    return np.unique(np.searchsorted(cdf, rng.random(count)))
+
+
+def activity(rng: Any, mean: float, size: int, limit: int) -> np.ndarray:
+    """
+    Power-law counts averaging about ``mean``, at most ``limit``
+    """
+    scale = mean * (ACTIVITY_SHAPE - 1)
+    counts = np.floor(rng.pareto(ACTIVITY_SHAPE, size) * scale)
+    return np.minimum(counts, limit).astype(np.int64)
+
+
+def sentence(rng: Any, words: int) -> str:
+    return " ".join(
+        WORDS[index] for index in rng.integers(len(WORDS), size=words)
+    )
+
+
+def copy_objects(objects: List[Any]) -> None:
+    """
+    Writes model instances with Postgres COPY, which is several times
+    faster than multi-row INSERTs
+    """
+    model = type(objects[0])
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if field is not model._meta.auto_field or objects[0].pk is not None
+    ]
+    buffer = io.StringIO()
+    # empty strings are quoted and NULLs are not
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    for instance in objects:
+        writer.writerow(
+            [
+                field.get_db_prep_save(
+                    field.pre_save(instance, True), connection
+                )
+                for field in fields
+            ]
+        )
+    buffer.seek(0)
+    columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} "
+            f"({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+def write(plan: SeedPlan, objects: List[Any]) -> int:
+    if not objects:
+        return 0
+    if plan.use_copy:
+        copy_objects(objects)
+    else:
+        type(objects[0]).objects.bulk_create(objects, batch_size=1000)
+    return len(objects)
+
+
+def seed_users(plan: SeedPlan, chunk: int) -> Dict[str, int]:
+    rng = random_stream(plan, "users", chunk)
+    start = chunk * plan.chunk_size
+    indexes = range(start, min(start + plan.chunk_size, plan.users))
+    users = [
+        User(
+            pk=plan.first_user + index,
+            username=f"{plan.prefix}-user-{index}",
+            email=f"{plan.prefix}-user-{index}@example.com",
+            lookup_id=rng.bytes(16).hex(),
+            password=plan.password,
+            is_verified=True,
+        )
+        for index in indexes
+    ]
+    profiles = [
+        Profile(user_id=user.pk, bio=sentence(rng, rng.integers(3, 20)))
+        for user in users
+    ]
+    return {"users": write(plan, users), "profiles": write(plan, profiles)}
+
+
+def seed_tags(plan: SeedPlan, chunk: int) -> Dict[str, int]:
+    tags = [
+        Tag(
+            pk=plan.first_tag + index,
+            name=f"{plan.prefix}-tag-{index}",
+            slug=f"{plan.prefix}-tag-{index}",
+        )
+        for index in range(plan.tags)
+    ]
+    return {"tags": write(plan, tags)}
+
+
+def seed_articles(plan: SeedPlan, chunk: int) -> Dict[str, int]:
+    rng = random_stream(plan, "articles", chunk)
+    users = popularity(plan.seed, plan.users)
+    tags = popularity(plan.seed + 1, plan.tags)
+    start = chunk * plan.chunk_size
+    stop = min(start + plan.chunk_size, plan.articles)
+    authors = np.searchsorted(users, rng.random(stop - start))
+    reactions = activity(
+        rng, plan.reactions_per_article, stop - start, plan.users
+    )
+
+    articles, bodies, tagged, likes, dislikes = [], [], [], [], []
+    Likes, Dislikes = Article.likes.through, Article.dislikes.through
+    for offset, index in enumerate(range(start, stop)):
+        pk = plan.first_article + index
+        lookup_id = uuid.UUID(bytes=rng.bytes(16), version=4)
+        title = sentence(rng, rng.integers(3, 10)).capitalize()
+        body = sentence(rng, int(rng.lognormal(6, 0.8)) + 1)
+        articles.append(
+            Article(
+                pk=pk,
+                lookup_id=lookup_id,
+                slug=slugify(f"{title}-{lookup_id}"),
+                title=title,
+                description=sentence(rng, rng.integers(5, 15)),
+                reading_time=math.ceil(body.count(" ") // 200),
+                author_id=plan.first_user + int(authors[offset]),
+                change_seq=plan.first_change + index,
+            )
+        )
+        bodies.append(
+            ArticleBody(
+                article_id=pk,
+                text=body,
+                search_vector=search_vector(body),
+            )
+        )
+        for tag in draw(rng, tags, rng.integers(1, MAX_TAGS_PER_ARTICLE)):
+            tagged.append(
+                TaggedItem(
+                    tag_id=plan.first_tag + int(tag),
+                    content_type_id=plan.content_type,
+                    object_id=pk,
+                )
+            )
+        reactors = draw(rng, users, int(reactions[offset]))
+        disliked = rng.random(len(reactors)) < DISLIKE_SHARE
+        for user, dislike in zip(reactors, disliked):
+            through = Dislikes if dislike else Likes
+            (dislikes if dislike else likes).append(
+                through(article_id=pk, user_id=plan.first_user + int(user))
+            )
+    return {
+        "articles": write(plan, articles),
+        # COPY can't have the database compute the search vectors
+        "bodies": len(
+            ArticleBody.objects.bulk_create(bodies, batch_size=1000)
+        ),
+        "tagged items": write(plan, tagged),
+        "likes": write(plan, likes),
+        "dislikes": write(plan, dislikes),
+    }
+
+
+def seed_follows(plan: SeedPlan, chunk: int) -> Dict[str, int]:
+    rng = random_stream(plan, "follows", chunk)
+    users = popularity(plan.seed, plan.users)
+    start = chunk * plan.chunk_size
+    stop = min(start + plan.chunk_size, plan.users)
+    counts = activity(rng, plan.follows_per_user, stop - start, plan.users)
+    follows = [
+        UserFollowing(
+            follower_id=plan.first_user + index,
+            followed_id=plan.first_user + int(followed),
+        )
+        for index, count in zip(range(start, stop), counts)
+        for followed in draw(rng, users, int(count))
+        if followed != index
+    ]
+    return {"follows": write(plan, follows)}
+
+
+SEEDERS: Dict[str, Callable[[SeedPlan, int], Dict[str, int]]] = {
+    "users": seed_users,
+    "tags": seed_tags,
+    "articles": seed_articles,
+    "follows": seed_follows,
+}
+
+
+def seed_chunk(plan: SeedPlan, phase: str, chunk: int) -> Dict[str, int]:
+    with transaction.atomic():
+        return SEEDERS[phase](plan, chunk)
+
+
+def _setup_worker() -> None:
+    import django
+
+    # processes started with spawn instead of fork import nothing
+    django.setup()
+
+
+def chunks(plan: SeedPlan, phase: str) -> int:
+    if phase == "tags":
+        return 1
+    rows = plan.articles if phase == "articles" else plan.users
+    return math.ceil(rows / plan.chunk_size)
+
+
+def seed(
+    plan: SeedPlan, workers: int = 1, progress: Callable = print
+) -> Dict[str, int]:
+    """
+    Generates the dataset phase by phase, since articles and follows
+    reference users, running the chunks of a phase on ``workers``
+    processes. Returns the number of rows written per table.
+    """
+    totals: Dict[str, int] = {}
+
+    def add(counts: Dict[str, int]) -> None:
+        for table, count in counts.items():
+            totals[table] = totals.get(table, 0) + count
+
+    if workers <= 1:
+        for phase in PHASES:
+            for chunk in range(chunks(plan, phase)):
+                add(seed_chunk(plan, phase, chunk))
+            progress(f"{phase}: done")
+    else:
+        # forked workers must not share the parent's database connections
+        connections.close_all()
+        with ProcessPoolExecutor(workers, initializer=_setup_worker) as pool:
+            for phase in PHASES:
+                for counts in pool.map(
+                    seed_chunk,
+                    repeat(plan),
+                    repeat(phase),
+                    range(chunks(plan, phase)),
+                ):
+                    add(counts)
+                progress(f"{phase}: done")
+
+    # the sequences have to move past the ids that were set explicitly
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(
+            no_style(), [User, Article, Tag]
+        ):
+            cursor.execute(sql)
+    reset_change_sequence()
+    return totals
@@ -3,9 +3,6 @@ from datetime import timedelta
 from pathlib import Path
 from typing import List
 
-import cloudinary
-import cloudinary.api
-import cloudinary.uploader
 import dj_database_url
 from dotenv import load_dotenv
 
@@ -34,6 +31,7 @@ INSTALLED_APPS = [
     "taggit",
     "django_filters",
     # app imports
+    "core",
     "users",
     "articles",
 ]
@@ -79,17 +77,96 @@ DATABASES = {
     "default": dj_database_url.config(default=os.getenv("DATABASE_URL")),
 }
 
+# seconds before giving up on connecting to a replica
+REPLICA_CONNECT_TIMEOUT = 2
+# read replicas, as a comma separated list of database urls
+DATABASE_REPLICAS: List[str] = []
+for index, url in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICA_URLS", "").split(","))
+):
+    replica = {**dj_database_url.parse(url), "TEST": {"MIRROR": "default"}}
+    if replica["ENGINE"] == "django.db.backends.postgresql":
+        replica["OPTIONS"] = {"connect_timeout": REPLICA_CONNECT_TIMEOUT}
+    DATABASES[f"replica_{index}"] = replica
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["core.routers.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = 5
+REPLICA_HEALTH_CHECK_INTERVAL = 10
+REPLICA_MAX_LAG = 5
+
+# shared cache, per process memory unless REDIS_URL is set
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+# Server-Sent Events served by the ASGI app, shared between processes
+# through Redis when REDIS_URL is set. Redis is required outside DEBUG,
+# where the API and the streams run in separate processes
+EVENTS_PATH = "/api/v1/articles/events/"
+EVENTS_REDIS_URL = os.getenv("REDIS_URL")
+EVENTS_BACKEND = (
+    "core.events.RedisBackend"
+    if EVENTS_REDIS_URL
+    else "core.events.LocalBackend"
+)
+# events buffered per client, slower clients miss the oldest ones
+EVENTS_QUEUE_SIZE = 100
+EVENTS_HEARTBEAT_INTERVAL = 15
+EVENTS_RETRY_MS = 3000
+# reaction counts of an article are published at most once per interval
+EVENTS_COUNTS_DEBOUNCE = 2
+# text search configuration of the article bodies' vectors and queries
+SEARCH_CONFIG = "english"
+# seconds the article change feed holds back new positions, which must
+# outlast the longest transaction writing them plus the replica lag
+CHANGES_COMMIT_LAG = 60
+# identical anonymous GETs share one rendered response
+COALESCE_CACHE_TTL = 1
+COALESCE_LOCK_TIMEOUT = 2
+# article views are buffered per process and written every interval
+VIEW_COUNTS_FLUSH_INTERVAL = 10
+# repeated views of an article by the same viewer count once per window,
+# 0 counts every view
+VIEW_COUNTS_DEDUP_WINDOW = 30 * 60
+VIEW_COUNTS_DEDUP_SIZE = 100_000
+# proxies in front of the app appending to X-Forwarded-For, without them
+# anonymous views are counted without deduplication
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "0"))
+# Server-Timing headers and sampled profiles at /api/v1/_debug/requests/
+REQUEST_PROFILING = os.getenv("REQUEST_PROFILING") == "True"
+REQUEST_PROFILING_SAMPLE_RATE = 0.05
+REQUEST_PROFILING_BUFFER_SIZE = 200
+# admin changelists of larger tables show the planner's row estimate
+ESTIMATED_COUNT_THRESHOLD = 100_000
+# bearer token required by /metrics, which is disabled without one
+# outside DEBUG
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
 
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
+# the ASGI process leaves static files to the WSGI one, WhiteNoise being
+# sync only would run every request in a thread
+ASGI_MIDDLEWARE = [
+    path
+    for path in MIDDLEWARE
+    if path != "whitenoise.middleware.WhiteNoiseMiddleware"
+]
 
 
 LANGUAGE_CODE = "en-us"
@@ -117,14 +194,26 @@ AUTH_USER_MODEL = "users.User"
 # rest auth
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # JSON through orjson, or MessagePack for Accept: application/msgpack
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "core.renderers.MessagePackRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.ORJSONParser",
+        "core.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "TEST_REQUEST_RENDERER_CLASSES": (
         "rest_framework.renderers.MultiPartRenderer",
         "rest_framework.renderers.JSONRenderer",
+        "core.renderers.MessagePackRenderer",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -138,19 +227,25 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": False,
 }
+# users resolved from access tokens are cached per process
+JWT_USER_CACHE_SIZE = 1024
+JWT_USER_CACHE_TTL = 30
 
 # swagger settings
 SWAGGER_SETTINGS = {
     "SECURITY_DEFINITIONS": {
         "Bearer": {"type": "apiKey", "name": "Authorization", "in": "header"}
-    }
+    },
+    "SPEC_URL": "schema-json",
+}
+# written by manage.py build_schema
+OPENAPI_SCHEMA_PATH = BASE_DIR / "openapi.json"
+# cloudinary settings, applied by CoreConfig.ready
+CLOUDINARY = {
+    "cloud_name": os.getenv("CLOUDINARY_NAME"),
+    "api_key": os.getenv("CLOUDINARY_API_KEY"),
+    "api_secret": os.getenv("CLOUDINARY_API_SECRET"),
 }
-# cloudinary settings
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-)
 
 DEFAULT_PARSER_CLASSES = (
     "rest_framework.parsers.JSONParser",
@@ -165,6 +260,9 @@ EMAIL_HOST_PASSWORD = SENDGRID_API_KEY
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_USER = os.getenv("EMAIL_USER")
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 30
 
 
 # taggit settings
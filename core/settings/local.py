@@ -1,4 +1,4 @@
-from .base import ALLOWED_HOSTS
+from .base import ALLOWED_HOSTS, BASE_DIR
 
 DEBUG = True
 
@@ -6,3 +6,7 @@ ALLOWED_HOSTS += [
     "localhost",
     "127.0.0.1",
 ]
+
+# emails sent by send_outbox are written to files instead of SendGrid
+EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
+EMAIL_FILE_PATH = BASE_DIR / "sent_emails"
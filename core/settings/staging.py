@@ -1,5 +1,10 @@
+import os
+
 from core.settings.base import ALLOWED_HOSTS
 
 DEBUG = False
 
 ALLOWED_HOSTS += [".herokuapp.com"]
+
+# Heroku's router appends the one hop in front of the app
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "1"))
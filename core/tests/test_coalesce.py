@@ -0,0 +1,137 @@
+import time
+from threading import Event, Thread
+from typing import Any, List
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from core.coalesce import SingleFlight, cached_payload
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestSingleFlight(TestCase):
+    def test_concurrent_callers_share_one_call(self) -> None:
+        flight = SingleFlight()
+        started, release = Event(), Event()
+        calls: List[int] = []
+        results: List[Any] = []
+
+        def compute() -> str:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        leader = Thread(
+            target=lambda: results.append(flight.do("key", compute))
+        )
+        leader.start()
+        started.wait(5)
+        followers = [
+            Thread(target=lambda: results.append(flight.do("key", compute)))
+            for _ in range(5)
+        ]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result == "result" for result, _ in results))
+        self.assertEqual(sum(shared for _, shared in results), 5)
+
+    def test_errors_are_raised_and_not_cached(self) -> None:
+        flight = SingleFlight()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", fail)
+        self.assertEqual(flight.do("key", lambda: "ok"), ("ok", False))
+
+
+class TestCachedPayload(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_payload_is_computed_once_per_ttl(self) -> None:
+        calls = []
+
+        def compute() -> Any:
+            calls.append(1)
+            return 200, [], b"body"
+
+        cached_payload("key", compute)
+        self.assertEqual(cached_payload("key", compute), (200, [], b"body"))
+        self.assertEqual(len(calls), 1)
+
+    def test_error_responses_are_not_cached(self) -> None:
+        calls = []
+
+        def compute() -> Any:
+            calls.append(1)
+            return 404, [], b""
+
+        cached_payload("key", compute)
+        cached_payload("key", compute)
+        self.assertEqual(len(calls), 2)
+
+    def test_waiters_use_the_lock_holders_result(self) -> None:
+        cache.add("key:lock", 1, 1)
+        cache.set("key", (200, [], b"from another worker"), 1)
+        self.assertEqual(
+            cached_payload("key", lambda: (200, [], b"recomputed")),
+            (200, [], b"from another worker"),
+        )
+
+
+class TestCoalescedGetMixin(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.password = fake.password()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=self.password,
+        )
+        self.article = Article.objects.create(
+            title=fake.name(), body=fake.text(), author=self.user
+        )
+        self.url = reverse(
+            "article-detail", kwargs={"slug": self.article.slug}
+        )
+
+    def test_anonymous_gets_are_served_from_the_shared_response(
+        self,
+    ) -> None:
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+
+    def test_authenticated_gets_are_not_coalesced(self) -> None:
+        response = self.client.post(
+            reverse("login"),
+            data={"email": self.user.email, "password": self.password},
+            format="json",
+        )
+        self.client.credentials(  # type: ignore[attr-defined]
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"  # type: ignore[attr-defined]
+        )
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+        self.assertIn("favorited", response.json())
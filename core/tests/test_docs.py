@@ -0,0 +1,68 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from core.docs import load_schema
+
+
+class TestSchemaDocs(APITestCase):
+    def test_stored_schema_is_up_to_date(self) -> None:
+        # fails when an API change wasn't followed by manage.py build_schema
+        call_command("build_schema", "--check")
+
+    def test_check_fails_on_stale_schema(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "openapi.json"
+            with override_settings(OPENAPI_SCHEMA_PATH=path):
+                with self.assertRaises(CommandError):
+                    call_command("build_schema", "--check")
+                path.write_text("{}")
+                with self.assertRaises(CommandError):
+                    call_command("build_schema", "--check")
+                call_command("build_schema")
+                call_command("build_schema", "--check")
+
+    def test_schema_json_is_served_with_etag(self) -> None:
+        response = self.client.get(reverse("schema-json"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["swagger"], "2.0")
+        self.assertIn("/users/", json.loads(response.content)["paths"])
+
+        response = self.client.get(
+            reverse("schema-json"), HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_schema_yaml(self) -> None:
+        response = self.client.get(reverse("schema-yaml"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.content.startswith(b"swagger: '2.0'"))
+        self.assertIn("ETag", response)
+
+    def test_missing_schema_is_generated(self) -> None:
+        path = Path(tempfile.gettempdir()) / "missing-openapi.json"
+        self.assertFalse(path.exists())
+        self.assertEqual(
+            json.loads(load_schema(path).content)["info"]["title"],
+            "CONVINT API",
+        )
+
+    def test_swagger_ui(self) -> None:
+        response = self.client.get(reverse("schema-swagger-ui"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "CONVINT API")
+        self.assertContains(response, reverse("schema-json"))
+
+    def test_legacy_openapi_format(self) -> None:
+        response = self.client.get(
+            reverse("schema-swagger-ui"), {"format": "openapi"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
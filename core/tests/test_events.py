@@ -0,0 +1,209 @@
+import asyncio
+from threading import Event as Flag
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from redis import ConnectionError
+from redis.client import PubSubWorkerThread
+
+from core.asgi import Handler, application
+from core.checks import check_events_backend
+from core.events import (
+    Broker,
+    Event,
+    LocalBackend,
+    RedisBackend,
+    broker,
+    stream,
+)
+
+
+class TestBroker(SimpleTestCase):
+    def test_encodes_server_sent_events(self) -> None:
+        event = Event("counts", {"slug": "a", "likes_count": 2})
+        self.assertEqual(
+            event.encode(),
+            b'event: counts\ndata: {"slug":"a","likes_count":2}\n\n',
+        )
+
+    def test_delivers_to_every_stream(self) -> None:
+        local = Broker()
+
+        async def subscribe() -> List[Event]:
+            first, second = local.subscribe(), local.subscribe()
+            local.publish("article", {"slug": "a"})
+            events = [await first.get(), await second.get()]
+            local.unsubscribe(first)
+            local.publish("article", {"slug": "b"})
+            self.assertTrue(first.empty())
+            events.append(await second.get())
+            return events
+
+        self.assertIsInstance(local.backend, LocalBackend)
+        events = asyncio.run(subscribe())
+        self.assertEqual(
+            [event.data["slug"] for event in events], ["a", "a", "b"]
+        )
+
+    def test_delivers_once_per_loop(self) -> None:
+        local = Broker()
+
+        async def subscribe() -> int:
+            loop = asyncio.get_running_loop()
+            queues = [local.subscribe() for _ in range(3)]
+            with patch.object(
+                loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+            ) as call_soon:
+                local.publish("article", {"slug": "a"})
+            for queue in queues:
+                self.assertEqual((await queue.get()).data["slug"], "a")
+                local.unsubscribe(queue)
+            return call_soon.call_count
+
+        self.assertEqual(asyncio.run(subscribe()), 1)
+        self.assertEqual(local.streams, {})
+
+    def test_slow_streams_drop_the_oldest_events(self) -> None:
+        local = Broker(queue_size=2)
+
+        async def subscribe() -> List[str]:
+            queue = local.subscribe()
+            for slug in "abc":
+                local.publish("article", {"slug": slug})
+            await asyncio.sleep(0)
+            return [(await queue.get()).data["slug"] for _ in range(2)]
+
+        self.assertEqual(asyncio.run(subscribe()), ["b", "c"])
+
+
+@override_settings(EVENTS_REDIS_URL="redis://localhost:6379/0")
+class TestRedisBackend(SimpleTestCase):
+    def setUp(self) -> None:
+        self.backend = RedisBackend(Mock())
+        self.backend.client = Mock()
+        self.backend.reconnect_interval = 0
+
+    def test_dead_listeners_are_replaced(self) -> None:
+        self.backend.listen()
+        self.backend.listen()
+        self.assertEqual(self.backend.client.pubsub.call_count, 1)
+        self.backend.listener = Mock(**{"is_alive.return_value": False})
+        self.backend.listen()
+        self.assertEqual(self.backend.client.pubsub.call_count, 2)
+        pubsub = self.backend.client.pubsub.return_value
+        pubsub.run_in_thread.assert_called_with(
+            sleep_time=1, daemon=True, exception_handler=self.backend.recover
+        )
+
+    def test_listener_survives_errors(self) -> None:
+        reconnected = Flag()
+        errors = [ConnectionError("Redis went away")]
+
+        def get_message(**kwargs: Any) -> None:
+            if errors:
+                raise errors.pop()
+            reconnected.set()
+
+        pubsub = Mock(**{"get_message.side_effect": get_message})
+        listener = PubSubWorkerThread(
+            pubsub, 0, daemon=True, exception_handler=self.backend.recover
+        )
+        with self.assertLogs("core.events", "WARNING"):
+            listener.start()
+            self.assertTrue(reconnected.wait(5))
+        self.assertTrue(listener.is_alive())
+        listener.stop()
+        listener.join(5)
+
+
+class TestEventsBackendCheck(SimpleTestCase):
+    @override_settings(DEBUG=False, EVENTS_BACKEND="core.events.LocalBackend")
+    def test_local_backend_outside_debug(self) -> None:
+        (error,) = check_events_backend(None)
+        self.assertEqual(error.id, "core.E001")
+
+    @override_settings(DEBUG=True, EVENTS_BACKEND="core.events.LocalBackend")
+    def test_local_backend_in_debug(self) -> None:
+        self.assertEqual(check_events_backend(None), [])
+
+    @override_settings(DEBUG=False, EVENTS_BACKEND="core.events.RedisBackend")
+    def test_redis_backend(self) -> None:
+        self.assertEqual(check_events_backend(None), [])
+
+
+class TestEventStream(SimpleTestCase):
+    def run_stream(self, method: str = "GET") -> List[Dict[str, Any]]:
+        """
+        Runs the ASGI application, publishing an event once the stream
+        started and disconnecting once it was sent
+        """
+        messages: List[Dict[str, Any]] = []
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": "/api/v1/articles/events/",
+        }
+
+        async def run() -> None:
+            disconnect = asyncio.Event()
+
+            async def receive() -> Dict[str, Any]:
+                await disconnect.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message: Dict[str, Any]) -> None:
+                messages.append(message)
+                if message.get("body", b"").startswith(b"retry"):
+                    broker.publish("article", {"slug": "new"})
+                elif message.get("body", b"").startswith(b"event"):
+                    disconnect.set()
+
+            await asyncio.wait_for(application(scope, receive, send), 5)
+
+        asyncio.run(run())
+        return messages
+
+    def test_streams_events_until_disconnect(self) -> None:
+        start, retry, event = self.run_stream()
+        self.assertEqual(start["status"], 200)
+        self.assertIn(
+            (b"content-type", b"text/event-stream"), start["headers"]
+        )
+        self.assertEqual(retry["body"], b"retry: 3000\n\n")
+        self.assertEqual(
+            event["body"], b'event: article\ndata: {"slug":"new"}\n\n'
+        )
+        self.assertEqual(broker.streams, {})
+        self.assertEqual(broker.loops, {})
+
+    @override_settings(EVENTS_HEARTBEAT_INTERVAL=0.01)
+    def test_sends_heartbeats_while_idle(self) -> None:
+        messages: List[Dict[str, Any]] = []
+        scope = {"type": "http", "method": "GET", "path": "/"}
+
+        async def receive() -> Dict[str, Any]:
+            while len(messages) < 3:
+                await asyncio.sleep(0.01)
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            messages.append(message)
+
+        asyncio.run(asyncio.wait_for(stream(scope, receive, send), 5))
+        self.assertEqual(messages[2]["body"], b": heartbeat\n\n")
+
+    def test_django_runs_without_whitenoise(self) -> None:
+        with patch(
+            "whitenoise.middleware.WhiteNoiseMiddleware.__init__",
+            side_effect=AssertionError("WhiteNoise is sync only"),
+        ):
+            Handler()
+        self.assertIn(
+            "whitenoise.middleware.WhiteNoiseMiddleware", settings.MIDDLEWARE
+        )
+
+    def test_only_get(self) -> None:
+        start, body = self.run_stream(method="POST")
+        self.assertEqual(start["status"], 405)
@@ -0,0 +1,78 @@
+from typing import List
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from rest_framework.reverse import reverse
+
+from articles.fastpath import article_rows
+from articles.models import Article, ArticleBody
+from core.fields import RAW, ZLIB, compress, decompress
+
+LONG = "compression pays off on long repetitive text " * 100
+
+
+class TestCompression(TestCase):
+    def test_round_trip(self) -> None:
+        for text in ("", "short", LONG, "ünïcode " * 100):
+            self.assertEqual(decompress(compress(text, 256, 6)), text)
+
+    def test_threshold(self) -> None:
+        self.assertEqual(compress("short", 256, 6), RAW + b"short")
+        stored = compress(LONG, 256, 6)
+        self.assertEqual(stored[:1], ZLIB)
+        self.assertLess(len(stored), len(LONG) // 10)
+
+    def test_decompress_accepts_text_and_views(self) -> None:
+        self.assertIsNone(decompress(None))
+        self.assertEqual(decompress("text"), "text")
+        self.assertEqual(decompress(memoryview(RAW + b"text")), "text")
+
+
+class TestCompressedTextField(TestCase):
+    def setUp(self) -> None:
+        self.article = Article.objects.create(title="Compressed", body=LONG)
+
+    def stored(self) -> bytes:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT text FROM articles_articlebody WHERE article_id = %s",
+                [self.article.pk],
+            )
+            return bytes(cursor.fetchone()[0])
+
+    def test_stored_compressed(self) -> None:
+        self.assertEqual(self.stored()[:1], ZLIB)
+        self.assertEqual(Article.objects.get(pk=self.article.pk).body, LONG)
+
+    def test_decompressed_on_first_read(self) -> None:
+        body = ArticleBody.objects.get(pk=self.article.pk)
+        self.assertIsInstance(body.__dict__["text"], bytes)
+        self.assertEqual(body.text, LONG)
+        self.assertIsInstance(body.__dict__["text"], str)
+
+    def test_saving_unread_text_keeps_it(self) -> None:
+        stored = self.stored()
+        body = ArticleBody.objects.get(pk=self.article.pk)
+        body.save()
+        self.assertIsInstance(body.__dict__["text"], bytes)
+        self.assertEqual(self.stored(), stored)
+
+    def test_fast_path_decompresses(self) -> None:
+        (row,) = article_rows(Article.objects.filter(pk=self.article.pk))
+        self.assertEqual(decompress(row["article_body__text"]), LONG)
+
+    def search(self, terms: str) -> List[str]:
+        cache.clear()
+        response = self.client.get(reverse("articles"), {"search": terms})
+        return [article["slug"] for article in response.json()["results"]]
+
+    def test_search_matches_bodies_on_postgres(self) -> None:
+        postgres = connection.vendor == "postgresql"
+        # stemmed by the text search configuration
+        self.assertEqual(
+            self.search("repetitive compressions"),
+            [self.article.slug] if postgres else [],
+        )
+        # elsewhere there are no search vectors, only the other fields
+        self.assertEqual(self.search("compressed"), [self.article.slug])
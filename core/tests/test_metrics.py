@@ -0,0 +1,139 @@
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from faker import Faker
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from users.models import OutboxEmail
+
+fake = Faker()
+User = get_user_model()
+
+MULTIPROCESS_SCRIPT = """
+import os
+import django
+
+django.setup()
+from core.metrics import record_cache, render_metrics
+
+pid = os.fork()
+record_cache("test", True)
+if pid == 0:
+    os._exit(0)
+os.waitpid(pid, 0)
+print(render_metrics().decode())
+"""
+
+
+def sample(name: str, **labels: Any) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetrics(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        Article.objects.create(
+            title=fake.name(), body=fake.text(), author=self.user
+        )
+
+    def test_requests_are_recorded_per_url_name(self) -> None:
+        labels = {"url_name": "articles", "method": "GET", "status": "2xx"}
+        count = sample("http_request_duration_seconds_count", **labels)
+        queries = sample("db_queries_total", url_name="articles")
+        misses = sample(
+            "cache_requests_total", cache="coalesce", result="miss"
+        )
+
+        self.client.get(reverse("articles"))
+
+        self.assertEqual(
+            sample("http_request_duration_seconds_count", **labels),
+            count + 1,
+        )
+        self.assertGreater(
+            sample("db_queries_total", url_name="articles"), queries
+        )
+        self.assertEqual(
+            sample("cache_requests_total", cache="coalesce", result="miss"),
+            misses + 1,
+        )
+
+    async def test_async_requests_count_queries_of_their_threads(self) -> None:
+        # collecting the metrics queries the outbox
+        queries = await sync_to_async(sample)(
+            "db_queries_total", url_name="articles-async"
+        )
+        # the ASGI stack, every middleware running as a coroutine
+        with override_settings(MIDDLEWARE=settings.ASGI_MIDDLEWARE):
+            response = await self.async_client.get(reverse("articles-async"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(
+            await sync_to_async(sample)(
+                "db_queries_total", url_name="articles-async"
+            ),
+            queries,
+        )
+
+    @override_settings(DEBUG=True, METRICS_TOKEN=None)
+    def test_metrics_endpoint(self) -> None:
+        OutboxEmail.objects.create(
+            recipient="someone@example.com", subject="hi", body="hello"
+        )
+        self.client.get(reverse("articles"))
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertContains(
+            response, 'email_outbox_depth{status="pending"} 1.0'
+        )
+        self.assertContains(response, "http_requests_in_progress")
+        self.assertContains(response, 'url_name="articles"')
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self) -> None:
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(DEBUG=False, METRICS_TOKEN=None)
+    def test_metrics_disabled_without_token(self) -> None:
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_multiprocess_mode_aggregates_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            result = subprocess.run(
+                [sys.executable, "-c", MULTIPROCESS_SCRIPT],
+                env={
+                    **os.environ,
+                    "DJANGO_SETTINGS_MODULE": "core.settings",
+                    "PROMETHEUS_MULTIPROC_DIR": directory,
+                },
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        self.assertIn(
+            'cache_requests_total{cache="test",result="hit"} 2.0',
+            result.stdout,
+        )
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from core.pagination import EstimatedCountPaginator, estimated_count
+
+User = get_user_model()
+
+
+@override_settings(ESTIMATED_COUNT_THRESHOLD=1000)
+class TestEstimatedCountPaginator(TestCase):
+    def setUp(self) -> None:
+        for index in range(3):
+            User.objects.create_user(
+                email=f"page-{index}@example.com",
+                password="password",
+                username=f"page-{index}",
+            )
+
+    def test_large_tables_use_the_estimate(self) -> None:
+        with patch("core.pagination.table_estimate", return_value=5000):
+            paginator = EstimatedCountPaginator(
+                User.objects.order_by("pk"), 100
+            )
+            with self.assertNumQueries(0):
+                self.assertEqual(paginator.count, 5000)
+            self.assertEqual(paginator.num_pages, 50)
+
+    def test_small_tables_are_counted(self) -> None:
+        with patch("core.pagination.table_estimate", return_value=10):
+            paginator = EstimatedCountPaginator(
+                User.objects.order_by("pk"), 100
+            )
+            self.assertEqual(paginator.count, 3)
+
+    def test_filtered_querysets_are_counted(self) -> None:
+        with patch(
+            "core.pagination.table_estimate", return_value=5000
+        ) as estimate:
+            paginator = EstimatedCountPaginator(
+                User.objects.filter(username="page-1"), 100
+            )
+            self.assertEqual(paginator.count, 1)
+        estimate.assert_not_called()
+
+    def test_no_estimate_outside_postgres(self) -> None:
+        self.assertIsNone(estimated_count(User.objects.all()))
+        self.assertIsNone(estimated_count([1, 2, 3]))
@@ -0,0 +1,97 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from core.profiling import RequestProfile, profile_buffer, profile_request
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestRequestProfile(TestCase):
+    def test_repeated_queries_are_attributed_to_their_caller(self) -> None:
+        with profile_request(RequestProfile(sampled=True)) as profile:
+            for _ in range(3):
+                User.objects.filter(email="someone@example.com").exists()
+            User.objects.count()
+
+        self.assertEqual(profile.queries, 4)
+        self.assertGreater(profile.durations["db"], 0)
+        (duplicate,) = profile.duplicates()
+        self.assertEqual(duplicate["count"], 3)
+        self.assertIn("users_user", duplicate["sql"])
+        self.assertIn("core/tests/test_profiling.py", duplicate["stack"][-1])
+
+    def test_unsampled_requests_skip_stacks(self) -> None:
+        with profile_request(RequestProfile(sampled=False)) as profile:
+            User.objects.exists()
+            User.objects.exists()
+        self.assertEqual(profile.queries, 2)
+        self.assertEqual(profile.duplicates(), [])
+
+
+@override_settings(REQUEST_PROFILING=True, REQUEST_PROFILING_SAMPLE_RATE=1)
+class TestProfilingMiddleware(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        profile_buffer.clear()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        Article.objects.create(
+            title=fake.name(), body=fake.text(), author=self.user
+        )
+
+    def test_server_timing_header(self) -> None:
+        response = self.client.get(reverse("articles"))
+        metrics = [
+            metric.split(";")[0]
+            for metric in response["Server-Timing"].split(", ")
+        ]
+        self.assertEqual(
+            metrics, ["db", "auth", "serialize", "render", "total"]
+        )
+        self.assertIn("queries", response["Server-Timing"])
+
+    async def test_async_requests(self) -> None:
+        with override_settings(MIDDLEWARE=settings.ASGI_MIDDLEWARE):
+            response = await self.async_client.get(reverse("articles-async"))
+        self.assertNotIn('"0 queries"', response["Server-Timing"])
+
+    def test_sampled_requests_are_recorded(self) -> None:
+        self.client.get(reverse("articles"))
+        (entry,) = profile_buffer.snapshot()
+        self.assertEqual(entry["url_name"], "articles")
+        self.assertEqual(entry["status"], status.HTTP_200_OK)
+        self.assertGreater(entry["queries"], 0)
+        self.assertGreater(entry["serialize_ms"], 0)
+
+    def test_debug_endpoint_is_staff_only(self) -> None:
+        url = reverse("debug-requests")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["enabled"])
+        self.assertEqual(len(response.json()["results"]), 2)
+
+
+class TestProfilingDisabled(APITestCase):
+    def test_no_server_timing_header(self) -> None:
+        response = self.client.get(reverse("articles"))
+        self.assertNotIn("Server-Timing", response)
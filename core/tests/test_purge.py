@@ -0,0 +1,149 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from taggit.models import TaggedItem
+
+from articles.models import Article
+from core.purge import purge_deleted
+from users.models import Profile, UserFollowing
+from users.serializers import UserTokenObtainPairSerializer
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestSoftDeleteAndPurge(APITestCase):
+    def setUp(self) -> None:
+        self.users = [
+            User.objects.create_user(
+                email=f"purge-{index}@example.com",
+                password="password",
+                username=f"purge-{index}",
+            )
+            for index in range(5)
+        ]
+        self.heavy, self.reader = self.users[0], self.users[1]
+        Profile.objects.create(user=self.heavy)
+        for user in self.users[1:]:
+            UserFollowing.objects.create(follower=user, followed=self.heavy)
+            UserFollowing.objects.create(follower=self.heavy, followed=user)
+        self.articles = [
+            Article.objects.create(
+                title=fake.sentence(), body=fake.text(), author=self.heavy
+            )
+            for _ in range(3)
+        ]
+        for article in self.articles:
+            article.tags.add("purge")
+            article.likes.add(self.heavy, *self.users[2:])
+            article.dislikes.add(self.reader)
+
+    def authenticate(self, user: object) -> None:
+        token = UserTokenObtainPairSerializer.get_token(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def purge(self, batch_size: int = 2) -> dict:
+        with mock.patch("cloudinary.uploader.destroy") as destroy:
+            counts = purge_deleted(batch_size, progress=lambda message: None)
+        self.destroyed = destroy
+        return counts
+
+    def test_user_delete_hides_user_immediately(self) -> None:
+        self.authenticate(self.heavy)
+        response = self.client.delete(
+            reverse("user-detail", kwargs={"lookup_id": self.heavy.lookup_id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        # the rows referencing the user are left to the purge
+        self.assertEqual(UserFollowing.objects.count(), 8)
+
+        # the deleted user's tokens stop working
+        response = self.client.get(reverse("articles"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.authenticate(self.reader)
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": self.articles[0].slug})
+        )
+        self.assertIsNone(response.data["author"])
+        self.assertEqual(response.data["likes_count"], 3)
+        response = self.client.get(
+            reverse("user-follow", kwargs={"lookup_id": self.reader.lookup_id})
+        )
+        self.assertEqual(response.data["following"], [])
+        self.assertEqual(response.data["followers"], [])
+        response = self.client.get(
+            reverse("profile", kwargs={"lookup_id": self.heavy.lookup_id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # the email can be registered again
+        self.assertFalse(User.objects.filter(pk=self.heavy.pk).exists())
+        User.objects.create_user(
+            email="purge-0@example.com", password="password", username="new"
+        )
+
+    def test_purge_user_in_batches(self) -> None:
+        self.heavy.soft_delete()
+        orphan = UserFollowing.objects.create(follower=None, followed=None)
+
+        counts = self.purge()
+        self.assertEqual(counts["users"], 1)
+        self.assertEqual(counts["follows"], 8)
+        self.assertEqual(counts["likes"], 3)
+        self.assertEqual(counts["detached articles"], 3)
+        self.assertEqual(counts["orphaned follows"], 1)
+        self.assertFalse(User.all_objects.filter(pk=self.heavy.pk).exists())
+        self.assertFalse(Profile.objects.filter(user=self.heavy).exists())
+        self.assertFalse(UserFollowing.objects.filter(pk=orphan.pk).exists())
+        self.assertEqual(
+            Article.objects.filter(author=None).count(), len(self.articles)
+        )
+        self.assertEqual(
+            Article.likes.through.objects.count(), 3 * len(self.users[2:])
+        )
+        self.assertEqual(self.purge(), {"orphaned follows": 0})
+
+    def test_article_delete_and_purge(self) -> None:
+        article = self.articles[0]
+        self.authenticate(self.heavy)
+        response = self.client.delete(
+            reverse("article-detail", kwargs={"slug": article.slug})
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        response = self.client.get(
+            reverse("article-detail", kwargs={"slug": article.slug})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn(article, self.heavy.likes.all())
+
+        counts = self.purge(batch_size=1)
+        self.assertEqual(counts["articles"], 1)
+        self.assertEqual(counts["likes"], 4)
+        self.assertEqual(counts["dislikes"], 1)
+        self.assertEqual(counts["tagged items"], 1)
+        self.assertFalse(Article.all_objects.filter(pk=article.pk).exists())
+        self.assertFalse(TaggedItem.objects.filter(object_id=article.pk))
+        self.assertEqual(User.objects.count(), len(self.users))
+
+    def test_images_are_destroyed(self) -> None:
+        Article.objects.filter(pk=self.articles[0].pk).update(
+            image="image/upload/v1/post_images/cover.png"
+        )
+        Article.objects.get(pk=self.articles[0].pk).soft_delete()
+        counts = self.purge()
+        self.assertEqual(counts["images"], 1)
+        self.destroyed.assert_called_once_with("post_images/cover")
+
+    def test_command(self) -> None:
+        self.articles[1].soft_delete()
+        output = StringIO()
+        with mock.patch("cloudinary.uploader.destroy"):
+            call_command("purge_deleted", "--batch-size", "10", stdout=output)
+        self.assertIn("1 articles", output.getvalue())
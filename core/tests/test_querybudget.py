@@ -0,0 +1,63 @@
+import pytest
+from django.contrib.auth import get_user_model
+from faker import Faker
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from core.querybudget import Budget, QueryBudgetMixin, budget_for
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestQueryBudget(QueryBudgetMixin, APITestCase):
+    def test_exceeded_budget_lists_sql_by_call_site(self) -> None:
+        with self.assertRaises(AssertionError) as raised:
+            with self.assertQueryBudget("users", Budget(1)):
+                User.objects.exists()
+                User.objects.count()
+        message = str(raised.exception)
+        self.assertIn("users: 2 queries, budget is 1", message)
+        self.assertIn("core/tests/test_querybudget.py", message)
+        self.assertIn('1 x SELECT COUNT(*) AS "__count"', message)
+
+    def test_duplicate_budget(self) -> None:
+        with self.assertRaises(AssertionError) as raised:
+            with self.assertQueryBudget("users", Budget(5)):
+                for _ in range(3):
+                    User.objects.exists()
+        self.assertIn(
+            "2 duplicate queries, budget is 0", str(raised.exception)
+        )
+
+        with self.assertQueryBudget("users", Budget(5, max_duplicates=None)):
+            for _ in range(3):
+                User.objects.exists()
+
+    def test_flat_queries(self) -> None:
+        users = []
+        with self.assertRaises(AssertionError):
+            self.assertFlatQueries(
+                "users",
+                lambda: [User.objects.exists() for _ in users],
+                lambda: users.append(1),
+            )
+
+    def test_method_budgets(self) -> None:
+        self.assertEqual(budget_for("articles", "POST").max_queries, 35)
+        self.assertEqual(budget_for("articles", "GET"), Budget(6))
+        self.assertIsNone(budget_for("unknown"))
+
+    @pytest.mark.query_budget({"user-detail": Budget(0)})
+    def test_marker_checks_client_requests(self) -> None:
+        user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        self.client.force_authenticate(user)
+        with self.assertRaises(AssertionError) as raised:
+            self.client.get(
+                reverse("user-detail", kwargs={"lookup_id": user.lookup_id})
+            )
+        self.assertIn("GET user-detail", str(raised.exception))
@@ -0,0 +1,109 @@
+import datetime
+import decimal
+import json
+import uuid
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
+
+import msgpack
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from faker import Faker
+from rest_framework import status
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+
+fake = Faker()
+User = get_user_model()
+
+DATA = OrderedDict(
+    [
+        (
+            "utc",
+            datetime.datetime(2022, 5, 1, 8, 30, 5, 123456, ZoneInfo("UTC")),
+        ),
+        (
+            "nairobi",
+            datetime.datetime(
+                2022, 5, 1, 8, 30, tzinfo=ZoneInfo("Africa/Nairobi")
+            ),
+        ),
+        ("naive", datetime.datetime(2022, 5, 1, 8, 30)),
+        ("date", datetime.date(2022, 5, 1)),
+        ("time", datetime.time(8, 30, 1)),
+        ("duration", datetime.timedelta(minutes=90)),
+        ("decimal", decimal.Decimal("1.25")),
+        ("uuid", uuid.UUID("12345678-1234-5678-1234-567812345678")),
+        ("lazy", gettext_lazy("This field is required.")),
+        ("error", [ErrorDetail("Invalid", code="invalid")]),
+        ("text", 'Ünïcødé \u2028 line \u2029 \x01 "quoted" </script>'),
+        ("numbers", [1, -2, 3.5, 10**12, True, False, None]),
+        ("tuple", (1, 2)),
+        ("keys", {1: "one"}),
+        ("nested", {"a": [{"b": OrderedDict(c=[])}]}),
+    ]
+)
+
+
+class TestRenderers(SimpleTestCase):
+    def test_json_matches_drf(self) -> None:
+        self.assertEqual(
+            ORJSONRenderer().render(DATA), JSONRenderer().render(DATA)
+        )
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_msgpack_matches_json(self) -> None:
+        content = MessagePackRenderer().render(DATA)
+        self.assertEqual(
+            msgpack.unpackb(content, strict_map_key=False),
+            {
+                **json.loads(JSONRenderer().render(DATA)),
+                # msgpack keeps integer keys
+                "keys": {1: "one"},
+            },
+        )
+
+
+class TestContentNegotiation(APITestCase):
+    def setUp(self) -> None:
+        self.password = fake.password()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=self.password,
+        )
+
+    def test_msgpack_response(self) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("user-detail", kwargs={"lookup_id": self.user.lookup_id})
+        response = self.client.get(url)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        packed = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(packed["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(packed.content), response.json())
+
+    def test_msgpack_request(self) -> None:
+        response = self.client.post(
+            reverse("login"),
+            {"email": self.user.email, "password": self.password},
+            format="msgpack",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json())
+
+    def test_malformed_bodies(self) -> None:
+        for content_type, body in (
+            ("application/json", b'{"email": '),
+            ("application/msgpack", b"\xc1"),
+        ):
+            response = self.client.post(
+                reverse("login"), body, content_type=content_type
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("parse error", response.json()["detail"])
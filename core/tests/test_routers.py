@@ -0,0 +1,162 @@
+import asyncio
+import time
+from threading import Event
+from typing import Any
+from unittest.mock import patch
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.middleware import PRIMARY_COOKIE, ReplicaRoutingMiddleware
+from core.routers import (
+    ReplicaHealth,
+    ReplicaRouter,
+    current_replica,
+    replica_lag,
+)
+
+
+class ReadView:
+    read_from_replica = True
+
+
+class WriteView:
+    pass
+
+
+def view_for(view_class: Any) -> Any:
+    def view(request: HttpRequest) -> HttpResponse:
+        return HttpResponse()
+
+    view.cls = view_class  # type: ignore[attr-defined]
+    return view
+
+
+@override_settings(DATABASE_REPLICAS=["replica_0"])
+@patch("core.middleware.replica_health.choose", return_value="replica_0")
+class TestReplicaRoutingMiddleware(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+
+    def dispatch(self, request: HttpRequest, view: Any) -> Any:
+        seen = {}
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            middleware.process_view(request, view, (), {})
+            seen["db"] = self.router.db_for_read(None)
+            return view(request)  # type: ignore[no-any-return]
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        response = middleware(request)
+        return seen["db"], response
+
+    async def test_async_requests(self, choose: Any) -> None:
+        seen = {}
+        view = view_for(ReadView)
+
+        async def get_response(request: HttpRequest) -> HttpResponse:
+            await middleware.process_view(request, view, (), {})
+            seen["db"] = self.router.db_for_read(None)
+            return view(request)  # type: ignore[no-any-return]
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        self.assertTrue(asyncio.iscoroutinefunction(middleware.process_view))
+        await middleware(self.factory.get("/"))
+        self.assertEqual(seen["db"], "replica_0")
+        self.assertIsNone(current_replica.get())
+
+    def test_flagged_read_goes_to_replica(self, choose: Any) -> None:
+        db, _ = self.dispatch(self.factory.get("/"), view_for(ReadView))
+        self.assertEqual(db, "replica_0")
+        self.assertIsNone(current_replica.get())
+
+    def test_unflagged_read_goes_to_primary(self, choose: Any) -> None:
+        db, _ = self.dispatch(self.factory.get("/"), view_for(WriteView))
+        self.assertIsNone(db)
+
+    def test_write_pins_client_to_primary(self, choose: Any) -> None:
+        db, response = self.dispatch(
+            self.factory.post("/"), view_for(ReadView)
+        )
+        self.assertIsNone(db)
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+        request = self.factory.get("/")
+        request.COOKIES[PRIMARY_COOKIE] = response.cookies[
+            PRIMARY_COOKIE
+        ].value
+        db, _ = self.dispatch(request, view_for(ReadView))
+        self.assertIsNone(db)
+
+    def test_expired_pin_reads_from_replica(self, choose: Any) -> None:
+        request = self.factory.get("/")
+        request.COOKIES[PRIMARY_COOKIE] = "0"
+        db, _ = self.dispatch(request, view_for(ReadView))
+        self.assertEqual(db, "replica_0")
+
+    def test_writes_go_to_primary(self, choose: Any) -> None:
+        token = current_replica.set("replica_0")
+        try:
+            self.assertEqual(self.router.db_for_write(None), "default")
+        finally:
+            current_replica.reset(token)
+
+
+@override_settings(
+    DATABASE_REPLICAS=["replica_0", "replica_1"], REPLICA_MAX_LAG=5
+)
+class TestReplicaHealth(TestCase):
+    def test_lagging_and_unreachable_replicas_are_skipped(self) -> None:
+        def lag(alias: str) -> float:
+            if alias == "replica_1":
+                raise ConnectionError
+            return 1.0
+
+        with patch("core.routers.replica_lag", side_effect=lag), patch(
+            "core.routers.connections"
+        ):
+            health = ReplicaHealth()
+            health.check()
+            self.assertEqual(health.healthy_replicas(), ["replica_0"])
+
+        with patch("core.routers.replica_lag", return_value=10.0):
+            health = ReplicaHealth()
+            health.check()
+            self.assertEqual(health.healthy_replicas(), [])
+
+    def test_health_is_checked_periodically(self) -> None:
+        health = ReplicaHealth()
+        with patch("core.routers.replica_lag", return_value=0.0) as lag, patch(
+            "core.routers.connections"
+        ):
+            health.check_in_background().join()
+            health.healthy_replicas()
+        self.assertEqual(lag.call_count, 2)
+
+    def test_requests_do_not_wait_for_checks(self) -> None:
+        health = ReplicaHealth()
+        health.healthy = ["replica_0"]
+        unblock = Event()
+
+        def slow_lag(alias: str) -> float:
+            unblock.wait(5)
+            return 0.0
+
+        with patch("core.routers.replica_lag", side_effect=slow_lag), patch(
+            "core.routers.connections"
+        ), patch.object(
+            health, "check_in_background", wraps=health.check_in_background
+        ) as start:
+            # stale results are served while the check is running
+            self.assertEqual(health.healthy_replicas(), ["replica_0"])
+            self.assertEqual(health.healthy_replicas(), ["replica_0"])
+            start.assert_called_once()
+            unblock.set()
+            while health.checking:
+                time.sleep(0.01)
+        self.assertEqual(health.healthy_replicas(), ["replica_0", "replica_1"])
+
+    def test_lag_query_runs_against_the_database(self) -> None:
+        self.assertEqual(replica_lag("default"), 0.0)
@@ -0,0 +1,92 @@
+from io import StringIO
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from taggit.models import Tag
+
+from articles.models import Article
+from core.seeding import activity, popularity
+from users.models import UserFollowing
+
+User = get_user_model()
+
+
+def seed_scale(**options: int) -> str:
+    out = StringIO()
+    call_command(
+        "seed_scale",
+        users=50,
+        articles=40,
+        tags=10,
+        chunk_size=16,
+        stdout=out,
+        **options,
+    )
+    return out.getvalue()
+
+
+class TestSeedScale(TestCase):
+    def test_generates_every_table(self) -> None:
+        output = seed_scale()
+        self.assertIn("Seeded", output)
+        self.assertEqual(User.objects.count(), 50)
+        self.assertEqual(Article.objects.count(), 40)
+        self.assertEqual(Tag.objects.count(), 10)
+        self.assertTrue(UserFollowing.objects.exists())
+        self.assertTrue(Article.likes.through.objects.exists())
+
+        user = User.objects.get(username="seed0-user-0")
+        self.assertTrue(user.check_password("password"))
+        article = Article.objects.first()
+        self.assertTrue(article.slug.endswith(str(article.lookup_id)))
+        self.assertTrue(article.tags.exists())
+        # the generated ids moved the sequences along
+        self.assertEqual(
+            User.objects.create_user(
+                email="after@example.com", password="x", username="after"
+            ).pk,
+            51,
+        )
+
+    def test_is_deterministic(self) -> None:
+        seed_scale(seed=3)
+        first = list(Article.objects.values_list("slug", "author_id"))
+        follows = list(
+            UserFollowing.objects.values_list("follower_id", "followed_id")
+        )
+        UserFollowing.objects.all().delete()
+        User.objects.all().delete()
+        Article.objects.all().delete()
+        Tag.objects.all().delete()
+
+        seed_scale(seed=3)
+        self.assertCountEqual(
+            Article.objects.values_list("slug", "author_id"), first
+        )
+        self.assertCountEqual(
+            UserFollowing.objects.values_list("follower_id", "followed_id"),
+            follows,
+        )
+
+    def test_refuses_a_generated_seed(self) -> None:
+        seed_scale(seed=1)
+        with self.assertRaises(CommandError):
+            seed_scale(seed=1)
+        seed_scale(seed=2)
+        self.assertEqual(User.objects.count(), 100)
+
+
+class TestDistributions(TestCase):
+    def test_popularity_is_heavy_tailed(self) -> None:
+        weights = np.diff(popularity(0, 1000), prepend=0)
+        top = np.sort(weights)[::-1]
+        # the top 1% of users draw more than a fifth of the attention
+        self.assertGreater(top[:10].sum(), 0.2)
+
+    def test_activity(self) -> None:
+        counts = activity(np.random.default_rng(0), 20, 100_000, 5000)
+        self.assertAlmostEqual(counts.mean(), 20, delta=4)
+        self.assertGreater(counts.max(), 20 * 20)
+        self.assertLessEqual(counts.max(), 5000)
@@ -0,0 +1,55 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from core.importtime import parse_importtime, profile_imports, summarize
+
+REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     django.utils.version
+import time:       300 |        420 |   django.utils
+import time:       500 |        920 | django
+import time:        80 |         80 | yaml
+"""
+
+
+class TestImportTime(SimpleTestCase):
+    def test_parse_importtime(self) -> None:
+        modules = parse_importtime(REPORT)
+        self.assertEqual(
+            [(module.name, module.depth) for module in modules],
+            [
+                ("django.utils.version", 2),
+                ("django.utils", 1),
+                ("django", 0),
+                ("yaml", 0),
+            ],
+        )
+        self.assertEqual(modules[2].cumulative_us, 920)
+        self.assertEqual(summarize(modules), {"django": 920, "yaml": 80})
+
+    def test_settings_do_not_import_cloudinary(self) -> None:
+        names = {module.name for module in profile_imports("settings")}
+        self.assertFalse({"cloudinary", "cloudinary.api"} & names)
+
+    def test_urls_do_not_import_schema_generator(self) -> None:
+        names = {module.name for module in profile_imports("urls")}
+        self.assertIn("core.urls", names)
+        self.assertNotIn("drf_yasg.views", names)
+
+    def test_startup_profile_command(self) -> None:
+        out = StringIO()
+        call_command(
+            "startup_profile",
+            "--target",
+            "setup",
+            "--limit",
+            "3",
+            "--json",
+            stdout=out,
+        )
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["target"], "setup")
+        self.assertGreater(report["total_ms"], 0)
+        self.assertEqual(len(report["modules"]), 3)
@@ -17,29 +17,21 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import include, path
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="CONVINT API",
-        default_version="v1",
-        description="CONVINT documentation",
-        terms_of_service="https://www.skaehub.com/policies/terms/",
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
+from core.docs import schema_json, schema_yaml, swagger_ui
+from core.views import ProfiledRequestsView, metrics
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", metrics, name="metrics"),
     path("api/v1/", include("users.urls")),
+    path("docs/", swagger_ui, name="schema-swagger-ui"),
+    path("docs/openapi.json", schema_json, name="schema-json"),
+    path("docs/openapi.yaml", schema_yaml, name="schema-yaml"),
+    path("api/v1/", include("articles.urls")),
     path(
-        "docs/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
+        "api/v1/_debug/requests/",
+        ProfiledRequestsView.as_view(),
+        name="debug-requests",
     ),
-    path("api/v1/", include("articles.urls")),
 ]
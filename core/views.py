@@ -0,0 +1,49 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_safe
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.metrics import render_metrics
+from core.profiling import profile_buffer
+
+
+class ProfiledRequestsView(APIView):
+    """
+    Sampled request profiles recorded by this worker process, newest first
+    """
+
+    swagger_schema = None
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(
+            {
+                "enabled": settings.REQUEST_PROFILING,
+                "sample_rate": settings.REQUEST_PROFILING_SAMPLE_RATE,
+                "results": profile_buffer.snapshot(),
+            }
+        )
+
+
+@require_safe
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus scrape endpoint, guarded by METRICS_TOKEN. Without a token
+    it is only served in DEBUG.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            raise Http404
+    elif not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return HttpResponse(status=401)
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
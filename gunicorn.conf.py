@@ -0,0 +1,30 @@
+import os
+import shutil
+import tempfile
+from typing import Any
+
+# every worker writes its metrics here so /metrics can aggregate them. It
+# has to be set before prometheus_client is first imported, which workers
+# inherit from this process.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "convint-prometheus"),
+)
+
+
+def on_starting(server: Any) -> None:
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    from articles.viewcounts import view_counter
+
+    view_counter.flush()
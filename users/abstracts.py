@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -7,3 +8,33 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class SoftDeleteModel(models.Model):
+    """
+    Deleted rows are kept as tombstones, hidden by the default manager,
+    until the purge_deleted command removes them and the rows referencing
+    them in batches
+    """
+
+    # subclasses index it with deleted_index(), which skips live rows
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def soft_delete(self) -> None:
+        self.deleted_at = timezone.now()
+        self.save(update_fields=["deleted_at"])
+
+
+def deleted_index(name: str) -> models.Index:
+    """
+    Index of the tombstones waiting to be purged, which stays as small as
+    the backlog instead of covering every live row
+    """
+    return models.Index(
+        fields=["deleted_at"],
+        condition=models.Q(deleted_at__isnull=False),
+        name=name,
+    )
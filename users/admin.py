@@ -8,7 +8,8 @@ from django.contrib.auth.forms import ReadOnlyPasswordHashField
 from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 
-from users.models import Profile
+from core.pagination import EstimatedCountPaginator
+from users.models import OutboxEmail, Profile
 
 from .models import UserFollowing
 
@@ -94,9 +95,37 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ("email", "username")
     ordering = ("email",)
     filter_horizontal = ()
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class ProfileAdmin(admin.ModelAdmin):
+    list_display = ("user", "created_at")
+    list_select_related = ("user",)
+    search_fields = ("user__username", "user__email")
+    autocomplete_fields = ("user",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class UserFollowingAdmin(admin.ModelAdmin):
+    list_display = ("follower", "followed", "created_at")
+    list_select_related = ("follower", "followed")
+    search_fields = ("follower__username", "followed__username")
+    autocomplete_fields = ("follower", "followed")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "recipient", "status", "attempts", "sent_at")
+    list_filter = ("status",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 admin.site.register(User, UserAdmin)
 admin.site.unregister(Group)
-admin.site.register(Profile)
-admin.site.register(UserFollowing)
+admin.site.register(Profile, ProfileAdmin)
+admin.site.register(UserFollowing, UserFollowingAdmin)
+admin.site.register(OutboxEmail, OutboxEmailAdmin)
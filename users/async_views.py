@@ -0,0 +1,41 @@
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.asyncviews import AsyncAPIView
+from users.models import UserFollowing
+from users.serializers import CreateFollowingSerializer
+from users.views import UserFollowView
+
+
+class AsyncUserFollowView(AsyncAPIView):
+    read_from_replica = True
+    view_class = UserFollowView
+    http_method_names = ["get", "post", "delete"]
+
+    async def get(self, view: Any, *args: Any, **kwargs: Any) -> Response:
+        user = await sync_to_async(view.get_object)()
+        data = await self.serialize(view, user)
+        return Response(data, status=status.HTTP_200_OK)
+
+    async def post(self, view: Any, *args: Any, **kwargs: Any) -> Response:
+        user = view.request.user
+        follow = await sync_to_async(view.get_object)()
+        serializer = CreateFollowingSerializer(
+            data={"follower": user.lookup_id, "followed": follow.lookup_id}
+        )
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await sync_to_async(serializer.save)()
+        data = await self.serialize(view, follow)
+        return Response(data, status=status.HTTP_200_OK)
+
+    async def delete(self, view: Any, *args: Any, **kwargs: Any) -> Response:
+        user = view.request.user
+        follow = await sync_to_async(view.get_object)()
+        await sync_to_async(
+            UserFollowing.objects.filter(follower=user, followed=follow).delete
+        )()
+        data = await self.serialize(view, follow)
+        return Response(data, status=status.HTTP_200_OK)
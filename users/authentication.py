@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from core.metrics import record_cache
+
+User = get_user_model()
+
+
+class UserCache:
+    """
+    Bounded, per-process LRU of user rows keyed by the token user id. Entries
+    expire after ``ttl`` seconds so changes made by other processes are
+    picked up quickly; saves in this process evict the entry immediately.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: Any) -> Optional[Tuple]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return values  # type: ignore[no-any-return]
+
+    def set(self, key: Any, values: Tuple) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, values)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key: Any) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+user_cache = UserCache(
+    settings.JWT_USER_CACHE_SIZE, settings.JWT_USER_CACHE_TTL
+)
+FIELD_NAMES = [field.attname for field in User._meta.concrete_fields]
+
+
+class CachedJWTAuthentication(JWTAuthentication):  # type: ignore[misc]
+    """
+    JWTAuthentication that builds the user from the user cache, only loading
+    the row from the database on a miss
+    """
+
+    def get_user(self, validated_token: Any) -> Any:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            )
+
+        values = user_cache.get(user_id)
+        record_cache("jwt_user", values is not None)
+        if values is None:
+            try:
+                user = User.objects.get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except User.DoesNotExist:
+                raise AuthenticationFailed(
+                    _("User not found"), code="user_not_found"
+                )
+            user_cache.set(
+                user_id, tuple(getattr(user, name) for name in FIELD_NAMES)
+            )
+        else:
+            user = User.from_db(router.db_for_read(User), FIELD_NAMES, values)
+
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+        return user
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(instance: Any, **kwargs: Any) -> None:
+    user_cache.invalidate(getattr(instance, api_settings.USER_ID_FIELD))
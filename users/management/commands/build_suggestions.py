@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from users.suggestions import rebuild_suggestions
+
+
+class Command(BaseCommand):
+    help = "Rebuild the who to follow suggestions from the follow graph"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=20,
+            help="number of suggestions stored per user",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="number of users scored per matrix product",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        written = rebuild_suggestions(
+            top_k=options["top_k"], chunk_size=options["chunk_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored {written} user suggestions")
+        )
@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from users.tokens import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted tokens in batches"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="number of tokens deleted per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        outstanding, blacklisted = prune_expired_tokens(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {outstanding} outstanding and "
+                f"{blacklisted} blacklisted tokens"
+            )
+        )
@@ -0,0 +1,39 @@
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from users.outbox import drain
+
+
+class Command(BaseCommand):
+    help = "Send the emails queued in the outbox"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            help="number of emails sent over one connection",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="keep polling the outbox instead of exiting once drained",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="seconds to sleep between polls in --loop mode",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            sent, failed = drain(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(f"Sent {sent} emails, {failed} failed")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
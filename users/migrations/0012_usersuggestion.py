@@ -0,0 +1,58 @@
+# Generated by Django 4.0.5 on 2026-10-19 16:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0011_userfollowing_userfollowing_unique_following"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveSmallIntegerField()),
+                (
+                    "suggested",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suggestions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["user", "rank"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="usersuggestion",
+            constraint=models.UniqueConstraint(
+                fields=("user", "rank"), name="unique_suggestion_rank"
+            ),
+        ),
+    ]
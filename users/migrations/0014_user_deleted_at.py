@@ -0,0 +1,20 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0013_outboxemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, db_index=True, editable=False, null=True
+            ),
+        ),
+    ]
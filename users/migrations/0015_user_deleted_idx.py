@@ -0,0 +1,26 @@
+# Generated by Django 4.0.5 on 2026-10-19 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0014_user_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="user_deleted_idx",
+            ),
+        ),
+    ]
@@ -10,11 +10,22 @@ from django.contrib.auth.models import (
 from django.db import models
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
-from users.abstracts import TimeStampedModel
+from users.abstracts import SoftDeleteModel, TimeStampedModel, deleted_index
 
 
 class UserManager(BaseUserManager):
+    def __init__(self, include_deleted: bool = False) -> None:
+        super().__init__()
+        self.include_deleted = include_deleted
+
+    def get_queryset(self) -> Any:
+        queryset = super().get_queryset()
+        if self.include_deleted:
+            return queryset
+        return queryset.filter(deleted_at__isnull=True)
+
     def create_user(self, email: str, password: str, **kwargs: Any) -> Any:
         if not email:
             raise ValueError("Email is required")
@@ -42,7 +53,9 @@ class UserManager(BaseUserManager):
         return user
 
 
-class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
+class User(
+    AbstractBaseUser, PermissionsMixin, TimeStampedModel, SoftDeleteModel
+):
     username = models.CharField(max_length=255, unique=True)
     lookup_id = models.CharField(max_length=255, unique=True, editable=False)
     email = models.CharField(
@@ -56,6 +69,10 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
     is_verified = models.BooleanField(default=False)
 
     objects = UserManager()
+    all_objects = UserManager(include_deleted=True)
+
+    class Meta:
+        indexes = [deleted_index("user_deleted_idx")]
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
@@ -63,6 +80,26 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampedModel):
     def __str__(self) -> str:
         return self.email
 
+    def soft_delete(self) -> None:
+        """
+        Deactivates the account and frees its email and username right
+        away, the rows referencing it are left to purge_deleted
+        """
+        self.deleted_at = timezone.now()
+        self.is_active = False
+        self.username = f"deleted-{self.lookup_id}"
+        self.email = f"deleted-{self.lookup_id}@deleted.invalid"
+        self.set_unusable_password()
+        self.save(
+            update_fields=[
+                "deleted_at",
+                "is_active",
+                "username",
+                "email",
+                "password",
+            ]
+        )
+
 
 @receiver(pre_save, sender=User)
 def uuid_to_hex(instance: Any, **kwargs: Any) -> Any:
@@ -106,3 +143,61 @@ class UserFollowing(TimeStampedModel):
 
     def __str__(self) -> str:
         return f"{self.follower} is following {self.followed}"
+
+
+class UserSuggestion(TimeStampedModel):
+    """precomputed "who to follow" candidates, rebuilt by build_suggestions"""
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "rank"],
+                name="unique_suggestion_rank",
+            )
+        ]
+        ordering = ["user", "rank"]
+
+    user = models.ForeignKey(
+        "User", related_name="suggestions", on_delete=models.CASCADE
+    )
+    suggested = models.ForeignKey(
+        "User", related_name="+", on_delete=models.CASCADE
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    def __str__(self) -> str:
+        return f"{self.suggested} suggested to {self.user}"
+
+
+class OutboxEmail(TimeStampedModel):
+    """emails queued in the request transaction and sent by send_outbox"""
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        SENT = "sent"
+        FAILED = "failed"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="outbox_pending_idx",
+            )
+        ]
+        ordering = ["created_at"]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255, blank=True, null=True)
+    recipient = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self) -> str:
+        return f"{self.subject} to {self.recipient} ({self.status})"
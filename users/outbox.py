@@ -0,0 +1,104 @@
+from datetime import timedelta
+from typing import Any, List, Tuple
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from users.models import OutboxEmail
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponential backoff before the next attempt, capped at one hour
+    """
+    delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, 3600))
+
+
+def _record_failure(email: OutboxEmail, error: Exception, now: Any) -> None:
+    email.attempts += 1
+    email.last_error = repr(error)
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboxEmail.Status.FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+
+
+def send_batch(batch_size: int = 0) -> Tuple[int, int]:
+    """
+    Claims a batch of due emails, skipping rows locked by other workers, and
+    sends them over a single connection. Returns the number of emails sent
+    and the number that failed.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+    with transaction.atomic():
+        batch: List[OutboxEmail] = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=OutboxEmail.Status.PENDING, next_attempt_at__lte=now
+            )
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        if not batch:
+            return 0, 0
+
+        sent = failed = 0
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as error:
+            for email in batch:
+                _record_failure(email, error, now)
+            failed = len(batch)
+        else:
+            try:
+                for email in batch:
+                    message = EmailMessage(
+                        email.subject,
+                        email.body,
+                        email.from_email,
+                        [email.recipient],
+                        connection=connection,
+                    )
+                    try:
+                        message.send()
+                    except Exception as error:
+                        _record_failure(email, error, now)
+                        failed += 1
+                    else:
+                        email.status = OutboxEmail.Status.SENT
+                        email.sent_at = timezone.now()
+                        sent += 1
+            finally:
+                connection.close()
+
+        for email in batch:
+            email.updated_at = timezone.now()
+        OutboxEmail.objects.bulk_update(
+            batch,
+            [
+                "status",
+                "attempts",
+                "next_attempt_at",
+                "last_error",
+                "sent_at",
+                "updated_at",
+            ],
+        )
+    return sent, failed
+
+
+def drain(batch_size: int = 0) -> Tuple[int, int]:
+    """
+    Sends batches until no email is due
+    """
+    total_sent = total_failed = 0
+    while True:
+        sent, failed = send_batch(batch_size)
+        if not sent and not failed:
+            return total_sent, total_failed
+        total_sent += sent
+        total_failed += failed
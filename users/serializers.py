@@ -1,6 +1,7 @@
 from typing import Any
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils.encoding import smart_str
 from django.utils.http import urlsafe_base64_decode
 from rest_framework import serializers
@@ -11,11 +12,11 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from users.utils import (
     create_email_data,
     generate_token,
-    send_email,
+    queue_email,
     verify_token,
 )
 
-from .models import Profile, UserFollowing
+from .models import Profile, UserFollowing, UserSuggestion
 from .validators import (
     validate_password_digit,
     validate_password_lowercase,
@@ -80,6 +81,7 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ("lookup_id", "username", "email", "password", "is_editor")
 
+    @transaction.atomic
     def create(self, validated_data: Any) -> Any:
         user = User.objects.create_user(**validated_data)
         user.save()
@@ -89,7 +91,7 @@ class UserSerializer(serializers.ModelSerializer):
         email_data = create_email_data(
             request, user, token_data, "verify-email", "Verify your email"  # type: ignore[arg-type]
         )
-        send_email("verify_email.html", email_data)
+        queue_email("verify_email.html", email_data)
         return user
 
     def to_representation(self, instance: Any) -> Any:
@@ -98,13 +100,16 @@ class UserSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         representation = super().to_representation(instance)
         if request.user.is_authenticated:  # type: ignore[union-attr]
-            if (
-                request.user.following.all()  # type: ignore[union-attr]
-                .filter(followed=instance)
-                .exists()
-            ):
-                return {**representation, "following": True}
-            return {**representation, "following": False}
+            # nested and listed serializers share the root's context, so
+            # the followed ids are loaded once per response
+            following = self.context.get("following_ids")
+            if following is None:
+                following = self.context["following_ids"] = set(
+                    request.user.following.values_list(  # type: ignore[union-attr]
+                        "followed_id", flat=True
+                    )
+                )
+            return {**representation, "following": instance.pk in following}
         return representation
 
 
@@ -151,6 +156,14 @@ class CreateFollowingSerializer(serializers.ModelSerializer):
         return super().validate(attrs)
 
 
+class BulkFollowSerializer(serializers.Serializer):
+    lookup_ids = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        allow_empty=False,
+        max_length=100,
+    )
+
+
 class UserFollowingSerializer(serializers.ModelSerializer):
     following = serializers.SerializerMethodField()
     followers = serializers.SerializerMethodField()
@@ -161,10 +174,20 @@ class UserFollowingSerializer(serializers.ModelSerializer):
         fields = ["lookup_id", "username", "following", "followers"]
 
     def get_following(self, obj: Any) -> Any:
-        return FollowedSerializer(obj.following.all(), many=True).data
+        return FollowedSerializer(
+            obj.following.filter(
+                followed__deleted_at__isnull=True
+            ).select_related("followed"),
+            many=True,
+        ).data
 
     def get_followers(self, obj: Any) -> Any:
-        return FollowersSerializer(obj.followers.all(), many=True).data
+        return FollowersSerializer(
+            obj.followers.filter(
+                follower__deleted_at__isnull=True
+            ).select_related("follower"),
+            many=True,
+        ).data
 
 
 class FollowedSerializer(serializers.ModelSerializer):
@@ -185,6 +208,15 @@ class FollowersSerializer(serializers.ModelSerializer):
         fields = ["lookup_id", "username", "created_at"]
 
 
+class UserSuggestionSerializer(serializers.ModelSerializer):
+    username = serializers.ReadOnlyField(source="suggested.username")
+    lookup_id = serializers.ReadOnlyField(source="suggested.lookup_id")
+
+    class Meta:
+        model = UserSuggestion
+        fields = ["lookup_id", "username", "score"]
+
+
 class PasswordResetRequestSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
 
@@ -199,7 +231,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
             email_data = create_email_data(
                 request, user, token_data, "reset-password", "Password Reset"  # type: ignore[arg-type]
             )
-            send_email("reset_password.html", email_data)
+            queue_email("reset_password.html", email_data)
 
         return super().validate(attrs)
 
@@ -0,0 +1,152 @@
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from scipy import sparse
+
+from users.models import UserFollowing, UserSuggestion
+
+User = get_user_model()
+
+FOLLOW_WEIGHT = 1.0
+LIKE_WEIGHT = 0.5
+
+
+def _index(ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Maps database ids to their position in the sorted ``ids`` array
+    """
+    return np.searchsorted(ids, values).astype(np.int32)
+
+
+def _edges(queryset: Any, fields: Tuple[str, str]) -> np.ndarray:
+    rows = np.fromiter(
+        (
+            value
+            for row in queryset.values_list(*fields).iterator()
+            for value in row
+        ),
+        dtype=np.int64,
+    )
+    return rows.reshape(-1, 2)
+
+
+def load_graph() -> Dict[str, Any]:
+    """
+    Loads the follow graph and the likes table into integer-indexed sparse
+    adjacency matrices, rows and columns being positions in ``user_ids``
+    """
+    Article = apps.get_model("articles", "Article")
+    user_ids = np.fromiter(
+        User.objects.filter(is_active=True)
+        .order_by("id")
+        .values_list("id", flat=True)
+        .iterator(),
+        dtype=np.int64,
+    )
+    size = len(user_ids)
+
+    follows = _edges(
+        UserFollowing.objects.filter(
+            follower__in=User.objects.filter(is_active=True),
+            followed__in=User.objects.filter(is_active=True),
+        ),
+        ("follower_id", "followed_id"),
+    )
+    following = sparse.csr_matrix(
+        (
+            np.ones(len(follows), dtype=np.float32),
+            (_index(user_ids, follows[:, 0]), _index(user_ids, follows[:, 1])),
+        ),
+        shape=(size, size),
+    )
+
+    likes = _edges(
+        Article.likes.through.objects.filter(
+            user__in=User.objects.filter(is_active=True)
+        ),
+        ("user_id", "article_id"),
+    )
+    article_ids, article_index = np.unique(likes[:, 1], return_inverse=True)
+    liked = sparse.csr_matrix(
+        (
+            np.ones(len(likes), dtype=np.float32),
+            (_index(user_ids, likes[:, 0]), article_index.astype(np.int32)),
+        ),
+        shape=(size, len(article_ids)),
+    )
+    return {"user_ids": user_ids, "following": following, "liked": liked}
+
+
+def compute_suggestions(
+    graph: Dict[str, Any], top_k: int = 20, chunk_size: int = 1000
+) -> Iterator[Tuple[int, List[Tuple[int, float]]]]:
+    """
+    Yields ``(user_id, [(suggested_id, score), ...])`` for every user with
+    candidates, scoring friends-of-friends and co-likers with sparse matrix
+    products computed a block of rows at a time
+    """
+    user_ids = graph["user_ids"]
+    following = graph["following"]
+    liked = graph["liked"]
+    liked_by = liked.T.tocsr()
+
+    for start in range(0, len(user_ids), chunk_size):
+        stop = min(start + chunk_size, len(user_ids))
+        scores = FOLLOW_WEIGHT * (following[start:stop] @ following)
+        scores = scores + LIKE_WEIGHT * (liked[start:stop] @ liked_by)
+        # users never get suggested themselves or someone they follow
+        excluded = following[start:stop] + sparse.eye(
+            stop - start, len(user_ids), k=start, format="csr"
+        )
+        scores = sparse.csr_matrix(scores - scores.multiply(excluded > 0))
+        scores.eliminate_zeros()
+
+        for row in range(stop - start):
+            begin, end = scores.indptr[row], scores.indptr[row + 1]
+            if begin == end:
+                continue
+            data = scores.data[begin:end]
+            columns = scores.indices[begin:end]
+            if len(data) > top_k:
+                best = np.argpartition(-data, top_k)[:top_k]
+                data, columns = data[best], columns[best]
+            order = np.lexsort((user_ids[columns], -data))
+            yield int(user_ids[start + row]), [
+                (int(user_ids[columns[i]]), float(data[i])) for i in order
+            ]
+
+
+def rebuild_suggestions(
+    top_k: int = 20, chunk_size: int = 1000, batch_size: int = 5000
+) -> int:
+    """
+    Recomputes the suggestions table from scratch, returning the number of
+    rows written
+    """
+    graph = load_graph()
+    written = 0
+    with transaction.atomic():
+        UserSuggestion.objects.all().delete()
+        batch: List[UserSuggestion] = []
+        for user_id, candidates in compute_suggestions(
+            graph, top_k=top_k, chunk_size=chunk_size
+        ):
+            batch.extend(
+                UserSuggestion(
+                    user_id=user_id,
+                    suggested_id=suggested_id,
+                    score=score,
+                    rank=rank,
+                )
+                for rank, (suggested_id, score) in enumerate(candidates)
+            )
+            if len(batch) >= batch_size:
+                UserSuggestion.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        UserSuggestion.objects.bulk_create(batch)
+        written += len(batch)
+    return written
@@ -26,3 +26,22 @@ test_user_2 = {
     "password": fake.password(),
     "email": fake.email(),
 }
+
+
+def bulk_users(count: int) -> list:
+    """
+    Creates ``count`` users in one query, without passwords or profiles
+    """
+    from uuid import uuid4
+
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    return User.objects.bulk_create(  # type: ignore[no-any-return]
+        User(
+            username=f"user-{uuid4().hex}",
+            email=f"{uuid4().hex}@example.com",
+            lookup_id=uuid4().hex,
+        )
+        for _ in range(count)
+    )
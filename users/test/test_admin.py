@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from users.models import Profile, UserFollowing
+
+User = get_user_model()
+
+
+class TestUserFollowingAdmin(TestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            email="admin@example.com", password="password", username="admin"
+        )
+        self.client.force_login(self.admin)
+
+    def add_follows(self, count: int) -> None:
+        start = UserFollowing.objects.count()
+        for index in range(start, start + count):
+            follower = User.objects.create_user(
+                email=f"follower-{index}@example.com",
+                password="password",
+                username=f"follower-{index}",
+            )
+            Profile.objects.create(user=follower)
+            UserFollowing.objects.create(
+                follower=follower, followed=self.admin
+            )
+
+    def changelist_queries(self, name: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(name))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelist_joins_users(self) -> None:
+        name = "admin:users_userfollowing_changelist"
+        self.add_follows(1)
+        few = self.changelist_queries(name)
+        self.add_follows(10)
+        self.assertEqual(self.changelist_queries(name), few)
+
+    def test_profile_changelist_joins_users(self) -> None:
+        name = "admin:users_profile_changelist"
+        self.add_follows(1)
+        few = self.changelist_queries(name)
+        self.add_follows(10)
+        self.assertEqual(self.changelist_queries(name), few)
@@ -0,0 +1,82 @@
+from typing import Any
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from users.authentication import UserCache, user_cache
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestCachedJWTAuthentication(APITestCase):
+    user: Any
+
+    def setUp(self) -> None:
+        user_cache.clear()
+        self.password = fake.password()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=self.password,
+        )
+        response = self.client.post(
+            reverse("login"),
+            data={"email": self.user.email, "password": self.password},
+            format="json",
+        )
+        self.client.credentials(  # type: ignore[attr-defined]
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"  # type: ignore[attr-defined]
+        )
+        self.url = reverse("user-suggestions")
+
+    def test_user_is_loaded_once(self) -> None:
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cached_user_matches_database(self) -> None:
+        self.client.get(self.url)
+        response = self.client.get(
+            reverse("user-detail", kwargs={"lookup_id": self.user.lookup_id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], self.user.email)  # type: ignore[attr-defined]
+
+    def test_deactivated_user_is_rejected(self) -> None:
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_user_is_rejected(self) -> None:
+        self.client.get(self.url)
+        self.user.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TestUserCache(APITestCase):
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = UserCache(max_size=2, ttl=60)
+        cache.set(1, ("one",))
+        cache.set(2, ("two",))
+        cache.get(1)
+        cache.set(3, ("three",))
+        self.assertEqual(cache.get(1), ("one",))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), ("three",))
+
+    def test_entries_expire(self) -> None:
+        cache = UserCache(max_size=2, ttl=30)
+        with patch("users.authentication.time.monotonic", return_value=0):
+            cache.set(1, ("one",))
+        with patch("users.authentication.time.monotonic", return_value=31):
+            self.assertIsNone(cache.get(1))
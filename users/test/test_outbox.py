@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from faker import Faker
+
+from users.models import OutboxEmail
+from users.outbox import retry_delay, send_batch
+
+fake = Faker()
+
+
+def queued_email(**kwargs: object) -> OutboxEmail:
+    return OutboxEmail.objects.create(  # type: ignore[no-any-return]
+        subject=fake.sentence(),
+        body=fake.text(),
+        recipient=fake.email(),
+        **kwargs,
+    )
+
+
+class TestOutbox(TestCase):
+    def test_send_batch_sends_due_emails(self) -> None:
+        email = queued_email()
+        queued_email(next_attempt_at=timezone.now() + retry_delay(1))
+        self.assertEqual(send_batch(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [email.recipient])
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.Status.SENT)
+        self.assertIsNotNone(email.sent_at)
+
+    def test_send_batch_reuses_one_connection(self) -> None:
+        for _ in range(3):
+            queued_email()
+        with patch(
+            "users.outbox.get_connection", wraps=mail.get_connection
+        ) as get_connection:
+            self.assertEqual(send_batch(), (3, 0))
+        self.assertEqual(get_connection.call_count, 1)
+
+    def test_failed_send_is_retried_with_backoff(self) -> None:
+        email = queued_email()
+        with patch(
+            "django.core.mail.EmailMessage.send",
+            side_effect=ConnectionError("smtp down"),
+        ):
+            self.assertEqual(send_batch(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("smtp down", email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        self.assertEqual(send_batch(), (0, 0))
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=1)
+    def test_email_fails_after_max_attempts(self) -> None:
+        email = queued_email()
+        with patch(
+            "django.core.mail.EmailMessage.send",
+            side_effect=ConnectionError("smtp down"),
+        ):
+            send_batch()
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboxEmail.Status.FAILED)
+
+    def test_retry_delay_grows_exponentially(self) -> None:
+        self.assertEqual(retry_delay(2), 2 * retry_delay(1))
+        self.assertEqual(retry_delay(20).total_seconds(), 3600)
+
+    def test_send_outbox_command_drains_the_outbox(self) -> None:
+        for _ in range(3):
+            queued_email()
+        call_command("send_outbox", "--batch-size", "2")
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(
+            OutboxEmail.objects.filter(
+                status=OutboxEmail.Status.PENDING
+            ).exists()
+        )
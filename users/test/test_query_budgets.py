@@ -0,0 +1,129 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth import get_user_model
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from core.querybudget import QueryBudgetMixin
+from users.models import Profile, UserFollowing, UserSuggestion
+from users.test.mocks import bulk_users
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestUserQueryBudgets(QueryBudgetMixin, APITestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        Profile.objects.create(user=self.user)
+        self.client.force_authenticate(self.user)
+
+    def connect(self, user: Any, count: int) -> None:
+        """
+        Makes ``user`` follow and be followed by ``count`` new users, half
+        of which the test user follows too
+        """
+        others = bulk_users(count)
+        UserFollowing.objects.bulk_create(
+            [UserFollowing(follower=user, followed=other) for other in others]
+            + [
+                UserFollowing(follower=other, followed=user)
+                for other in others
+            ]
+            + [
+                UserFollowing(follower=self.user, followed=other)
+                for other in others[::2]
+            ]
+        )
+
+    def get(self, name: str, **kwargs: Any) -> None:
+        response = self.client.get(reverse(name, kwargs=kwargs))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_follow(self) -> None:
+        (other,) = bulk_users(1)
+        self.connect(other, 1)
+        for name in ("user-follow", "user-follow-async"):
+            self.assertFlatQueries(
+                name,
+                lambda: self.get(name, lookup_id=other.lookup_id),
+                lambda: self.connect(other, 50),
+            )
+
+    def test_user_list(self) -> None:
+        self.connect(*bulk_users(1), 1)
+        self.assertFlatQueries(
+            "users",
+            lambda: self.get("users"),
+            lambda: self.connect(*bulk_users(1), 50),
+        )
+
+    def test_user_detail_and_profile(self) -> None:
+        with self.assertQueryBudget("user-detail"):
+            self.get("user-detail", lookup_id=self.user.lookup_id)
+        with self.assertQueryBudget("profile"):
+            self.get("profile", lookup_id=self.user.lookup_id)
+
+    def test_user_suggestions(self) -> None:
+        def suggest(count: int) -> None:
+            UserSuggestion.objects.filter(user=self.user).delete()
+            UserSuggestion.objects.bulk_create(
+                UserSuggestion(
+                    user=self.user, suggested=other, score=1, rank=rank
+                )
+                for rank, other in enumerate(bulk_users(count))
+            )
+
+        suggest(1)
+        self.assertFlatQueries(
+            "user-suggestions",
+            lambda: self.get("user-suggestions"),
+            lambda: suggest(50),
+        )
+
+    def test_user_follow_bulk(self) -> None:
+        lookup_ids = [user.lookup_id for user in bulk_users(1)]
+
+        def follow() -> None:
+            response = self.client.post(
+                reverse("user-follow-bulk"),
+                {"lookup_ids": lookup_ids},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertFlatQueries(
+            "user-follow-bulk",
+            follow,
+            lambda: lookup_ids.extend(
+                user.lookup_id for user in bulk_users(49)
+            ),
+        )
+
+
+@pytest.mark.query_budget
+class TestAuthQueryBudgets(APITestCase):
+    def test_login_and_refresh(self) -> None:
+        password = fake.password()
+        user = User.objects.create_user(
+            username=fake.user_name(), email=fake.email(), password=password
+        )
+        response = self.client.post(
+            reverse("login"),
+            {"email": user.email, "password": password},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(
+            reverse("refresh"),
+            {"refresh": response.json()["refresh"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
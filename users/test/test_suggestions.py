@@ -0,0 +1,87 @@
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from articles.models import Article
+from users.models import UserFollowing, UserSuggestion
+from users.suggestions import compute_suggestions, load_graph
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestSuggestions(APITestCase):
+    password: str
+    users: Any
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.password = fake.password()
+        cls.users = [
+            User.objects.create_user(
+                username=fake.user_name() + str(index),
+                email=fake.email(),
+                password=cls.password,
+            )
+            for index in range(5)
+        ]
+        one, two, three, four, five = cls.users
+        UserFollowing.objects.create(follower=one, followed=two)
+        UserFollowing.objects.create(follower=two, followed=three)
+        UserFollowing.objects.create(follower=two, followed=one)
+        article = Article.objects.create(
+            title=fake.name(), body=fake.text(), author=four
+        )
+        article.likes.add(one, five)
+
+    def test_friends_of_friends_and_co_likers_are_suggested(self) -> None:
+        one, two, three, four, five = self.users
+        suggestions = dict(compute_suggestions(load_graph()))
+        self.assertEqual(
+            [user_id for user_id, _ in suggestions[one.id]],
+            [three.id, five.id],
+        )
+        self.assertEqual(suggestions[five.id], [(one.id, 0.5)])
+        self.assertNotIn(four.id, suggestions)
+
+    def test_suggestions_exclude_self_and_followed(self) -> None:
+        one, two, *_ = self.users
+        suggestions = dict(compute_suggestions(load_graph()))
+        suggested = [user_id for user_id, _ in suggestions.get(two.id, [])]
+        self.assertNotIn(two.id, suggested)
+        self.assertNotIn(one.id, suggested)
+
+    def test_top_k_limits_candidates(self) -> None:
+        one = self.users[0]
+        suggestions = dict(compute_suggestions(load_graph(), top_k=1))
+        self.assertEqual(len(suggestions[one.id]), 1)
+
+    def test_suggestions_endpoint(self) -> None:
+        one, two, three, four, five = self.users
+        call_command("build_suggestions", "--chunk-size", "2")
+        self.assertEqual(UserSuggestion.objects.filter(user=one).count(), 2)
+        response = self.client.post(
+            reverse("login"),
+            data={"email": one.email, "password": self.password},
+            format="json",
+        )
+        self.client.credentials(  # type: ignore[attr-defined]
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"  # type: ignore[attr-defined]
+        )
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("user-suggestions"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["lookup_id"] for item in response.data],  # type: ignore[attr-defined]
+            [three.lookup_id, five.lookup_id],
+        )
+
+    def test_suggestions_require_authentication(self) -> None:
+        response = self.client.get(reverse("user-suggestions"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from io import StringIO
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from faker import Faker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+fake = Faker()
+User = get_user_model()
+
+
+class TestBlacklist(APITestCase):
+    user: Any
+
+    def setUp(self) -> None:
+        self.password = fake.password()
+        self.user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=self.password,
+        )
+
+    def test_rotated_refresh_token_is_rejected(self) -> None:
+        response = self.client.post(
+            reverse("login"),
+            data={"email": self.user.email, "password": self.password},
+            format="json",
+        )
+        refresh = response.data["refresh"]  # type: ignore[attr-defined]
+        response = self.client.post(
+            reverse("refresh"), data={"refresh": refresh}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(
+            reverse("refresh"), data={"refresh": refresh}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_blacklisted_elsewhere_is_rejected_right_away(
+        self,
+    ) -> None:
+        token = RefreshToken.for_user(self.user)
+        token.check_blacklist()
+        # as another process would, without going through this token
+        BlacklistedToken.objects.create(
+            token=OutstandingToken.objects.get(jti=token["jti"])
+        )
+        with self.assertRaises(TokenError):
+            token.check_blacklist()
+
+
+class TestPruneTokens(APITestCase):
+    def test_expired_tokens_are_deleted_in_batches(self) -> None:
+        user = User.objects.create_user(
+            username=fake.user_name(),
+            email=fake.email(),
+            password=fake.password(),
+        )
+        for index in range(5):
+            token = OutstandingToken.objects.create(
+                user=user,
+                jti=f"expired-{index}",
+                token="token",
+                expires_at=aware_utcnow() - timedelta(days=1),
+            )
+            BlacklistedToken.objects.create(token=token)
+        RefreshToken.for_user(user)
+        out = StringIO()
+        call_command("prune_tokens", "--batch-size", "2", stdout=out)
+        self.assertIn(
+            "Deleted 5 outstanding and 5 blacklisted", out.getvalue()
+        )
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
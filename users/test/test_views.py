@@ -2,9 +2,11 @@ import json
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.core import mail
+from django.core.management import call_command
 from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
 from django.utils.encoding import smart_bytes
 from django.utils.http import urlsafe_base64_encode
@@ -14,13 +16,15 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient, APITestCase
 
-from users.models import Profile
+from users.models import OutboxEmail, Profile, UserFollowing
 
 from .mocks import test_image, test_user, test_user_2
 
 fake = Faker()
 User = get_user_model()
 
+pytestmark = pytest.mark.query_budget
+
 
 class TestUserList(APITestCase):
     user: Any
@@ -53,6 +57,11 @@ class TestUserList(APITestCase):
         outbox = len(mail.outbox)
         response = self.client.post(url, data=data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), outbox)
+        self.assertTrue(
+            OutboxEmail.objects.filter(recipient=data["email"]).exists()
+        )
+        call_command("send_outbox")
         self.assertEqual(len(mail.outbox), outbox + 1)
 
     def test_user_login(self) -> None:
@@ -389,3 +398,91 @@ class PaswwordResetTest(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("failed to reset password", response.data["detail"])  # type: ignore[attr-defined]
+
+
+class TestBulkFollowView(APITestCase):
+    def setUp(self) -> None:
+        self.password = fake.password()
+        self.user = User.objects.create_user(
+            username=fake.name(), email=fake.email(), password=self.password
+        )
+        self.others = [
+            User.objects.create_user(
+                username=fake.name(),
+                email=fake.email(),
+                password=self.password,
+            )
+            for _ in range(3)
+        ]
+        self.client = APIClient()
+        response = self.client.post(
+            reverse("login"),
+            data={"email": self.user.email, "password": self.password},
+            format="json",
+        )
+        self.client.credentials(  # type: ignore[attr-defined]
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"  # type: ignore[attr-defined]
+        )
+        self.url = reverse("user-follow-bulk")
+
+    def test_bulk_follow(self) -> None:
+        UserFollowing.objects.create(
+            follower=self.user, followed=self.others[0]
+        )
+        lookup_ids = [
+            *(other.lookup_id for other in self.others),
+            self.user.lookup_id,
+            "missing",
+        ]
+        response = self.client.post(
+            self.url, data={"lookup_ids": lookup_ids}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["counts"],  # type: ignore[attr-defined]
+            {
+                "already_following": 1,
+                "followed": 2,
+                "self": 1,
+                "not_found": 1,
+            },
+        )
+        self.assertEqual(
+            [item["status"] for item in response.data["results"]],  # type: ignore[attr-defined]
+            ["already_following", "followed", "followed", "self", "not_found"],
+        )
+        self.assertEqual(self.user.following.count(), 3)
+
+    def test_bulk_follow_query_count_is_flat(self) -> None:
+        lookup_ids = [other.lookup_id for other in self.others]
+        with self.assertNumQueries(4):
+            self.client.post(
+                self.url, data={"lookup_ids": lookup_ids}, format="json"
+            )
+
+    def test_bulk_unfollow(self) -> None:
+        UserFollowing.objects.create(
+            follower=self.user, followed=self.others[0]
+        )
+        response = self.client.delete(
+            self.url,
+            data={
+                "lookup_ids": [
+                    self.others[0].lookup_id,
+                    self.others[1].lookup_id,
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["counts"],  # type: ignore[attr-defined]
+            {"unfollowed": 1, "not_following": 1},
+        )
+        self.assertFalse(self.user.following.exists())
+
+    def test_bulk_follow_requires_lookup_ids(self) -> None:
+        response = self.client.post(
+            self.url, data={"lookup_ids": []}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
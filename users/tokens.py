@@ -0,0 +1,30 @@
+from typing import Tuple
+
+from django.db import transaction
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+def prune_expired_tokens(batch_size: int = 1000) -> Tuple[int, int]:
+    """
+    Deletes expired outstanding tokens and their blacklist entries in short
+    transactions of at most ``batch_size`` tokens. Returns the number of
+    outstanding and blacklisted tokens deleted.
+    """
+    now = aware_utcnow()
+    outstanding = blacklisted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return outstanding, blacklisted
+        with transaction.atomic():
+            _, deleted = OutstandingToken.objects.filter(id__in=ids).delete()
+        outstanding += deleted.get(OutstandingToken._meta.label, 0)
+        blacklisted += deleted.get(BlacklistedToken._meta.label, 0)
@@ -1,13 +1,17 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from users.async_views import AsyncUserFollowView
+
 from .views import (
     PasswordResetAPIView,
     PasswordResetEmailView,
     ProfileView,
+    UserBulkFollowView,
     UserDetail,
     UserFollowView,
     UserList,
+    UserSuggestionView,
     UserTokenObtainPairView,
     VerifyEmail,
 )
@@ -21,6 +25,11 @@ urlpatterns = [
     path("profile/<str:lookup_id>/", ProfileView.as_view(), name="profile"),
     path("refresh/", TokenRefreshView.as_view(), name="refresh"),
     path("users/", UserList.as_view(), name="users"),
+    path(
+        "users/suggestions/",
+        UserSuggestionView.as_view(),
+        name="user-suggestions",
+    ),
     path("user/<str:lookup_id>/", UserDetail.as_view(), name="user-detail"),
     path("auth/refresh/", TokenRefreshView.as_view(), name="refresh"),
     path(
@@ -38,9 +47,19 @@ urlpatterns = [
         VerifyEmail.as_view(),
         name="verify-email",
     ),
+    path(
+        "users/follow/bulk/",
+        UserBulkFollowView.as_view(),
+        name="user-follow-bulk",
+    ),
     path(
         "users/follow/<str:lookup_id>/",
         UserFollowView.as_view(),
         name="user-follow",
     ),
+    path(
+        "async/users/follow/<str:lookup_id>/",
+        AsyncUserFollowView.as_view(),
+        name="user-follow-async",
+    ),
 ]
@@ -3,7 +3,6 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.encoding import smart_bytes, smart_str
@@ -11,6 +10,7 @@ from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework.request import Request
 
 from core.settings import EMAIL_USER
+from users.models import OutboxEmail
 
 User = get_user_model()
 
@@ -47,17 +47,17 @@ def create_email_data(
     }
 
 
-def send_email(template: str, email_data: Any) -> None:
+def queue_email(template: str, email_data: Any) -> OutboxEmail:
     """
-    Sends the email to the user
+    Renders the email and stores it in the outbox, to be sent by the
+    send_outbox worker once the current transaction commits
     """
     email_body = render_to_string(template, {"body": email_data.get("body")})
-    send_mail(
-        email_data.get("subject"),
-        email_body,
-        EMAIL_USER,
-        [email_data.get("recipient")],
-        fail_silently=False,
+    return OutboxEmail.objects.create(
+        subject=email_data.get("subject"),
+        body=email_body,
+        from_email=EMAIL_USER,
+        recipient=email_data.get("recipient"),
     )
 
 
@@ -5,22 +5,23 @@ from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.generics import RetrieveUpdateAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from users.models import UserFollowing
+from users.models import UserFollowing, UserSuggestion
 
 from .models import Profile
 from .permissions import CanRegisterbutcantGetList
 from .serializers import (
+    BulkFollowSerializer,
     CreateFollowingSerializer,
     PasswordResetRequestSerializer,
     PasswordResetSerializer,
     ProfileSerializer,
     UserFollowingSerializer,
     UserSerializer,
+    UserSuggestionSerializer,
     UserTokenObtainPairSerializer,
     VerifyEmailSerializer,
 )
@@ -32,16 +33,15 @@ class UserList(generics.ListCreateAPIView):
     permission_classes = (CanRegisterbutcantGetList,)
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    renderer_classes = (JSONRenderer,)
 
 
 class ProfileView(RetrieveUpdateAPIView):
-
+    read_from_replica = True
     permission_classes = (IsAuthenticated,)
     serializer_class = ProfileSerializer
-    queryset = Profile.objects.all()
+    # deleted users' profiles wait for purge_deleted
+    queryset = Profile.objects.filter(user__deleted_at__isnull=True)
     lookup_field: str = "lookup_id"
-    renderer_classes = (JSONRenderer,)
 
     def get_object(self) -> Any:
         profile = get_object_or_404(
@@ -56,13 +56,15 @@ class UserDetail(generics.RetrieveUpdateDestroyAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     lookup_field: str = "lookup_id"
-    renderer_classes = (JSONRenderer,)
+
+    def perform_destroy(self, instance: Any) -> None:
+        # purge_deleted removes the follows, reactions and profile later
+        instance.soft_delete()
 
 
 class VerifyEmail(generics.GenericAPIView):
     permission_classes = (AllowAny,)
     serializer_class = VerifyEmailSerializer
-    renderer_classes = (JSONRenderer,)
 
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         serializer = self.get_serializer(
@@ -79,13 +81,12 @@ class VerifyEmail(generics.GenericAPIView):
 
 class UserTokenObtainPairView(TokenObtainPairView):  # type: ignore
     serializer_class = UserTokenObtainPairSerializer
-    renderer_classes = (JSONRenderer,)
 
 
 class UserFollowView(generics.GenericAPIView):
+    read_from_replica = True
     permission_classes = (IsAuthenticated,)
     lookup_field: str = "lookup_id"
-    renderer_classes = (JSONRenderer,)
     serializer_class = UserFollowingSerializer
     queryset = User.objects.all()
 
@@ -117,10 +118,110 @@ class UserFollowView(generics.GenericAPIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class UserBulkFollowView(generics.GenericAPIView):
+    """
+    follow (POST) or unfollow (DELETE) a list of users in one request,
+    responding with per-item statuses instead of the follow lists
+    """
+
+    permission_classes = (IsAuthenticated,)
+    serializer_class = BulkFollowSerializer
+
+    def get_targets(self, request: Request) -> Any:
+        """
+        validates the payload and resolves the lookup ids with one query,
+        returning the deduplicated lookup ids and the matching user ids
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        lookup_ids = list(
+            dict.fromkeys(serializer.validated_data["lookup_ids"])
+        )
+        users = dict(
+            User.objects.filter(lookup_id__in=lookup_ids).values_list(
+                "lookup_id", "id"
+            )
+        )
+        return lookup_ids, users
+
+    def get_response(self, lookup_ids: Any, statuses: dict) -> Response:
+        results = [
+            {"lookup_id": lookup_id, "status": statuses[lookup_id]}
+            for lookup_id in lookup_ids
+        ]
+        counts: dict = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return Response(
+            {"counts": counts, "results": results}, status=status.HTTP_200_OK
+        )
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        user = request.user
+        lookup_ids, users = self.get_targets(request)
+        already_following = set(
+            UserFollowing.objects.filter(  # type: ignore[misc]
+                follower=user, followed_id__in=users.values()
+            ).values_list("followed_id", flat=True)
+        )
+        statuses = {}
+        follows = []
+        for lookup_id in lookup_ids:
+            user_id = users.get(lookup_id)
+            if user_id is None:
+                statuses[lookup_id] = "not_found"
+            elif user_id == user.id:  # type: ignore[union-attr]
+                statuses[lookup_id] = "self"
+            elif user_id in already_following:
+                statuses[lookup_id] = "already_following"
+            else:
+                statuses[lookup_id] = "followed"
+                follows.append(
+                    UserFollowing(follower=user, followed_id=user_id)
+                )
+        UserFollowing.objects.bulk_create(follows, ignore_conflicts=True)
+        return self.get_response(lookup_ids, statuses)
+
+    def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        user = request.user
+        lookup_ids, users = self.get_targets(request)
+        connections = UserFollowing.objects.filter(  # type: ignore[misc]
+            follower=user, followed_id__in=users.values()
+        )
+        following = set(connections.values_list("followed_id", flat=True))
+        connections.delete()
+        statuses = {}
+        for lookup_id in lookup_ids:
+            user_id = users.get(lookup_id)
+            if user_id is None:
+                statuses[lookup_id] = "not_found"
+            elif user_id in following:
+                statuses[lookup_id] = "unfollowed"
+            else:
+                statuses[lookup_id] = "not_following"
+        return self.get_response(lookup_ids, statuses)
+
+
+class UserSuggestionView(generics.ListAPIView):
+    """who to follow, read from the table built by build_suggestions"""
+
+    permission_classes = (IsAuthenticated,)
+    serializer_class = UserSuggestionSerializer
+    pagination_class = None
+
+    def get_queryset(self) -> Any:
+        return (
+            UserSuggestion.objects.filter(
+                user=self.request.user, suggested__deleted_at__isnull=True
+            )
+            .select_related("suggested")
+            .order_by("rank")
+        )
+
+
 class PasswordResetEmailView(generics.GenericAPIView):
     serializer_class = PasswordResetRequestSerializer
     permission_classes = (AllowAny,)
-    renderer_classes = (JSONRenderer,)
 
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
 
@@ -137,7 +238,6 @@ class PasswordResetEmailView(generics.GenericAPIView):
 class PasswordResetAPIView(generics.GenericAPIView):
     permission_classes = (AllowAny,)
     serializer_class = PasswordResetSerializer
-    renderer_classes = (JSONRenderer,)
 
     def patch(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         serializer = self.get_serializer(